@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Print a textual summary of an MP4: info, tracks, and iTMF tags.
 
-Uses the pythonic ``MP4File`` API. Pass ``--atoms`` to also print the raw
-atom dump (``MP4Dump`` writes to stdout; it does not return a string).
+Uses the pythonic ``MP4File`` API. Pass ``--atoms`` to also print the box tree
+from ``MP4File.atoms()`` (offsets and sizes read from the atom headers).
 """
 
 from __future__ import annotations
@@ -12,7 +12,15 @@ import sys
 from typing import Optional, Sequence, TextIO
 
 import pymp4v2
-import pymp4v2.raw as raw
+
+
+def print_atoms(atom: pymp4v2.Atom, depth: int, file: TextIO) -> None:
+    for child in atom:
+        print(
+            f"{'  ' * depth}{child.type} offset={child.offset} size={child.size}",
+            file=file,
+        )
+        print_atoms(child, depth + 1, file)
 
 
 def dump(path: str, *, atoms: bool = False, file: TextIO = sys.stdout) -> None:
@@ -23,10 +31,11 @@ def dump(path: str, *, atoms: bool = False, file: TextIO = sys.stdout) -> None:
         print(file=file)
         print("info:", file=file)
         print(mp4.info, file=file)
-        print(f"tracks ({len(mp4.tracks)}):", file=file)
-        for i, track in enumerate(mp4.tracks):
+        tracks = mp4.tracks.snapshot()
+        print(f"tracks ({len(tracks)}):", file=file)
+        for track in tracks:
             print(
-                f"  [{i}] id={track.id} type={track.type} "
+                f"  [{track.index}] id={track.id} type={track.type} codec={track.codec} "
                 f"duration={track.duration} timescale={track.timescale} "
                 f"samples={track.sample_count} "
                 f"bitrate={track.bitrate} fps={track.frame_rate} "
@@ -48,8 +57,8 @@ def dump(path: str, *, atoms: bool = False, file: TextIO = sys.stdout) -> None:
             print(f"  {field}: {getattr(tags, field)!r}", file=file)
         print(f"  artwork: {tags.artwork_count} item(s)", file=file)
         if atoms:
-            with raw.MP4Read(path) as handle:
-                raw.MP4Dump(handle)
+            print("atoms:", file=file)
+            print_atoms(mp4.atoms(), 1, file)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -58,7 +67,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument(
         "--atoms",
         action="store_true",
-        help="also print MP4Dump atom listing to stdout",
+        help="also print the atom tree with offsets and sizes",
     )
     args = parser.parse_args(argv)
     try:
@@ -0,0 +1,66 @@
+#ifndef PYMP4V2_ATOM_TREE_H
+#define PYMP4V2_ATOM_TREE_H
+
+#include <cstdint>
+#include <memory>
+#include <optional>
+#include <string>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+#include "pymp4v2/atoms.h"
+#include "pymp4v2/mp4_file_handle_wrapper.h"
+
+namespace py = pybind11;
+
+namespace raw
+{
+    // One box of a file on disk, read straight from the atom headers rather than through
+    // mp4v2's parsed tree. Children are parsed on first access and cached, so walking a
+    // few levels costs a few header reads. Nodes share one open stream per tree.
+    class MP4Atom
+    {
+    public:
+        // Root node spanning the whole file (empty type, header size 0). Raises MP4Error
+        // if the file cannot be opened.
+        static std::shared_ptr<MP4Atom> open(const std::string &filename);
+
+        // Four-character code; bytes above 0x7f are read as Latin-1 ("©nam").
+        const std::string &type() const;
+        uint64_t offset() const;
+        uint64_t size() const;
+        uint32_t header_size() const;
+        // Boxes whose payload holds child boxes (moov, trak, stbl, stsd, meta, ilst
+        // items, sample entries with child boxes, ...). Other boxes have no children.
+        bool is_container() const;
+
+        // Needs the GIL; the headers are read with it released. Raises MP4Error if the
+        // children do not parse.
+        const std::vector<std::shared_ptr<MP4Atom>> &children();
+        // Dotted path below this node, e.g. "moov.trak[1].mdia.minf.stbl.stsz"; "[i]"
+        // picks the i-th (0-based, negative from the end) child of that type and defaults
+        // to 0. nullptr if there is no such box.
+        std::shared_ptr<MP4Atom> find(const std::string &path);
+
+    private:
+        struct Stream;
+
+        MP4Atom(std::shared_ptr<Stream> stream, atoms::Atom atom, std::optional<uint32_t> childOffset);
+
+        std::shared_ptr<Stream> stream_;
+        atoms::Atom atom_;
+        std::string type_;
+        // Bytes between the header and the first child; unset for leaf boxes.
+        std::optional<uint32_t> child_offset_;
+        std::optional<std::vector<std::shared_ptr<MP4Atom>>> children_;
+    };
+
+    // Root of the atom tree of the file behind hFile (by its filename). Create/modify
+    // handles show the file as last written; moov lands on MP4Close.
+    std::shared_ptr<MP4Atom> MP4AtomTree_wrapper(MP4FileHandleWrapper &hFile);
+
+    void bind_atom_tree(py::module_ &m_raw);
+} // namespace raw
+
+#endif // PYMP4V2_ATOM_TREE_H
@@ -0,0 +1,58 @@
+#ifndef PYMP4V2_ATOMS_H
+#define PYMP4V2_ATOMS_H
+
+#include <cstdint>
+#include <istream>
+#include <optional>
+#include <string>
+#include <vector>
+
+// Minimal ISO BMFF atom walking for the paths that bypass mp4v2 (in-place tag
+// writes, header-only probing). Only atom headers are parsed here.
+namespace atoms
+{
+    struct Atom
+    {
+        uint64_t start = 0;
+        uint64_t size = 0;
+        uint32_t header = 0;
+        std::string type;
+
+        uint64_t end() const
+        {
+            return start + size;
+        }
+
+        uint64_t body() const
+        {
+            return start + header;
+        }
+
+        bool is_free() const
+        {
+            return type == "free" || type == "skip";
+        }
+    };
+
+    uint64_t load_be(const unsigned char *p, int n);
+    void store_be(unsigned char *p, uint64_t value, int n);
+
+    uint64_t file_size(std::istream &in);
+
+    // Child atoms of [begin, end), or nullopt if the layout does not parse.
+    std::optional<std::vector<Atom>> read_atoms(std::istream &in, uint64_t begin, uint64_t end);
+
+    const Atom *find_atom(const std::vector<Atom> &atoms, const char *type);
+
+    // True for the containers between moov and stbl (trak, mdia, minf, stbl).
+    bool leads_to_stbl(const std::string &type);
+
+    // Header for an atom with `bodySize` bytes of payload: 32-bit size, or 64-bit
+    // largesize when it does not fit.
+    std::string make_header(const std::string &type, uint64_t bodySize);
+
+    // Raw bytes of [start, start + size); raises MP4Error on a short read.
+    std::string read_bytes(std::istream &in, uint64_t start, uint64_t size);
+} // namespace atoms
+
+#endif // PYMP4V2_ATOMS_H
@@ -0,0 +1,104 @@
+#ifndef PYMP4V2_BUFFER_H
+#define PYMP4V2_BUFFER_H
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <utility>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+namespace raw
+{
+    // Read-only typed array whose storage is reference counted. Python sees it as a
+    // memoryview; the view keeps the storage alive, so nothing is copied on the way out.
+    template <typename T>
+    class NativeArray
+    {
+    public:
+        NativeArray() = default;
+
+        explicit NativeArray(std::vector<T> values)
+        {
+            auto storage = std::make_shared<std::vector<T>>(std::move(values));
+            data_ = storage->data();
+            size_ = storage->size();
+            owner_ = std::move(storage);
+        }
+
+        NativeArray(std::shared_ptr<const void> owner, const T *data, std::size_t size)
+            : owner_(std::move(owner)), data_(data), size_(size)
+        {
+        }
+
+        const T *data() const
+        {
+            return data_;
+        }
+
+        std::size_t size() const
+        {
+            return size_;
+        }
+
+        const std::shared_ptr<const void> &owner() const
+        {
+            return owner_;
+        }
+
+    private:
+        std::shared_ptr<const void> owner_;
+        const T *data_ = nullptr;
+        std::size_t size_ = 0;
+    };
+
+    using ByteArray = NativeArray<uint8_t>;
+
+    // Take ownership of an MP4Malloc'd buffer; MP4Free runs when the last view is released.
+    ByteArray adopt_mp4_bytes(uint8_t *bytes, uint32_t size);
+
+    // Contiguous bytes of any buffer-protocol object (bytes, bytearray, memoryview, numpy).
+    // Held for the lifetime of the view, so the data may be used with the GIL released;
+    // construct and destroy it with the GIL held.
+    class BufferView
+    {
+    public:
+        BufferView(py::handle obj, bool writable);
+        ~BufferView();
+
+        BufferView(const BufferView &) = delete;
+        BufferView &operator=(const BufferView &) = delete;
+
+        uint8_t *data() const
+        {
+            return static_cast<uint8_t *>(view_.buf);
+        }
+
+        std::size_t size() const
+        {
+            return static_cast<std::size_t>(view_.len);
+        }
+
+    private:
+        Py_buffer view_;
+    };
+
+    // Read-only memoryview over array; the view holds a reference to the storage.
+    template <typename T>
+    py::memoryview to_memoryview(const NativeArray<T> &array)
+    {
+        return py::memoryview(py::cast(array));
+    }
+
+    // Non-negative integers from a 1-D buffer of any integer or bool format (numpy arrays,
+    // array.array, bytes) or, failing that, from any iterable of ints. `what` names the
+    // argument in error messages.
+    std::vector<uint64_t> uint_column(py::handle obj, const char *what);
+
+    void bind_buffers(py::module_ &m_raw);
+} // namespace raw
+
+#endif // PYMP4V2_BUFFER_H
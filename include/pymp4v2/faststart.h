@@ -0,0 +1,24 @@
+#ifndef PYMP4V2_FASTSTART_H
+#define PYMP4V2_FASTSTART_H
+
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <string>
+
+// Called between chunks with (bytes written, total bytes); return false to cancel.
+using FaststartTick = std::function<bool(uint64_t, uint64_t)>;
+
+// Rewrite `src` to `dst` (may be the same path) with moov first: ftyp, moov with its
+// chunk offsets relocated (stco widened to co64 where needed), then every other
+// top-level atom except free/skip in original order, copied sequentially in
+// `chunkSize` pieces. Samples are not re-interleaved.
+//
+// Output goes to `<dst>.pymp4v2-optimize` and is renamed over `dst` at the end; on
+// cancel or error the temp file is removed and `dst` is untouched. Peak memory is
+// `chunkSize` plus about twice the moov size. Returns false if cancelled.
+//
+// Blocking file I/O without the GIL; `tick` must take the GIL itself if it needs it.
+bool faststart(const std::string &src, const std::string &dst, std::size_t chunkSize, const FaststartTick &tick);
+
+#endif // PYMP4V2_FASTSTART_H
@@ -0,0 +1,33 @@
+#ifndef PYMP4V2_FILE_MAPPING_H
+#define PYMP4V2_FILE_MAPPING_H
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+// Read-only memory mapping of a whole file (mmap / CreateFileMapping). Views hand out
+// pointers into it together with a shared_ptr to the mapping, so it stays mapped until
+// the last view is gone. Truncating the file while it is mapped is undefined (SIGBUS).
+class FileMapping
+{
+public:
+    // Raises MP4Error naming the file if it cannot be opened or mapped.
+    explicit FileMapping(const std::string &filename);
+    ~FileMapping();
+
+    FileMapping(const FileMapping &) = delete;
+    FileMapping &operator=(const FileMapping &) = delete;
+
+    const uint8_t *data() const;
+    std::size_t size() const;
+
+private:
+    const uint8_t *data_ = nullptr;
+    std::size_t size_ = 0;
+#ifdef _WIN32
+    void *file_ = nullptr;
+    void *mapping_ = nullptr;
+#endif
+};
+
+#endif // PYMP4V2_FILE_MAPPING_H
@@ -0,0 +1,152 @@
+#ifndef PYMP4V2_IO_SOURCE_H
+#define PYMP4V2_IO_SOURCE_H
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+#include "mp4v2/mp4v2.h"
+#include "pymp4v2/buffer.h"
+
+namespace py = pybind11;
+
+// Bytes handed to mp4v2 through MP4*Callbacks instead of a path. mp4v2 calls back on
+// the thread making the mp4v2 call, normally with the GIL released. Sources are
+// read-only unless they override write_at / truncate.
+class IOSource
+{
+public:
+    virtual ~IOSource() = default;
+
+    IOSource(const IOSource &) = delete;
+    IOSource &operator=(const IOSource &) = delete;
+
+    // MP4ReadCallbacks / MP4CreateCallbacks / MP4ModifyCallbacks over the source, or
+    // nullptr if mp4v2 fails. The source must outlive the handle; only one handle may
+    // be open on it at a time.
+    MP4FileHandle open();
+    MP4FileHandle create();
+    MP4FileHandle modify();
+
+    virtual int64_t size() const = 0;
+
+    // Message of the exception that failed the last callback, empty if none did.
+    const std::string &error() const;
+
+protected:
+    IOSource() = default;
+
+    // Copy [pos, pos + size) into buffer, with 0 <= pos and pos + size <= size();
+    // false on failure (with error_ set).
+    virtual bool read_at(int64_t pos, void *buffer, int64_t size) = 0;
+    // Write [pos, pos + size), growing the source as needed; pos <= size().
+    virtual bool write_at(int64_t pos, const void *buffer, int64_t size);
+    virtual bool truncate(int64_t size);
+
+    std::string error_;
+
+private:
+    static const MP4IOCallbacks *callbacks();
+
+    static int64_t io_size(void *handle);
+    static int io_seek(void *handle, int64_t pos);
+    static int io_read(void *handle, void *buffer, int64_t size, int64_t *nin);
+    static int io_write(void *handle, const void *buffer, int64_t size, int64_t *nout);
+    static int io_truncate(void *handle, int64_t size);
+
+    int64_t pos_ = 0;
+};
+
+// Any buffer-protocol object (bytes, bytearray, memoryview, mmap, numpy). The object is
+// held through a buffer view and read in place, without a copy of the whole blob.
+class BufferSource : public IOSource
+{
+public:
+    // Needs the GIL.
+    explicit BufferSource(py::handle obj);
+    ~BufferSource() override;
+
+    int64_t size() const override;
+
+protected:
+    bool read_at(int64_t pos, void *buffer, int64_t size) override;
+
+private:
+    std::unique_ptr<raw::BufferView> view_;
+};
+
+// Seekable binary file object. Reads go through one window of `readSize` bytes, so
+// mp4v2's many small header reads turn into a few large f.readinto() calls; reads
+// larger than the window go straight into mp4v2's buffer. Callbacks take the GIL.
+class FileObjectSource : public IOSource
+{
+public:
+    // Needs the GIL. Raises MP4Error if the object is not seekable.
+    FileObjectSource(py::object file, std::size_t readSize);
+    ~FileObjectSource() override;
+
+    int64_t size() const override;
+
+protected:
+    bool read_at(int64_t pos, void *buffer, int64_t size) override;
+
+private:
+    // Read up to `size` bytes at `pos` into buffer; returns the count (short only at EOF).
+    int64_t fill(int64_t pos, char *buffer, int64_t size);
+
+    py::object file_;
+    int64_t size_ = 0;
+    int64_t file_pos_ = -1;
+    std::vector<char> window_;
+    int64_t window_start_ = 0;
+    int64_t window_len_ = 0;
+};
+
+// Growable in-memory output for MP4File.create_buffer(); the bytes are handed over with
+// take() once mp4v2 has closed the handle.
+class MemorySink : public IOSource
+{
+public:
+    MemorySink() = default;
+
+    int64_t size() const override;
+    raw::ByteArray take();
+
+protected:
+    bool read_at(int64_t pos, void *buffer, int64_t size) override;
+    bool write_at(int64_t pos, const void *buffer, int64_t size) override;
+    bool truncate(int64_t size) override;
+
+private:
+    std::vector<uint8_t> data_;
+};
+
+// Caller-supplied binary file object with write / seek (and read / readinto for
+// save() and sample read-back). Offset 0 of the object is the start of the MP4; it is
+// truncated there first when it supports truncate(). Callbacks take the GIL.
+class FileObjectSink : public IOSource
+{
+public:
+    // Needs the GIL. Raises MP4Error if the object cannot write and seek.
+    explicit FileObjectSink(py::object file);
+    ~FileObjectSink() override;
+
+    int64_t size() const override;
+
+protected:
+    bool read_at(int64_t pos, void *buffer, int64_t size) override;
+    bool write_at(int64_t pos, const void *buffer, int64_t size) override;
+    bool truncate(int64_t size) override;
+
+private:
+    void seek(int64_t pos);
+
+    py::object file_;
+    int64_t size_ = 0;
+    int64_t file_pos_ = 0;
+};
+
+#endif // PYMP4V2_IO_SOURCE_H
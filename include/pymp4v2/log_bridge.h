@@ -0,0 +1,25 @@
+#ifndef PYMP4V2_LOG_BRIDGE_H
+#define PYMP4V2_LOG_BRIDGE_H
+
+#include <pybind11/pybind11.h>
+
+#include "mp4v2/mp4v2.h"
+
+namespace py = pybind11;
+
+// mp4v2 log output (MP4SetLogCallback) routed to a Python callable. Messages above the
+// level are dropped in the callback without taking a lock or the GIL; the rest are
+// formatted on the logging thread, queued and handed to the callable by one delivery
+// thread, so mp4v2 calls never wait on Python.
+
+// Install `handler(level, message)` for messages at or below `level` (also passed to
+// MP4LogSetLevel). None restores mp4v2's own stdout/stderr output. Needs the GIL.
+void set_log_handler(py::object handler, MP4LogLevel level);
+
+// Block until every message queued so far has been delivered. Needs the GIL; a no-op
+// from the handler itself.
+void flush_logs();
+
+void bind_log(py::module_ &m);
+
+#endif // PYMP4V2_LOG_BRIDGE_H
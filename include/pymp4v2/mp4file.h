@@ -1,23 +1,96 @@
 #ifndef PYMP4V2_MP4FILE_H
 #define PYMP4V2_MP4FILE_H
 
+#include <map>
 #include <memory>
 #include <optional>
 #include <string>
+#include <utility>
+#include <variant>
+#include <vector>
 
 #include <pybind11/pybind11.h>
 
 namespace py = pybind11;
 
 #include "mp4v2/mp4v2.h"
+#include "pymp4v2/atom_tree.h"
+#include "pymp4v2/file_mapping.h"
+#include "pymp4v2/io_source.h"
 #include "pymp4v2/mp4_file_handle_wrapper.h"
 #include "pymp4v2/mp4_tags_wrapper.h"
+#include "pymp4v2/prefetch.h"
+#include "pymp4v2/probe.h"
 #include "pymp4v2/raw.h"
+#include "pymp4v2/reader_pool.h"
 
 class MP4File;
 
+// Sync samples of one track, sorted by sample index: 0-based indices and start times.
+struct Keyframes
+{
+    raw::NativeArray<uint32_t> indices;
+    raw::NativeArray<uint64_t> times;
+};
+
+// All Track properties, read in one GIL-released pass. Fields that do not apply to the
+// track type (or are missing from the file) are unset rather than raising.
+struct TrackInfo
+{
+    py::ssize_t index = 0;
+    MP4TrackId id = MP4_INVALID_TRACK_ID;
+    std::string type;
+    std::optional<std::string> codec;
+    MP4Duration duration = 0;
+    uint32_t timescale = 0;
+    MP4SampleId sample_count = 0;
+    std::optional<std::string> language;
+    std::optional<std::string> name;
+    std::optional<uint32_t> bitrate;
+    uint16_t width = 0;
+    uint16_t height = 0;
+    double frame_rate = 0.0;
+    std::optional<int> audio_channels;
+};
+
+// Track id and handler type, cached per open handle for index / id / type lookups.
+struct TrackEntry
+{
+    MP4TrackId id;
+    std::string type;
+};
+
+// Forward iterator over a range of sample ids. Reads `chunk` samples at a time with
+// the GIL released and hands them out one by one, or takes them from a prefetcher
+// thread when one is attached.
+class SampleIterator
+{
+public:
+    SampleIterator(MP4File *file, MP4TrackId trackId, MP4SampleId first, MP4SampleId stop, uint32_t step,
+                   uint32_t chunk, std::size_t prefetch = 0);
+
+    raw::MP4SampleData next();
+    std::size_t remaining() const;
+    std::optional<PrefetchStats> stats() const;
+
+private:
+    void fill();
+
+    MP4File *file_;
+    MP4TrackId track_id_;
+    MP4SampleId next_id_;
+    MP4SampleId stop_;
+    uint32_t step_;
+    uint32_t chunk_;
+    std::vector<raw::MP4SampleData> buffer_;
+    std::size_t pos_ = 0;
+    std::shared_ptr<SamplePrefetcher> prefetch_;
+};
+
 class Track
 {
+    friend class MP4File;
+
 public:
     Track(MP4File *file, MP4TrackId id);
 
@@ -33,19 +106,45 @@ public:
     uint32_t bitrate() const;
     double frame_rate() const;
     std::optional<int> audio_channels() const;
+    TrackInfo info() const;
+    uint32_t max_sample_size() const;
     raw::MP4SampleData read_sample(py::ssize_t index) const;
+    raw::MP4SampleInfo read_sample_into(py::ssize_t index, py::buffer buf) const;
+    raw::MP4SampleBatch read_samples(py::ssize_t start = 0, std::optional<py::ssize_t> stop = std::nullopt) const;
+    raw::MP4SampleTable sample_table() const;
+    std::shared_ptr<Keyframes> keyframes() const;
+    uint32_t seek(MP4Timestamp time, const std::string &mode = "prev_key") const;
+    // Read-only view of the sample's bytes in the file mapping (mmap=True files).
+    py::memoryview sample_view(py::ssize_t index) const;
+    SampleIterator iter_samples(py::ssize_t start = 0, std::optional<py::ssize_t> stop = std::nullopt,
+                                py::ssize_t step = 1,
+                                const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range = std::nullopt,
+                                uint32_t chunk = 64, std::size_t prefetch = 0) const;
+    void write_samples(py::buffer payload, py::object sizes, py::object durations = py::none(),
+                       py::object rendering_offsets = py::none(), py::object sync = py::none()) const;
 
 private:
+    // 0-based [first, last) for a slice plus an optional time window (track timescale).
+    std::pair<py::ssize_t, py::ssize_t>
+    sample_bounds(py::ssize_t start, std::optional<py::ssize_t> stop,
+                  const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range) const;
+
     MP4File *file_;
     MP4TrackId id_;
 };
 
+// A track of another MP4File given as its 0-based index or as the Track itself.
+using TrackRef = std::variant<py::ssize_t, Track>;
+
 class Tracks
 {
 public:
     explicit Tracks(MP4File *file);
     py::ssize_t size() const;
     Track getitem(py::ssize_t index) const;
+    Track by_id(MP4TrackId id) const;
+    std::vector<Track> of_type(const std::string &type) const;
+    std::vector<TrackInfo> snapshot() const;
 
 private:
     MP4File *file_;
@@ -58,7 +157,7 @@ public:
 
     void fetch();
     void store();
-    void add_artwork(const std::string &data, MP4TagArtworkType type);
+    void add_artwork(py::buffer data, MP4TagArtworkType type);
     void remove_artwork(uint32_t index);
     py::list artwork() const;
     uint32_t artwork_count() const;
@@ -78,12 +177,14 @@ private:
 
 class MP4File
 {
+    friend class SampleIterator;
     friend class Track;
     friend class Tracks;
     friend class Tags;
 
 public:
-    MP4File(const std::string &filename, const std::string &mode = "r");
+    MP4File(const std::string &filename, const std::string &mode = "r", std::size_t readers = 0,
+            uint32_t padding = 4096, bool load_sample_tables = true, bool mmap = false);
     ~MP4File() = default;
 
     MP4File(const MP4File &) = delete;
@@ -91,30 +192,104 @@ public:
     MP4File(MP4File &&other) noexcept;
     MP4File &operator=(MP4File &&other) noexcept;
 
+    // Read-only files over caller-supplied bytes instead of a path.
+    static MP4File from_buffer(py::handle buffer);
+    static MP4File from_fileobj(py::object fileobj, std::size_t readSize = 1 << 20);
+    // Mode "w" files written through MP4CreateCallbacks instead of to a path.
+    static MP4File create_buffer();
+    static MP4File create_fileobj(py::object fileobj);
+
     void close();
+    // The finished bytes of a create_buffer() file once it is closed.
+    bool has_output() const;
+    py::memoryview getvalue() const;
     int get_track_count() const;
     void save();
+    void checkpoint();
     bool is_open() const;
     std::string get_info() const;
     const std::string &filename() const;
     const std::string &mode() const;
     MP4Duration duration() const;
     uint32_t timescale() const;
-    void optimize(const std::optional<std::string> &newFileName = std::nullopt);
+    std::size_t readers() const;
+    bool load_sample_tables() const;
+    bool mmap() const;
+    bool has_path() const;
+    const std::optional<std::string> &last_tag_write() const;
+    // Root of the box tree of the file on disk, expanded lazily from atom headers.
+    std::shared_ptr<raw::MP4Atom> atoms() const;
+    bool optimize(const std::optional<std::string> &newFileName = std::nullopt, const py::object &progress = py::none(),
+                  std::optional<std::size_t> chunkSize = std::nullopt, const py::object &cancel = py::none());
+    Track copy_track(MP4File &src_file, const TrackRef &src_track,
+                     const std::optional<std::pair<py::ssize_t, py::ssize_t>> &sample_range = std::nullopt,
+                     const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range = std::nullopt);
+    std::vector<Track> copy_tracks(MP4File &src_file, const std::optional<std::vector<TrackRef>> &src_tracks = std::nullopt,
+                                   const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range = std::nullopt);
 
     Tracks tracks();
     Tags &tags();
 
 private:
+    MP4File(std::string name, std::string mode, std::shared_ptr<IOSource> source);
+
     void open();
     void ensure_open() const;
-    void reopen_existing();
+    void reopen_existing(bool fetchTags = true);
+    void close_handle(std::optional<uint32_t> flags = std::nullopt);
+    // Write-mode save: store dirty tags, close with closeFlags so mp4v2 writes moov, then
+    // reopen with MP4Modify keeping tags, track index and keyframes from before.
+    void commit(uint32_t closeFlags);
+    // MP4Read, a ProbeImage handle with load_sample_tables_ false, or source_. GIL released.
+    MP4FileHandle open_read();
+    // Raises MP4Error when the file was opened without its sample tables.
+    void require_sample_tables() const;
+    // False for "r" and "t": the handle comes from MP4Read. Mode "t" stores tags through
+    // flush_tags() / write_tags_in_place() instead.
+    bool handle_writable() const;
+    void flush_tags();
+    void write_tags_in_place();
     raw::MP4FileHandleWrapper &handle();
+    ReadLease read_handle();
+    std::shared_ptr<Keyframes> keyframes(MP4TrackId trackId);
+    // Sample table of a track, built once per open handle for sample_view().
+    std::shared_ptr<const raw::MP4SampleTable> cached_sample_table(MP4TrackId trackId);
+    const std::vector<TrackEntry> &track_index();
+    Track resolve_track(const TrackRef &ref);
+    Track copy_samples(const Track &src, py::ssize_t first, py::ssize_t last);
 
     std::string filename_;
     std::string mode_;
+    std::size_t readers_ = 0;
+    uint32_t padding_ = 4096;
+    bool load_sample_tables_ = true;
+    bool mmap_ = false;
+    // False for source_ files; kept after close(), which drops source_.
+    bool has_path_ = true;
+    std::optional<std::string> last_tag_write_;
+    // probe_ and source_ are declared before handle_ so they outlive it: mp4v2 calls
+    // back into them until the handle is closed, including from the destructor.
+    // Backing data of handle_ when opened with load_sample_tables_ false.
+    std::shared_ptr<ProbeImage> probe_;
+    // Caller-supplied bytes (from_buffer / from_fileobj / create_buffer /
+    // create_fileobj); filename_ is then only a label.
+    std::shared_ptr<IOSource> source_;
     raw::MP4FileHandleWrapper handle_;
+    // Finished file of a create_buffer() MP4File, taken from its MemorySink on close().
+    std::optional<raw::ByteArray> output_;
+    // Sample reads go through a pooled handle when readers_ > 0, otherwise through
+    // handle_ with read_mutex_ held, so Track reads are safe from several threads.
+    std::shared_ptr<ReaderPool> reader_pool_;
+    std::unique_ptr<std::mutex> read_mutex_ = std::make_unique<std::mutex>();
     std::unique_ptr<Tags> tags_;
+    // Built on first use per track; dropped when the track is written or the handle closed.
+    std::map<MP4TrackId, std::shared_ptr<Keyframes>> keyframes_;
+    // mmap=True: the file mapped while the handle is open, and per-track offsets / sizes
+    // into it. Views hold their own reference to the mapping.
+    std::shared_ptr<FileMapping> mapping_;
+    std::map<MP4TrackId, std::shared_ptr<const raw::MP4SampleTable>> sample_tables_;
+    // Built on first track lookup; dropped when a track is added or the handle closed.
+    std::optional<std::vector<TrackEntry>> track_index_;
 };
 
 void bind_highlevel(pybind11::module_ &m, pybind11::module_ &m_raw);
@@ -0,0 +1,66 @@
+#ifndef PYMP4V2_PREFETCH_H
+#define PYMP4V2_PREFETCH_H
+
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <mutex>
+#include <string>
+#include <thread>
+
+#include "mp4v2/mp4v2.h"
+#include "pymp4v2/raw.h"
+
+// Queue-depth counters of a SamplePrefetcher, for tuning the prefetch depth.
+struct PrefetchStats
+{
+    std::size_t capacity = 0;
+    std::size_t produced = 0;
+    std::size_t consumed = 0;
+    std::size_t max_depth = 0;
+    std::size_t consumer_waits = 0;
+    std::size_t producer_waits = 0;
+    double mean_depth = 0.0;
+};
+
+// Background reader for a range of sample ids. The worker thread opens its own
+// MP4Read handle and fills a bounded queue; it never touches Python objects.
+class SamplePrefetcher
+{
+public:
+    SamplePrefetcher(std::string filename, MP4TrackId trackId, MP4SampleId first, MP4SampleId stop, uint32_t step,
+                     std::size_t capacity);
+    ~SamplePrefetcher();
+
+    SamplePrefetcher(const SamplePrefetcher &) = delete;
+    SamplePrefetcher &operator=(const SamplePrefetcher &) = delete;
+
+    // Next sample in order. Waits with the GIL released; false once the range is
+    // exhausted. Raises MP4Error if the worker failed.
+    bool pop(raw::MP4SampleData &out);
+    PrefetchStats stats() const;
+
+private:
+    void run();
+
+    std::string filename_;
+    MP4TrackId track_id_;
+    MP4SampleId first_;
+    MP4SampleId stop_;
+    uint32_t step_;
+    std::size_t capacity_;
+
+    mutable std::mutex mutex_;
+    std::condition_variable not_empty_;
+    std::condition_variable not_full_;
+    std::deque<raw::MP4SampleData> queue_;
+    bool done_ = false;
+    bool cancelled_ = false;
+    std::string error_;
+    PrefetchStats stats_;
+    std::size_t depth_sum_ = 0;
+    std::thread thread_;
+};
+
+#endif // PYMP4V2_PREFETCH_H
@@ -0,0 +1,33 @@
+#ifndef PYMP4V2_PROBE_H
+#define PYMP4V2_PROBE_H
+
+#include <cstdint>
+#include <string>
+
+#include "pymp4v2/io_source.h"
+
+// Header-only copy of an MP4 file for MP4ReadCallbacks: ftyp plus a moov whose sample
+// tables are cut down before mp4v2 sees them.
+//
+// mp4v2 always loads every stbl table into memory on open. Here the file is walked by
+// atom headers instead; stts / stsc / stco / co64 become empty, stsz keeps its sample
+// count with a placeholder constant size, other stbl children (stss, ctts, sdtp, ...)
+// are dropped and the large tables are seeked over, never read. stsd, tkhd, mdhd, hdlr,
+// edts and udta are copied unchanged, so track and tag accessors behave as with MP4Read.
+// Sample sizes, offsets and timing are not available from a handle opened this way.
+class ProbeImage : public IOSource
+{
+public:
+    // Builds the image; raises MP4Error naming the file if it has no parsable moov.
+    explicit ProbeImage(const std::string &filename);
+
+    int64_t size() const override;
+
+protected:
+    bool read_at(int64_t pos, void *buffer, int64_t size) override;
+
+private:
+    std::string data_;
+};
+
+#endif // PYMP4V2_PROBE_H
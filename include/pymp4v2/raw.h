@@ -10,6 +10,7 @@
 #include <pybind11/stl.h>
 
 #include "mp4v2/mp4v2.h"
+#include "pymp4v2/buffer.h"
 #include "pymp4v2/error.h"
 #include "pymp4v2/mp4_file_handle_wrapper.h"
 #include "pymp4v2/mp4_tags_wrapper.h"
@@ -56,13 +57,57 @@ namespace raw
         }
     }
 
+    // Payload is the buffer mp4v2 allocated for the read, shared (not copied) with Python.
     struct MP4SampleData
     {
-        std::string data;
-        MP4Timestamp startTime;
-        MP4Duration duration;
-        MP4Duration renderingOffset;
-        bool isSyncSample;
+        ByteArray data;
+        MP4Timestamp startTime = 0;
+        MP4Duration duration = 0;
+        MP4Duration renderingOffset = 0;
+        bool isSyncSample = false;
+    };
+
+    // Result of reading into a caller buffer: byte count and timing, no payload.
+    struct MP4SampleInfo
+    {
+        uint32_t numBytes = 0;
+        MP4Timestamp startTime = 0;
+        MP4Duration duration = 0;
+        MP4Duration renderingOffset = 0;
+        bool isSyncSample = false;
+    };
+
+    // Consecutive samples read in one native pass. Payloads are packed into data;
+    // sample i is data[offsets[i]:offsets[i] + sizes[i]].
+    struct MP4SampleBatch
+    {
+        MP4SampleId firstSampleId = MP4_INVALID_SAMPLE_ID;
+        ByteArray data;
+        NativeArray<uint64_t> offsets;
+        NativeArray<uint32_t> sizes;
+        NativeArray<uint64_t> startTimes;
+        NativeArray<uint64_t> durations;
+        NativeArray<uint64_t> renderingOffsets;
+        ByteArray syncFlags;
+    };
+
+    // Whole-track index read from stsz/stts/ctts/stss/stsc/stco (co64) in one pass.
+    // Entry i describes sample id i + 1.
+    struct MP4SampleTable
+    {
+        NativeArray<uint32_t> sizes;
+        NativeArray<uint64_t> offsets;
+        NativeArray<uint64_t> startTimes;
+        NativeArray<uint64_t> durations;
+        NativeArray<uint64_t> renderingOffsets;
+        ByteArray syncFlags;
+    };
+
+    // Sync samples of one track: 0-based indices in order and their start times.
+    struct MP4SyncSamples
+    {
+        NativeArray<uint32_t> indices;
+        NativeArray<uint64_t> times;
     };
 
     // fileName
@@ -90,6 +135,10 @@ namespace raw
                                       const std::optional<std::string> &type, uint8_t subType);
     std::string MP4GetTrackType_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
     void MP4DeleteTrack_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
+    MP4TrackId MP4CloneTrack_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId,
+                                     MP4FileHandleWrapper *dstFile, MP4TrackId dstHintTrackReferenceTrack);
+    MP4TrackId MP4CopyTrack_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4FileHandleWrapper *dstFile,
+                                    bool applyEdits, MP4TrackId dstHintTrackReferenceTrack);
     MP4TrackId MP4AddAudioTrack_wrapper(MP4FileHandleWrapper &hFile, uint32_t timeScale, MP4Duration sampleDuration,
                                         uint8_t audioType);
     MP4TrackId MP4AddVideoTrack_wrapper(MP4FileHandleWrapper &hFile, uint32_t timeScale, MP4Duration sampleDuration,
@@ -117,7 +166,7 @@ namespace raw
     void MP4SetIntegerProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, int64_t value);
     void MP4SetFloatProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, float value);
     void MP4SetStringProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, const char *value);
-    void MP4SetBytesProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, const std::string &data);
+    void MP4SetBytesProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, py::buffer data);
     bool MP4HaveTrackAtom_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *atomName);
     std::string MP4GetTrackMediaDataName_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
     MP4Duration MP4GetTrackFixedSampleDuration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
@@ -125,7 +174,7 @@ namespace raw
     double MP4GetTrackVideoFrameRate_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
     int MP4GetTrackAudioChannels_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
     std::string MP4GetTrackESConfiguration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
-    void MP4SetTrackESConfiguration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const std::string &data);
+    void MP4SetTrackESConfiguration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer data);
     uint64_t MP4GetTrackIntegerProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName);
     float MP4GetTrackFloatProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName);
     std::string MP4GetTrackStringProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName);
@@ -137,15 +186,28 @@ namespace raw
     void MP4SetTrackStringProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName,
                                            const char *value);
     void MP4SetTrackBytesProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName,
-                                          const std::string &data);
+                                          py::buffer data);
 
     // samples
     MP4SampleData MP4ReadSample_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId sampleId);
+    MP4SampleInfo MP4ReadSampleInto_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId sampleId,
+                                            py::buffer buf);
+    MP4SampleBatch MP4ReadSamples_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId firstSampleId,
+                                          uint32_t numSamples);
+    MP4SampleTable MP4GetSampleTable_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
+    // stss entries plus one stts pass for their times, without the rest of the sample
+    // table. Every sample is sync when the track has no stss. GIL released; not bound.
+    MP4SyncSamples read_sync_samples(MP4FileHandleWrapper &hFile, MP4TrackId trackId);
     MP4SampleData MP4ReadSampleFromTime_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4Timestamp when);
-    void MP4WriteSample_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const std::string &data,
+    void MP4WriteSample_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer data,
                                 MP4Duration duration, MP4Duration renderingOffset, bool isSyncSample);
+    void MP4WriteSamples_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer payload,
+                                 py::object sizes, py::object durations, py::object renderingOffsets,
+                                 py::object syncFlags);
     void MP4CopySample_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4SampleId srcSampleId,
                                MP4FileHandleWrapper *dstFile, MP4TrackId dstTrackId, MP4Duration dstSampleDuration);
+    void MP4CopySamples_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4SampleId firstSampleId,
+                                uint32_t numSamples, MP4FileHandleWrapper *dstFile, MP4TrackId dstTrackId);
     uint32_t MP4GetSampleSize_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId sampleId);
     MP4SampleId MP4GetSampleIdFromTime_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4Timestamp when,
                                                bool wantSyncSample);
@@ -161,9 +223,8 @@ namespace raw
     bool MP4TagsHasMetadata_wrapper(MP4TagsWrapper &tags);
     void MP4TagsSetString_wrapper(MP4TagsWrapper &tags, bool (*setter)(const MP4Tags *, const char *),
                                   const std::optional<std::string> &value, const char *what);
-    void MP4TagsAddArtwork_wrapper(MP4TagsWrapper &tags, const std::string &data, MP4TagArtworkType type);
-    void MP4TagsSetArtwork_wrapper(MP4TagsWrapper &tags, uint32_t index, const std::string &data,
-                                   MP4TagArtworkType type);
+    void MP4TagsAddArtwork_wrapper(MP4TagsWrapper &tags, py::buffer data, MP4TagArtworkType type);
+    void MP4TagsSetArtwork_wrapper(MP4TagsWrapper &tags, uint32_t index, py::buffer data, MP4TagArtworkType type);
     void MP4TagsRemoveArtwork_wrapper(MP4TagsWrapper &tags, uint32_t index);
 
     // chapters
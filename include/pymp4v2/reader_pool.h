@@ -0,0 +1,71 @@
+#ifndef PYMP4V2_READER_POOL_H
+#define PYMP4V2_READER_POOL_H
+
+#include <condition_variable>
+#include <cstddef>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <vector>
+
+#include "pymp4v2/mp4_file_handle_wrapper.h"
+
+// Independent MP4Read handles on one file. mp4v2 keeps per-handle file position and
+// chunk cache state, so each concurrent sample read needs a handle of its own.
+class ReaderPool : public std::enable_shared_from_this<ReaderPool>
+{
+public:
+    // Exclusive use of one pooled handle; returned to the pool on destruction.
+    class Lease
+    {
+    public:
+        Lease(std::shared_ptr<ReaderPool> pool, std::size_t slot);
+        ~Lease();
+
+        Lease(Lease &&other) noexcept;
+        Lease &operator=(Lease &&) = delete;
+        Lease(const Lease &) = delete;
+        Lease &operator=(const Lease &) = delete;
+
+        raw::MP4FileHandleWrapper &handle() const;
+
+    private:
+        std::shared_ptr<ReaderPool> pool_;
+        std::size_t slot_;
+    };
+
+    // Opens `size` handles with MP4Read; raises MP4Error naming the file on failure.
+    ReaderPool(const std::string &filename, std::size_t size);
+
+    std::size_t size() const;
+
+    // Waits (GIL released) until a handle is free.
+    Lease acquire();
+
+private:
+    void release(std::size_t slot);
+
+    std::vector<raw::MP4FileHandleWrapper> handles_;
+    std::vector<std::size_t> free_;
+    std::mutex mutex_;
+    std::condition_variable available_;
+};
+
+// Handle for one sample read: either a pooled handle or the file's own handle held
+// under its read mutex.
+class ReadLease
+{
+public:
+    explicit ReadLease(ReaderPool::Lease lease);
+    ReadLease(std::unique_lock<std::mutex> lock, raw::MP4FileHandleWrapper &handle);
+
+    raw::MP4FileHandleWrapper &handle() const;
+
+private:
+    std::optional<ReaderPool::Lease> pooled_;
+    std::unique_lock<std::mutex> lock_;
+    raw::MP4FileHandleWrapper *handle_;
+};
+
+#endif // PYMP4V2_READER_POOL_H
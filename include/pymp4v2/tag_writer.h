@@ -0,0 +1,21 @@
+#ifndef PYMP4V2_TAG_WRITER_H
+#define PYMP4V2_TAG_WRITER_H
+
+#include <cstdint>
+#include <string>
+
+#include "mp4v2/mp4v2.h"
+
+// Store iTMF tags into `filename`, rewriting only moov.udta when the new atom fits.
+//
+// mp4v2 builds the new udta: ftyp + moov are copied to a scratch file next to
+// `filename` and MP4TagsStore runs on that copy. The result is written over the old
+// udta plus the free/skip atoms next to it inside moov; leftover space becomes a free
+// atom. Otherwise the tags go through MP4Modify (moov rewritten at the end of the
+// file) and `padding` bytes of free space are reserved at the end of the new moov so
+// the next update fits. Returns "in_place" or "rewrite".
+//
+// Blocking file I/O; call with the GIL released and no handle open on the file.
+std::string store_tags_in_place(const std::string &filename, const MP4Tags *tags, uint32_t padding);
+
+#endif // PYMP4V2_TAG_WRITER_H
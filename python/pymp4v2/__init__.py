@@ -1,15 +1,53 @@
 """Alpha Python bindings for a subset of the MP4v2 C API."""
 
-from . import raw
-from ._pymp4v2 import MP4Error, MP4File, Sample, Tags, Track, Tracks, __version__
+from . import aio, fragment, raw
+from ._pymp4v2 import (
+    Atom,
+    Keyframes,
+    MP4Error,
+    MP4File,
+    PrefetchStats,
+    Sample,
+    SampleBatch,
+    SampleInfo,
+    SampleIterator,
+    SampleTable,
+    Tags,
+    Track,
+    TrackInfo,
+    Tracks,
+    __version__,
+    flush_logs,
+    probe,
+)
+from ._cache import MetadataCache
+from ._log import set_log_handler
+from ._scan import ScanResult, ScanTrack, scan
 
 __all__ = [
+    "Atom",
+    "Keyframes",
     "MP4Error",
     "MP4File",
+    "MetadataCache",
+    "PrefetchStats",
     "Sample",
+    "SampleBatch",
+    "SampleInfo",
+    "SampleIterator",
+    "SampleTable",
+    "ScanResult",
+    "ScanTrack",
     "Tags",
     "Track",
+    "TrackInfo",
     "Tracks",
+    "aio",
+    "flush_logs",
+    "fragment",
+    "probe",
     "raw",
+    "scan",
+    "set_log_handler",
     "__version__",
 ]
@@ -6,11 +6,28 @@ Hand-written to match the pybind11 bindings. Sample indices on Track are
 
 from __future__ import annotations
 
+import logging
 from types import TracebackType
-from typing import Iterator, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
+from . import aio as aio
+from . import fragment as fragment
 from . import raw
+from .raw import MP4Atom as Atom
 from .raw import MP4Sample as Sample
+from .raw import MP4SampleBatch as SampleBatch
+from .raw import MP4SampleInfo as SampleInfo
+from .raw import MP4SampleTable as SampleTable
 
 __version__: str
 __all__: list[str]
@@ -18,6 +35,67 @@ __all__: list[str]
 class MP4Error(RuntimeError):
     """Raised when a C call returns false / MP4_INVALID_* or a closed handle is used."""
 
+class Keyframes:
+    """Sync samples of a track, sorted: 0-based sample indices (uint32) and start times (uint64, track timescale)."""
+
+    @property
+    def indices(self) -> memoryview: ...
+    @property
+    def times(self) -> memoryview: ...
+    def __len__(self) -> int: ...
+
+class PrefetchStats:
+    """Queue counters of a prefetching SampleIterator."""
+
+    capacity: int
+    produced: int
+    consumed: int
+    max_depth: int
+    consumer_waits: int
+    producer_waits: int
+    mean_depth: float
+
+class SampleIterator:
+    """Iterator returned by Track.iter_samples(); yields Sample."""
+
+    @property
+    def stats(self) -> Optional[PrefetchStats]: ...
+    def __iter__(self) -> SampleIterator: ...
+    def __next__(self) -> Sample: ...
+    def __length_hint__(self) -> int: ...
+
+class TrackInfo:
+    """Snapshot of every Track property, read in one native call."""
+
+    @property
+    def index(self) -> int: ...
+    @property
+    def id(self) -> int: ...
+    @property
+    def type(self) -> str: ...
+    @property
+    def codec(self) -> Optional[str]: ...
+    @property
+    def duration(self) -> int: ...
+    @property
+    def timescale(self) -> int: ...
+    @property
+    def sample_count(self) -> int: ...
+    @property
+    def language(self) -> Optional[str]: ...
+    @property
+    def name(self) -> Optional[str]: ...
+    @property
+    def bitrate(self) -> Optional[int]: ...
+    @property
+    def width(self) -> int: ...
+    @property
+    def height(self) -> int: ...
+    @property
+    def frame_rate(self) -> float: ...
+    @property
+    def audio_channels(self) -> Optional[int]: ...
+
 class Track:
     """One track of an MP4File. Sample indices are 0-based."""
 
@@ -45,10 +123,41 @@ class Track:
     def frame_rate(self) -> float: ...
     @property
     def audio_channels(self) -> Optional[int]: ...
+    def info(self) -> TrackInfo: ...
+    @property
+    def max_sample_size(self) -> int: ...
     def read_sample(self, index: int) -> Sample: ...
+    def read_sample_into(
+        self, index: int, buf: Union[bytearray, memoryview]
+    ) -> SampleInfo: ...
+    def read_samples(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> SampleBatch: ...
+    def sample_table(self) -> SampleTable: ...
+    @property
+    def keyframes(self) -> Keyframes: ...
+    def sample_view(self, index: int) -> memoryview: ...
+    def seek(self, time: int, mode: str = "prev_key") -> int: ...
+    def iter_samples(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        step: int = 1,
+        time_range: Optional[tuple[int, int]] = None,
+        chunk: int = 64,
+        prefetch: int = 0,
+    ) -> SampleIterator: ...
+    def write_samples(
+        self,
+        payload: Union[bytes, bytearray, memoryview],
+        sizes: Iterable[int],
+        durations: Optional[Iterable[int]] = None,
+        rendering_offsets: Optional[Iterable[int]] = None,
+        sync: Optional[Iterable[int]] = None,
+    ) -> None: ...
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> Sample: ...
-    def __iter__(self) -> Iterator[Sample]: ...
+    def __iter__(self) -> SampleIterator: ...
 
 class Tracks:
     """Sequence of Track objects on an MP4File."""
@@ -56,13 +165,18 @@ class Tracks:
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> Track: ...
     def __iter__(self) -> Iterator[Track]: ...
+    def by_id(self, id: int) -> Track: ...
+    def of_type(self, type: str) -> list[Track]: ...
+    def snapshot(self) -> list[TrackInfo]: ...
 
 class Tags:
     """iTMF tags on an MP4File. Fetch on first access; store() on context exit if dirty."""
 
     def fetch(self) -> None: ...
     def store(self) -> None: ...
-    def add_artwork(self, data: bytes, type: int = ...) -> None: ...
+    def add_artwork(
+        self, data: Union[bytes, bytearray, memoryview], type: int = ...
+    ) -> None: ...
     def remove_artwork(self, index: int) -> None: ...
     @property
     def artwork(self) -> list[bytes]: ...
@@ -271,10 +385,29 @@ class Tags:
 class MP4File:
     """High-level owner of an MP4FileHandle."""
 
-    def __init__(self, filename: str, mode: str = "r") -> None: ...
-    def close(self) -> None: ...
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "r",
+        readers: int = 0,
+        padding: int = 4096,
+        *,
+        load_sample_tables: bool = True,
+        mmap: bool = False,
+    ) -> None: ...
+    @staticmethod
+    def from_buffer(buffer: Union[bytes, bytearray, memoryview]) -> MP4File: ...
+    @staticmethod
+    def from_fileobj(fileobj: BinaryIO, *, read_size: int = 1048576) -> MP4File: ...
+    @staticmethod
+    def create_buffer() -> MP4File: ...
+    @staticmethod
+    def create_fileobj(fileobj: BinaryIO) -> MP4File: ...
+    def getvalue(self) -> memoryview: ...
+    def close(self) -> Optional[memoryview]: ...
     def get_track_count(self) -> int: ...
     def save(self) -> None: ...
+    def checkpoint(self) -> None: ...
     def is_open(self) -> bool: ...
     def get_info(self) -> str: ...
     @property
@@ -284,6 +417,17 @@ class MP4File:
     @property
     def mode(self) -> str: ...
     @property
+    def readers(self) -> int: ...
+    @property
+    def load_sample_tables(self) -> bool: ...
+    @property
+    def mmap(self) -> bool: ...
+    @property
+    def has_path(self) -> bool: ...
+    def atoms(self) -> Atom: ...
+    @property
+    def last_tag_write(self) -> Optional[str]: ...
+    @property
     def duration(self) -> int: ...
     @property
     def timescale(self) -> int: ...
@@ -291,7 +435,29 @@ class MP4File:
     def tracks(self) -> Tracks: ...
     @property
     def tags(self) -> Tags: ...
-    def optimize(self, new_filename: Optional[str] = None) -> None: ...
+    def copy_track(
+        self,
+        src_file: MP4File,
+        src_track: Union[int, Track],
+        *,
+        sample_range: Optional[tuple[int, int]] = None,
+        time_range: Optional[tuple[int, int]] = None,
+    ) -> Track: ...
+    def copy_tracks(
+        self,
+        src_file: MP4File,
+        src_tracks: Optional[Sequence[Union[int, Track]]] = None,
+        *,
+        time_range: Optional[tuple[int, int]] = None,
+    ) -> list[Track]: ...
+    def optimize(
+        self,
+        new_filename: Optional[str] = None,
+        *,
+        progress: Optional[Callable[[int, int], Any]] = None,
+        chunk_size: Optional[int] = None,
+        cancel: Any = None,
+    ) -> bool: ...
     def __enter__(self) -> MP4File: ...
     def __exit__(
         self,
@@ -299,3 +465,73 @@ class MP4File:
         exc: Optional[BaseException],
         tb: Optional[TracebackType],
     ) -> bool: ...
+
+def probe(filename: str) -> MP4File: ...
+def set_log_handler(
+    handler: Optional[Union[Callable[[raw.MP4LogLevel, str], None], logging.Logger]],
+    level: raw.MP4LogLevel = ...,
+) -> None: ...
+def flush_logs() -> None: ...
+
+class ScanTrack(NamedTuple):
+    """One track of a scanned file. ``codec`` is the sample entry name (``avc1``, ``mp4a``)."""
+
+    id: int
+    type: str
+    codec: Optional[str]
+    duration: int
+    timescale: int
+    sample_count: int
+    bitrate: int
+    width: int
+    height: int
+    language: Optional[str]
+
+class ScanResult(NamedTuple):
+    """Metadata of one scanned file. Fields that were not requested are ``None``."""
+
+    path: str
+    duration: Optional[int] = None
+    timescale: Optional[int] = None
+    info: Optional[str] = None
+    tracks: Optional[tuple[ScanTrack, ...]] = None
+    tags: Optional[dict[str, Any]] = None
+    chapters: Optional[tuple[tuple[int, str], ...]] = None
+    error: Optional[str] = None
+
+def scan(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    fields: Sequence[str] = ("tracks", "tags"),
+    max_pending: Optional[int] = None,
+) -> Iterator[ScanResult]: ...
+
+class MetadataCache:
+    """Persistent LRU cache of ScanResult keyed by path and file identity."""
+
+    path: str
+    max_entries: int
+    fields: tuple[str, ...]
+    touch_interval: float
+    hits: int
+    misses: int
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        fields: Sequence[str] = ("tracks", "tags"),
+        touch_interval: float = 60.0,
+    ) -> None: ...
+    def lookup(self, path: str) -> Optional[ScanResult]: ...
+    def get(self, path: str) -> ScanResult: ...
+    def invalidate(self, path: str) -> None: ...
+    def clear(self) -> None: ...
+    def __len__(self) -> int: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> MetadataCache: ...
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None: ...
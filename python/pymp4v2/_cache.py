@@ -0,0 +1,226 @@
+"""On-disk cache of scanned file metadata.
+
+Entries live in one SQLite file and hold the :class:`ScanResult` of a file as
+JSON, keyed by absolute path and checked against the file identity
+``(size, mtime_ns, inode, device)`` from :func:`os.stat`. A hit costs one
+``stat`` and one indexed query, plus a write when its last-use stamp is older
+than ``touch_interval``; the MP4 is not opened.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from types import TracebackType
+from typing import Any, Optional, Sequence
+
+from ._scan import DEFAULT_FIELDS, FIELDS, ScanResult, ScanTrack, scan_file
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    device INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    data TEXT NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+"""
+
+
+def _identity(path: str) -> tuple[int, int, int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino, st.st_dev
+
+
+def _dump(result: ScanResult) -> str:
+    return json.dumps(
+        {
+            "duration": result.duration,
+            "timescale": result.timescale,
+            "info": result.info,
+            "tracks": result.tracks,
+            "tags": result.tags,
+            "chapters": result.chapters,
+        }
+    )
+
+
+def _load(path: str, data: str) -> ScanResult:
+    # JSON turns tuples into lists; restore the shapes scan() returns.
+    raw: dict[str, Any] = json.loads(data)
+    tracks = raw["tracks"]
+    tags = raw["tags"]
+    chapters = raw["chapters"]
+    return ScanResult(
+        path=path,
+        duration=raw["duration"],
+        timescale=raw["timescale"],
+        info=raw["info"],
+        tracks=None if tracks is None else tuple(ScanTrack(*t) for t in tracks),
+        tags=(
+            None
+            if tags is None
+            else {k: tuple(v) if isinstance(v, list) else v for k, v in tags.items()}
+        ),
+        chapters=None if chapters is None else tuple(tuple(c) for c in chapters),
+    )
+
+
+class MetadataCache:
+    """Persistent, size-bounded LRU cache of :class:`ScanResult` per file.
+
+    Args:
+        path: SQLite database file; created if missing. Several processes may
+            share it.
+        max_entries: Least recently used entries beyond this count are evicted
+            on insert.
+        fields: As for :func:`scan`. Entries built with other fields are misses.
+        touch_interval: Seconds a hit leaves the entry's last-use stamp alone,
+            so repeated hits on a hot file do not each write to the database.
+            Recency is tracked to this granularity.
+
+    Thread-safe. Scans on a miss run outside the cache lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        touch_interval: float = 60.0,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if touch_interval < 0:
+            raise ValueError("touch_interval must not be negative")
+        fields = tuple(fields)
+        unknown = set(fields) - FIELDS
+        if unknown:
+            raise ValueError(
+                f"unknown scan fields: {sorted(unknown)} (expected {sorted(FIELDS)})"
+            )
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.fields = fields
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._last_stamp = 0
+        self._fields_key = ",".join(sorted(set(fields)))
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def _stamp(self) -> int:
+        # Wall-clock nanoseconds, kept increasing within this instance even when
+        # the clock is coarse. Called with the lock held.
+        self._last_stamp = max(time.time_ns(), self._last_stamp + 1)
+        return self._last_stamp
+
+    def lookup(self, path: str) -> Optional[ScanResult]:
+        """Cached result for ``path`` if its identity still matches, else None.
+
+        Raises:
+            OSError: ``path`` cannot be stat'ed.
+        """
+        key = os.path.abspath(os.fspath(path))
+        identity = _identity(key)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size, mtime_ns, inode, device, fields, data, used "
+                "FROM entries WHERE path = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if tuple(row[:4]) != identity or row[4] != self._fields_key:
+                with self._db:
+                    self._db.execute("DELETE FROM entries WHERE path = ?", (key,))
+                self.misses += 1
+                return None
+            if time.time_ns() - row[6] >= self.touch_interval * 1e9:
+                with self._db:
+                    self._db.execute(
+                        "UPDATE entries SET used = ? WHERE path = ?",
+                        (self._stamp(), key),
+                    )
+            self.hits += 1
+        return _load(key, row[5])
+
+    def get(self, path: str) -> ScanResult:
+        """Result for ``path``: from the cache, or scanned and stored on a miss.
+
+        A failed scan is returned with ``error`` set (as from :func:`scan`) and
+        is not stored.
+
+        Raises:
+            OSError: ``path`` cannot be stat'ed.
+        """
+        cached = self.lookup(path)
+        if cached is not None:
+            return cached
+        key = os.path.abspath(os.fspath(path))
+        identity = _identity(key)
+        result = scan_file(key, self.fields)
+        # Store only if the file did not change while it was scanned.
+        if result.error is None and _identity(key) == identity:
+            self._store(key, identity, result)
+        return result
+
+    def _store(
+        self, key: str, identity: tuple[int, int, int, int], result: ScanResult
+    ) -> None:
+        data = _dump(result)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, *identity, self._fields_key, data, self._stamp()),
+            )
+            # Stamps from several processes may tie, so evict by count rather
+            # than by a cut-off stamp.
+            self._db.execute(
+                "DELETE FROM entries WHERE path IN (SELECT path FROM entries "
+                "ORDER BY used LIMIT MAX(0, (SELECT COUNT(*) FROM entries) - ?))",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, path: str) -> None:
+        """Drop the entry for ``path`` if there is one."""
+        key = os.path.abspath(os.fspath(path))
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE path = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> MetadataCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
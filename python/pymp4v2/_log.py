@@ -0,0 +1,47 @@
+"""mp4v2 diagnostics routed to Python instead of stdout / stderr.
+
+mp4v2 logs through one process-wide callback. The native side drops messages
+above the configured level without touching the GIL and queues the rest for a
+single delivery thread, so logging from many worker threads never serialises
+them on Python code.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional, Union
+
+from . import raw
+from ._pymp4v2 import _set_log_handler
+
+LogHandler = Callable[[raw.MP4LogLevel, str], None]
+
+_LOGGING_LEVELS = {
+    int(raw.MP4_LOG_ERROR): logging.ERROR,
+    int(raw.MP4_LOG_WARNING): logging.WARNING,
+    int(raw.MP4_LOG_INFO): logging.INFO,
+}
+
+
+def _logger_handler(logger: logging.Logger) -> LogHandler:
+    def handler(level: raw.MP4LogLevel, message: str) -> None:
+        logger.log(_LOGGING_LEVELS.get(int(level), logging.DEBUG), message)
+
+    return handler
+
+
+def set_log_handler(
+    handler: Optional[Union[LogHandler, logging.Logger]],
+    level: raw.MP4LogLevel = raw.MP4_LOG_WARNING,
+) -> None:
+    """Send mp4v2 log messages at or below ``level`` to ``handler``.
+
+    ``handler`` is called as ``handler(level, message)`` from a pymp4v2 thread,
+    or is a :class:`logging.Logger` that gets ERROR / WARNING / INFO records and
+    DEBUG for the verbose levels. ``level`` is also set with ``MP4LogSetLevel``.
+    ``None`` restores mp4v2's own output. Delivery is asynchronous; see
+    :func:`flush_logs`.
+    """
+    if isinstance(handler, logging.Logger):
+        handler = _logger_handler(handler)
+    _set_log_handler(handler, raw.MP4LogLevel(int(level)))
@@ -0,0 +1,224 @@
+"""Batch metadata scan over many files with a process pool.
+
+Each worker opens a file once with ``raw.MP4Read``, extracts only the requested
+fields and returns a small picklable :class:`ScanResult`. Failures are reported
+in ``ScanResult.error`` instead of aborting the batch.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from . import raw
+
+FIELDS = frozenset({"info", "tracks", "tags", "chapters"})
+DEFAULT_FIELDS = ("tracks", "tags")
+
+# Property names of raw.MP4Tags that hold tag values (artwork payloads are skipped).
+_TAG_FIELDS = tuple(
+    name
+    for name, value in vars(raw.MP4Tags).items()
+    if isinstance(value, property) and name != "artwork"
+)
+
+
+class ScanTrack(NamedTuple):
+    """One track of a scanned file. ``codec`` is the sample entry name (``avc1``, ``mp4a``)."""
+
+    id: int
+    type: str
+    codec: Optional[str]
+    duration: int
+    timescale: int
+    sample_count: int
+    bitrate: int
+    width: int
+    height: int
+    language: Optional[str]
+
+
+class ScanResult(NamedTuple):
+    """Metadata of one scanned file. Fields that were not requested are ``None``.
+
+    ``tags`` maps ``raw.MP4Tags`` property names to values (track/disk as
+    ``(index, total)``); ``chapters`` is a tuple of ``(duration, title)``.
+    ``error`` is ``"ExceptionType: message"`` if the file could not be scanned.
+    """
+
+    path: str
+    duration: Optional[int] = None
+    timescale: Optional[int] = None
+    info: Optional[str] = None
+    tracks: Optional[tuple[ScanTrack, ...]] = None
+    tags: Optional[dict[str, Any]] = None
+    chapters: Optional[tuple[tuple[int, str], ...]] = None
+    error: Optional[str] = None
+
+
+def _optional(fn: Callable[..., Any], *args: Any) -> Any:
+    try:
+        return fn(*args)
+    except raw.MP4Error:
+        return None
+
+
+def _tracks(handle: raw.MP4FileHandle) -> tuple[ScanTrack, ...]:
+    tracks = []
+    for index in range(raw.MP4GetNumberOfTracks(handle)):
+        tid = raw.MP4FindTrackId(handle, index)
+        tracks.append(
+            ScanTrack(
+                id=tid,
+                type=raw.MP4GetTrackType(handle, tid),
+                codec=_optional(raw.MP4GetTrackMediaDataName, handle, tid),
+                duration=raw.MP4GetTrackDuration(handle, tid),
+                timescale=raw.MP4GetTrackTimeScale(handle, tid),
+                sample_count=raw.MP4GetTrackNumberOfSamples(handle, tid),
+                bitrate=_optional(raw.MP4GetTrackBitRate, handle, tid) or 0,
+                width=_optional(raw.MP4GetTrackVideoWidth, handle, tid) or 0,
+                height=_optional(raw.MP4GetTrackVideoHeight, handle, tid) or 0,
+                language=_optional(raw.MP4GetTrackLanguage, handle, tid),
+            )
+        )
+    return tuple(tracks)
+
+
+def _tags(handle: raw.MP4FileHandle) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    with raw.MP4TagsAlloc() as tags:
+        raw.MP4TagsFetch(tags, handle)
+        for name in _TAG_FIELDS:
+            value = getattr(tags, name)
+            if isinstance(value, (raw.MP4TagTrack, raw.MP4TagDisk)):
+                value = (value.index, value.total)
+            if value is not None:
+                result[name] = value
+    return result
+
+
+def _chapters(handle: raw.MP4FileHandle) -> tuple[tuple[int, str], ...]:
+    chapters = raw.MP4GetChapters(handle, raw.MP4ChapterTypeAny)
+    return tuple((c.duration, c.title) for c in chapters.chapters)
+
+
+def scan_file(path: str, fields: Sequence[str] = DEFAULT_FIELDS) -> ScanResult:
+    """Scan one file in the current process. Never raises for per-file problems."""
+    path = os.fspath(path)
+    try:
+        with raw.MP4Read(path) as handle:
+            return ScanResult(
+                path=path,
+                duration=raw.MP4GetDuration(handle),
+                timescale=raw.MP4GetTimeScale(handle),
+                info=(
+                    raw.MP4Info(handle, raw.MP4_INVALID_TRACK_ID)
+                    if "info" in fields
+                    else None
+                ),
+                tracks=_tracks(handle) if "tracks" in fields else None,
+                tags=_tags(handle) if "tags" in fields else None,
+                chapters=_chapters(handle) if "chapters" in fields else None,
+            )
+    except Exception as exc:  # reported inline; one bad file must not stop the batch
+        return _failed(path, exc)
+
+
+def _failed(path: str, exc: BaseException) -> ScanResult:
+    return ScanResult(path=path, error=f"{type(exc).__name__}: {exc}")
+
+
+def _isolated(paths: Sequence[str], fields: Sequence[str]) -> Iterator[ScanResult]:
+    # Files in flight when a worker died, rerun one at a time so only the file
+    # that kills the worker again is reported as failed.
+    pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        for path in paths:
+            try:
+                yield pool.submit(scan_file, path, fields).result()
+            except BrokenProcessPool as exc:
+                yield _failed(path, exc)
+                pool.shutdown()
+                pool = ProcessPoolExecutor(max_workers=1)
+            except Exception as exc:
+                yield _failed(path, exc)
+    finally:
+        pool.shutdown()
+
+
+def scan(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+    max_pending: Optional[int] = None,
+) -> Iterator[ScanResult]:
+    """Scan many files over a process pool, yielding a ScanResult per file as it finishes.
+
+    Args:
+        paths: File paths; consumed lazily, so a generator over millions of files is fine.
+        workers: Process count (default ``os.cpu_count()``). ``0`` scans in this
+            process, in order, without a pool.
+        fields: Any of ``"info"``, ``"tracks"``, ``"tags"``, ``"chapters"``.
+            File ``duration`` / ``timescale`` are always filled.
+        max_pending: Submitted-but-unfinished files kept in flight (default ``4 * workers``).
+
+    A worker that dies (e.g. mp4v2 crashing on a corrupt file) does not end the
+    scan: the pool is replaced, the files that were in flight are rerun one at
+    a time, and the one that crashes again is yielded with ``error`` set.
+
+    Raises:
+        ValueError: Unknown field name.
+    """
+    fields = tuple(fields)
+    unknown = set(fields) - FIELDS
+    if unknown:
+        raise ValueError(
+            f"unknown scan fields: {sorted(unknown)} (expected {sorted(FIELDS)})"
+        )
+    if workers == 0:
+        for path in paths:
+            yield scan_file(path, fields)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    limit = max_pending or 4 * workers
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending: dict[Future[ScanResult], str] = {}
+
+    def collect() -> Iterator[ScanResult]:
+        nonlocal pool
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        crashed = []
+        for future in done:
+            path = pending.pop(future)
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                crashed.append(path)
+            except Exception as exc:
+                yield _failed(path, exc)
+        if not crashed:
+            return
+        # A dead worker fails every unfinished future of the pool.
+        pool.shutdown()
+        for future, path in pending.items():
+            if future.exception() is None:
+                yield future.result()
+            else:
+                crashed.append(path)
+        pending.clear()
+        yield from _isolated(crashed, fields)
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        for path in paths:
+            path = os.fspath(path)
+            pending[pool.submit(scan_file, path, fields)] = path
+            if len(pending) >= limit:
+                yield from collect()
+        while pending:
+            yield from collect()
+    finally:
+        pool.shutdown()
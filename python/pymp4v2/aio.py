@@ -0,0 +1,299 @@
+"""asyncio front end for :class:`pymp4v2.MP4File`.
+
+Blocking work (open, sample reads, optimize, close) runs on a bounded thread pool,
+so the event loop never waits on mp4v2. The native calls release the GIL, so the
+pool threads run them in parallel. Sample reads on one file are serialised unless
+the file is opened with ``readers=N``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from ._pymp4v2 import (
+    Keyframes,
+    MP4Error,
+    MP4File,
+    Sample,
+    SampleBatch,
+    SampleInfo,
+    SampleTable,
+    Tags,
+    Track,
+    TrackInfo,
+)
+
+T = TypeVar("T")
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+
+
+def set_concurrency(max_workers: int) -> None:
+    """Replace the shared executor used when no ``executor`` is passed.
+
+    Files without their own ``executor`` use the new pool from their next call
+    on; work already queued on the old pool still finishes there.
+    """
+    global _default_executor
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    old, _default_executor = _default_executor, ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="pymp4v2-aio"
+    )
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def default_executor() -> Executor:
+    """Shared thread pool, created on first use with ``min(32, os.cpu_count() + 4)`` workers."""
+    if _default_executor is None:
+        set_concurrency(min(32, (os.cpu_count() or 1) + 4))
+    assert _default_executor is not None
+    return _default_executor
+
+
+# Track properties that only read mp4v2's in-memory headers.
+_HEADER_PROPERTIES = frozenset(
+    {
+        "id",
+        "type",
+        "duration",
+        "timescale",
+        "sample_count",
+        "language",
+        "name",
+        "width",
+        "height",
+        "frame_rate",
+        "audio_channels",
+    }
+)
+
+
+class AsyncTrack:
+    """Awaitable sample access for one Track.
+
+    Header properties (``id``, ``type``, ``duration``, ``sample_count``, ...) are
+    the Track's own and read mp4v2's in-memory headers. Everything that walks the
+    sample tables or does I/O is a coroutine here: the reads, ``write_samples()``,
+    ``sample_table()``, ``keyframes()``, ``seek()``, ``info()``, ``bitrate()`` and
+    ``max_sample_size()``. Other Track members are not forwarded; use ``track``
+    for blocking access.
+    """
+
+    def __init__(self, owner: AsyncMP4File, track: Track) -> None:
+        self._owner = owner
+        self.track = track
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _HEADER_PROPERTIES:
+            return getattr(self.track, name)
+        raise AttributeError(
+            f"AsyncTrack has no attribute {name!r} (blocking Track members are "
+            "reached through .track)"
+        )
+
+    async def info(self) -> TrackInfo:
+        return await self._owner._run(self.track.info)
+
+    async def bitrate(self) -> int:
+        """``Track.bitrate``; may sum the sample sizes."""
+        return await self._owner._run(lambda: self.track.bitrate)
+
+    async def max_sample_size(self) -> int:
+        return await self._owner._run(lambda: self.track.max_sample_size)
+
+    async def sample_table(self) -> SampleTable:
+        return await self._owner._run(self.track.sample_table)
+
+    async def keyframes(self) -> Keyframes:
+        """``Track.keyframes``; the first call builds the index on the executor."""
+        return await self._owner._run(lambda: self.track.keyframes)
+
+    async def seek(self, time: int, mode: str = "prev_key") -> int:
+        return await self._owner._run(self.track.seek, time, mode)
+
+    async def read_sample(self, index: int) -> Sample:
+        return await self._owner._run(self.track.read_sample, index)
+
+    async def read_sample_into(self, index: int, buf: Any) -> SampleInfo:
+        """``Track.read_sample_into``; ``buf`` must not be resized until this returns."""
+        return await self._owner._run(self.track.read_sample_into, index, buf)
+
+    async def read_samples(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> SampleBatch:
+        return await self._owner._run(self.track.read_samples, start, stop)
+
+    async def write_samples(
+        self,
+        payload: Any,
+        sizes: Any,
+        durations: Any = None,
+        rendering_offsets: Any = None,
+        sync: Any = None,
+    ) -> None:
+        await self._owner._run(
+            self.track.write_samples,
+            payload,
+            sizes,
+            durations,
+            rendering_offsets,
+            sync,
+        )
+
+    async def iter_samples(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        step: int = 1,
+        time_range: Optional[tuple[int, int]] = None,
+        chunk: int = 64,
+    ) -> AsyncIterator[Sample]:
+        """Yield samples like ``Track.iter_samples``; each executor hop reads ``chunk`` samples."""
+        it = self.track.iter_samples(start, stop, step, time_range, chunk)
+        while True:
+            samples = await self._owner._run(lambda: list(itertools.islice(it, chunk)))
+            if not samples:
+                return
+            for sample in samples:
+                yield sample
+
+    def __aiter__(self) -> AsyncIterator[Sample]:
+        return self.iter_samples()
+
+    def __repr__(self) -> str:
+        return f"<AsyncTrack {self.track!r}>"
+
+
+class AsyncMP4File:
+    """asyncio wrapper around MP4File.
+
+    Construct, then ``await open()`` (or use ``async with``). Arguments match
+    ``MP4File``; ``executor`` defaults to the shared pool (see ``set_concurrency``).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "r",
+        *,
+        readers: int = 0,
+        padding: int = 4096,
+        load_sample_tables: bool = True,
+        mmap: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.filename = filename
+        self.mode = mode
+        self.readers = readers
+        self.padding = padding
+        self.load_sample_tables = load_sample_tables
+        self.mmap = mmap
+        self._executor = executor
+        self._file: Optional[MP4File] = None
+        self._lock_obj: Optional[asyncio.Lock] = None
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        # open / optimize / save / close replace or close the handle; never overlap them.
+        # Created lazily so it binds to the running loop (Python 3.9).
+        if self._lock_obj is None:
+            self._lock_obj = asyncio.Lock()
+        return self._lock_obj
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        executor = self._executor or default_executor()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args))
+
+    @property
+    def file(self) -> MP4File:
+        """The underlying MP4File. Raises MP4Error before ``open()``."""
+        if self._file is None:
+            raise MP4Error(f"MP4 file is not open: {self.filename}")
+        return self._file
+
+    def _open_file(self) -> MP4File:
+        mp4 = MP4File(
+            self.filename,
+            self.mode,
+            self.readers,
+            self.padding,
+            load_sample_tables=self.load_sample_tables,
+            mmap=self.mmap,
+        )
+        len(mp4.tracks)  # build the track index here, not on the loop
+        return mp4
+
+    async def open(self) -> AsyncMP4File:
+        async with self._lock:
+            if self._file is None:
+                self._file = await self._run(self._open_file)
+        return self
+
+    @property
+    def tracks(self) -> list[AsyncTrack]:
+        """Wrapped tracks. The track index is built by ``open()`` / ``optimize()``."""
+        return [AsyncTrack(self, track) for track in self.file.tracks]
+
+    async def tags(self) -> Tags:
+        """``MP4File.tags``; the first call runs ``MP4TagsFetch`` on the executor."""
+        async with self._lock:
+            return await self._run(lambda: self.file.tags)
+
+    async def optimize(
+        self,
+        new_filename: Optional[str] = None,
+        *,
+        progress: Optional[Callable[[int, int], Any]] = None,
+        chunk_size: Optional[int] = None,
+        cancel: Any = None,
+    ) -> bool:
+        # progress / cancel are called on the executor thread.
+        def run() -> bool:
+            done = self.file.optimize(
+                new_filename, progress=progress, chunk_size=chunk_size, cancel=cancel
+            )
+            if self.file.is_open():
+                len(self.file.tracks)  # the reopen dropped the track index
+            return done
+
+        async with self._lock:
+            return await self._run(run)
+
+    async def save(self) -> None:
+        async with self._lock:
+            await self._run(self.file.save)
+
+    async def checkpoint(self) -> None:
+        async with self._lock:
+            await self._run(self.file.checkpoint)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._file is not None:
+                await self._run(self._file.close)
+                self._file = None
+
+    async def __aenter__(self) -> AsyncMP4File:
+        return await self.open()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        await self.close()
+        return False
+
+    def __repr__(self) -> str:
+        state = "open" if self._file is not None and self._file.is_open() else "closed"
+        return f"<AsyncMP4File {self.filename!r} mode={self.mode!r} {state}>"
@@ -0,0 +1,401 @@
+"""Fragmented MP4 export: one init segment plus moof/mdat media segments.
+
+:class:`Fragmenter` cuts the selected tracks of an open :class:`pymp4v2.MP4File`
+into segments that start on sync samples of a reference track (the first video
+track, else the first selected track), for HLS (fMP4) or DASH packaging.
+
+Sample payloads are read one segment at a time with ``Track.read_samples``; only
+the sample tables (sizes, times, sync flags) of the selected tracks are held for
+the whole run. The init segment copies each track's sample description (``stsd``)
+and headers from the source ``moov`` on disk, so every codec mp4v2 can read is
+carried over unchanged.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Sequence, Union
+
+from ._pymp4v2 import MP4Error, MP4File, SampleTable, Track
+
+__all__ = ["Fragmenter", "Segment", "SegmentFile"]
+
+# trun sample_flags: depends on nothing / depends on others and is not a sync sample.
+_SYNC_FLAGS = 0x02000000
+_NON_SYNC_FLAGS = 0x01010000
+
+# trun flags: data-offset, sample duration, size, flags, composition offset present.
+_TRUN_FLAGS = 0x000001 | 0x000100 | 0x000200 | 0x000400
+_TRUN_CTS = 0x000800
+
+# tfhd flags: default-base-is-moof.
+_TFHD_FLAGS = 0x020000
+
+
+class Segment(NamedTuple):
+    """One media segment. ``start`` / ``duration`` are seconds on the reference track."""
+
+    index: int
+    start: float
+    duration: float
+    data: bytes
+
+
+class SegmentFile(NamedTuple):
+    """A media segment written by :meth:`Fragmenter.write_files`."""
+
+    index: int
+    start: float
+    duration: float
+    path: str
+
+
+def _header(kind: bytes, payload_size: int) -> bytes:
+    size = payload_size + 8
+    if size > 0xFFFFFFFF:
+        return struct.pack(">I4sQ", 1, kind, size + 8)
+    return struct.pack(">I4s", size, kind)
+
+
+def _box(kind: bytes, *parts: bytes) -> bytes:
+    payload = b"".join(parts)
+    return _header(kind, len(payload)) + payload
+
+
+def _full_box(kind: bytes, version: int, flags: int, *parts: bytes) -> bytes:
+    return _box(kind, struct.pack(">I", version << 24 | flags), *parts)
+
+
+def _children(
+    f: BinaryIO, start: int, end: int
+) -> Iterator[tuple[bytes, int, int, int]]:
+    """(type, start, header size, end) of each box in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", f.read(8))
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise MP4Error(f"Malformed '{kind.decode('latin-1')}' box at {pos}")
+        yield kind, pos, header, pos + size
+        pos += size
+
+
+def _read(f: BinaryIO, start: int, end: int) -> bytes:
+    f.seek(start)
+    return f.read(end - start)
+
+
+def _without_duration(
+    f: BinaryIO, start: int, header: int, end: int, v0: int, v1: int
+) -> bytes:
+    # mvhd / tkhd / mdhd with the duration cleared; fragments carry the timing.
+    box = bytearray(_read(f, start, end))
+    if box[header] == 1:
+        box[header + v1 : header + v1 + 8] = bytes(8)
+    else:
+        box[header + v0 : header + v0 + 4] = bytes(4)
+    return bytes(box)
+
+
+def _init_stbl(f: BinaryIO, start: int, header: int, end: int) -> bytes:
+    stsd = next(
+        (
+            _read(f, s, e)
+            for kind, s, _, e in _children(f, start + header, end)
+            if kind == b"stsd"
+        ),
+        None,
+    )
+    if stsd is None:
+        raise MP4Error("Track has no stsd box")
+    empty = struct.pack(">I", 0)
+    return _box(
+        b"stbl",
+        stsd,
+        _full_box(b"stts", 0, 0, empty),
+        _full_box(b"stsc", 0, 0, empty),
+        _full_box(b"stsz", 0, 0, empty, empty),
+        _full_box(b"stco", 0, 0, empty),
+    )
+
+
+def _init_container(
+    f: BinaryIO, kind: bytes, start: int, header: int, end: int
+) -> bytes:
+    # trak / mdia / minf with headers copied and the sample tables emptied.
+    parts = []
+    for child, s, h, e in _children(f, start + header, end):
+        if child == b"tkhd":
+            parts.append(_without_duration(f, s, h, e, 20, 28))
+        elif child == b"mdhd":
+            parts.append(_without_duration(f, s, h, e, 16, 24))
+        elif child in (b"mdia", b"minf"):
+            parts.append(_init_container(f, child, s, h, e))
+        elif child == b"stbl":
+            parts.append(_init_stbl(f, s, h, e))
+        else:
+            parts.append(_read(f, s, e))
+    return _box(kind, *parts)
+
+
+def _traf(
+    track_id: int,
+    base_time: int,
+    count: int,
+    data_offset: int,
+    version: int,
+    flags: int,
+    entries: bytes,
+) -> bytes:
+    return _box(
+        b"traf",
+        _full_box(b"tfhd", 0, _TFHD_FLAGS, struct.pack(">I", track_id)),
+        _full_box(b"tfdt", 1, 0, struct.pack(">Q", base_time)),
+        _full_box(
+            b"trun", version, flags, struct.pack(">Ii", count, data_offset), entries
+        ),
+    )
+
+
+def _trun_entries(table: SampleTable, first: int, stop: int) -> tuple[int, int, bytes]:
+    # (trun version, flags, big-endian per-sample duration / size / flags
+    # [/ cts offset]).
+    offsets = table.renderingOffsets[first:stop].tolist()
+    columns = [
+        table.durations[first:stop].tolist(),
+        table.sizes[first:stop].tolist(),
+        [_SYNC_FLAGS if s else _NON_SYNC_FLAGS for s in table.syncFlags[first:stop]],
+    ]
+    version = 0
+    flags = _TRUN_FLAGS
+    if any(offsets):
+        offsets = [o & 0xFFFFFFFF for o in offsets]
+        # Version 0 offsets are unsigned; a set bit 31 needs version 1 (signed).
+        if any(o & 0x80000000 for o in offsets):
+            version = 1
+        columns.append(offsets)
+        flags |= _TRUN_CTS
+    entries = array("I", bytes(4 * len(columns) * (stop - first)))
+    for k, column in enumerate(columns):
+        entries[k :: len(columns)] = array("I", column)
+    if sys.byteorder == "little":
+        entries.byteswap()
+    return version, flags, entries.tobytes()
+
+
+class Fragmenter:
+    """Cut ``tracks`` of ``mp4`` into segments of about ``segment_duration`` seconds.
+
+    Args:
+        mp4: Open file with sample tables loaded. The init segment is built
+            from the file on disk, so ``save()`` pending writes first; files
+            opened with ``from_buffer`` / ``from_fileobj`` can be segmented but
+            have no init segment.
+        segment_duration: Target length; segments start at the first sync
+            sample of the reference track at or after each multiple of it.
+        tracks: 0-based indices or :class:`Track` objects (default: every
+            non-hint track).
+
+    Raises:
+        ValueError: ``segment_duration`` is not positive or no track is selected.
+        MP4Error: A sample table cannot be read (e.g. ``load_sample_tables=False``).
+    """
+
+    def __init__(
+        self,
+        mp4: MP4File,
+        segment_duration: float = 6.0,
+        tracks: Optional[Sequence[Union[int, Track]]] = None,
+    ) -> None:
+        if segment_duration <= 0:
+            raise ValueError("segment_duration must be positive")
+        if tracks is None:
+            selected = [t for t in mp4.tracks if t.type != "hint"]
+        else:
+            selected = [mp4.tracks[t] if isinstance(t, int) else t for t in tracks]
+        if not selected:
+            raise ValueError("no tracks to fragment")
+        self.mp4 = mp4
+        self.segment_duration = segment_duration
+        self.tracks = selected
+        self.reference = next((t for t in selected if t.type == "vide"), selected[0])
+        self._tables: list[SampleTable] = [t.sample_table() for t in selected]
+        self._cuts = self._reference_cuts()
+
+    def _reference_cuts(self) -> list[int]:
+        # Decode times (reference timescale) at which segments 1.. start.
+        keyframes = self.reference.keyframes
+        step = max(1, round(self.segment_duration * self.reference.timescale))
+        cuts = []
+        target = step
+        for index, time in zip(keyframes.indices, keyframes.times):
+            if index and time >= target:
+                cuts.append(time)
+                target = (time // step + 1) * step
+        return cuts
+
+    def init_segment(self) -> bytes:
+        """ftyp + moov (mvhd, one trak per track with empty sample tables, mvex).
+
+        Raises:
+            MP4Error: ``mp4`` has no file on disk (``from_buffer`` /
+                ``from_fileobj``), or has no moov box.
+        """
+        # fileobj.name may point at an unrelated file, so never open it here.
+        if not self.mp4.has_path:
+            raise MP4Error(f"init_segment needs a file path: {self.mp4.filename}")
+        ids = {t.id for t in self.tracks}
+        traks = {}
+        with open(self.mp4.filename, "rb") as f:
+            top = {
+                kind: (s, h, e)
+                for kind, s, h, e in _children(f, 0, os.fstat(f.fileno()).st_size)
+            }
+            if b"moov" not in top:
+                raise MP4Error(f"No moov box in {self.mp4.filename}")
+            start, header, end = top[b"moov"]
+            mvhd = b""
+            for kind, s, h, e in _children(f, start + header, end):
+                if kind == b"mvhd":
+                    mvhd = _without_duration(f, s, h, e, 16, 24)
+                elif kind == b"trak":
+                    tkhd = next(c for c in _children(f, s + h, e) if c[0] == b"tkhd")
+                    version = _read(f, tkhd[1] + tkhd[2], tkhd[1] + tkhd[2] + 1)[0]
+                    id_at = tkhd[1] + tkhd[2] + (20 if version == 1 else 12)
+                    (track_id,) = struct.unpack(">I", _read(f, id_at, id_at + 4))
+                    if track_id in ids:
+                        traks[track_id] = _init_container(f, b"trak", s, h, e)
+        missing = ids - traks.keys()
+        if not mvhd or missing:
+            raise MP4Error(
+                f"moov of {self.mp4.filename} on disk lacks mvhd or tracks {sorted(missing)}"
+            )
+        trex = [
+            _full_box(b"trex", 0, 0, struct.pack(">5I", t.id, 1, 0, 0, 0))
+            for t in self.tracks
+        ]
+        return _box(b"ftyp", b"iso6", struct.pack(">I", 0), b"iso6mp41") + _box(
+            b"moov",
+            mvhd,
+            *(traks[t.id] for t in self.tracks),
+            _box(b"mvex", *trex),
+        )
+
+    def _spans(self) -> Iterator[list[tuple[int, int]]]:
+        # Per segment, the [first, stop) sample range of every track.
+        rts = self.reference.timescale
+        firsts = [0] * len(self.tracks)
+        for cut in [*self._cuts, None]:
+            spans = []
+            for i, (track, table) in enumerate(zip(self.tracks, self._tables)):
+                if cut is None:
+                    stop = len(table)
+                else:
+                    # Samples decoded before the cut: start / tts < cut / rts.
+                    stop = bisect_left(
+                        table.startTimes, -(-cut * track.timescale // rts)
+                    )
+                spans.append((firsts[i], stop))
+                firsts[i] = stop
+            yield spans
+
+    def __iter__(self) -> Iterator[Segment]:
+        ref = self.tracks.index(self.reference)
+        ref_table = self._tables[ref]
+        rts = self.reference.timescale
+        sequence = 0
+        for spans in self._spans():
+            if all(first == stop for first, stop in spans):
+                continue
+            sequence += 1
+            runs = []
+            payloads = []
+            for track, table, (first, stop) in zip(self.tracks, self._tables, spans):
+                if first == stop:
+                    continue
+                version, flags, entries = _trun_entries(table, first, stop)
+                runs.append(
+                    (
+                        track.id,
+                        table.startTimes[first],
+                        stop - first,
+                        version,
+                        flags,
+                        entries,
+                    )
+                )
+                payloads.append(track.read_samples(first, stop).data)
+
+            # trun data offsets are relative to the moof start, so size the moof first.
+            mfhd = _full_box(b"mfhd", 0, 0, struct.pack(">I", sequence))
+            moof_size = 8 + len(mfhd)
+            for track_id, base, count, version, flags, entries in runs:
+                moof_size += len(
+                    _traf(track_id, base, count, 0, version, flags, entries)
+                )
+            mdat_header = _header(b"mdat", sum(len(p) for p in payloads))
+            offset = moof_size + len(mdat_header)
+            trafs = []
+            for run, payload in zip(runs, payloads):
+                track_id, base, count, version, flags, entries = run
+                trafs.append(
+                    _traf(track_id, base, count, offset, version, flags, entries)
+                )
+                offset += len(payload)
+            moof = _box(b"moof", mfhd, *trafs)
+
+            first, stop = spans[ref]
+            start = ref_table.startTimes[first] if first < len(ref_table) else 0
+            if stop < len(ref_table):
+                end = ref_table.startTimes[stop]
+            elif stop:
+                end = ref_table.startTimes[stop - 1] + ref_table.durations[stop - 1]
+            else:
+                end = start
+            yield Segment(
+                sequence - 1,
+                start / rts,
+                (end - start) / rts,
+                b"".join([moof, mdat_header, *payloads]),
+            )
+
+    def write(self, out: BinaryIO) -> int:
+        """Write the init segment and every media segment to ``out`` as one
+        fragmented MP4; returns the number of media segments."""
+        out.write(self.init_segment())
+        count = 0
+        for segment in self:
+            out.write(segment.data)
+            count += 1
+        return count
+
+    def write_files(
+        self,
+        directory: str,
+        init_name: str = "init.mp4",
+        segment_name: str = "segment_{index:05d}.m4s",
+    ) -> list[SegmentFile]:
+        """Write ``init_name`` and one file per segment (``segment_name`` is
+        formatted with the 0-based ``index``) into ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, init_name), "wb") as f:
+            f.write(self.init_segment())
+        written = []
+        for segment in self:
+            path = os.path.join(directory, segment_name.format(index=segment.index))
+            with open(path, "wb") as f:
+                f.write(segment.data)
+            written.append(
+                SegmentFile(segment.index, segment.start, segment.duration, path)
+            )
+        return written
@@ -1,6 +1,7 @@
 """1:1 stubs for the bound subset of the MP4v2 C API.
 
-C names are kept. Sample payloads and artwork are ``bytes``. C failures
+C names are kept. Sample payloads are read-only ``memoryview``s; artwork is
+``bytes``. C failures
 (``false`` / ``MP4_INVALID_*``) raise ``MP4Error``, except predicates such as
 ``MP4HaveAtom``.
 """
@@ -9,7 +10,7 @@ from __future__ import annotations
 
 import enum
 from types import TracebackType
-from typing import Iterator, Optional, Sequence, Union
+from typing import Iterable, Iterator, Optional, Sequence, Union, overload
 
 from . import MP4Error as MP4Error
 
@@ -103,15 +104,85 @@ class MP4FileHandle:
     ) -> bool: ...
 
 class MP4Sample:
-    """One sample from MP4ReadSample: data (bytes) plus timing fields."""
+    """One sample from MP4ReadSample: data (read-only memoryview) plus timing fields."""
 
     @property
-    def data(self) -> bytes: ...
+    def data(self) -> memoryview: ...
+    startTime: int
+    duration: int
+    renderingOffset: int
+    isSyncSample: bool
+    def __iter__(self) -> Iterator[Union[memoryview, int, bool]]: ...
+
+class MP4SampleInfo:
+    """Byte count and timing from MP4ReadSampleInto (payload is in the caller buffer)."""
+
+    numBytes: int
     startTime: int
     duration: int
     renderingOffset: int
     isSyncSample: bool
-    def __iter__(self) -> Iterator[Union[bytes, int, bool]]: ...
+    def __iter__(self) -> Iterator[Union[int, bool]]: ...
+
+class MP4SampleBatch:
+    """Consecutive samples from MP4ReadSamples: one packed payload plus arrays."""
+
+    firstSampleId: int
+    @property
+    def data(self) -> memoryview: ...
+    @property
+    def offsets(self) -> memoryview: ...
+    @property
+    def sizes(self) -> memoryview: ...
+    @property
+    def startTimes(self) -> memoryview: ...
+    @property
+    def durations(self) -> memoryview: ...
+    @property
+    def renderingOffsets(self) -> memoryview: ...
+    @property
+    def syncFlags(self) -> memoryview: ...
+    def __len__(self) -> int: ...
+
+class MP4SampleTable:
+    """Per-sample index of a whole track from MP4GetSampleTable; entry i is sample i + 1."""
+
+    @property
+    def sizes(self) -> memoryview: ...
+    @property
+    def offsets(self) -> memoryview: ...
+    @property
+    def startTimes(self) -> memoryview: ...
+    @property
+    def durations(self) -> memoryview: ...
+    @property
+    def renderingOffsets(self) -> memoryview: ...
+    @property
+    def syncFlags(self) -> memoryview: ...
+    def __len__(self) -> int: ...
+
+class MP4Atom:
+    """Box of an MP4 file read from its header on disk; children are parsed on first access."""
+
+    @property
+    def type(self) -> str: ...
+    @property
+    def offset(self) -> int: ...
+    @property
+    def size(self) -> int: ...
+    @property
+    def header_size(self) -> int: ...
+    @property
+    def is_container(self) -> bool: ...
+    @property
+    def children(self) -> list[MP4Atom]: ...
+    def find(self, path: str) -> Optional[MP4Atom]: ...
+    @overload
+    def __getitem__(self, index: int) -> MP4Atom: ...
+    @overload
+    def __getitem__(self, path: str) -> MP4Atom: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[MP4Atom]: ...
 
 class MP4TagArtwork:
     """Artwork item: data is a copy as bytes, type is MP4TagArtworkType."""
@@ -271,6 +342,7 @@ def MP4Modify(fileName: str, flags: int = 0) -> MP4FileHandle: ...
 def MP4Close(hFile: MP4FileHandle, flags: int = 0) -> None: ...
 def MP4Dump(hFile: MP4FileHandle, dumpImplicits: bool = False) -> bool: ...
 def MP4GetFilename(hFile: MP4FileHandle) -> str: ...
+def MP4AtomTree(hFile: MP4FileHandle) -> MP4Atom: ...
 def MP4Info(hFile: MP4FileHandle, trackId: int = ...) -> Optional[str]: ...
 def MP4FileInfo(fileName: str, trackId: int = ...) -> Optional[str]: ...
 def MP4Optimize(fileName: str, newFileName: Optional[str] = None) -> bool: ...
@@ -283,6 +355,19 @@ def MP4FindTrackId(
 ) -> int: ...
 def MP4GetTrackType(hFile: MP4FileHandle, trackId: int) -> str: ...
 def MP4DeleteTrack(hFile: MP4FileHandle, trackId: int) -> None: ...
+def MP4CloneTrack(
+    srcFile: MP4FileHandle,
+    srcTrackId: int,
+    dstFile: Optional[MP4FileHandle] = None,
+    dstHintTrackReferenceTrack: int = ...,
+) -> int: ...
+def MP4CopyTrack(
+    srcFile: MP4FileHandle,
+    srcTrackId: int,
+    dstFile: Optional[MP4FileHandle] = None,
+    applyEdits: bool = False,
+    dstHintTrackReferenceTrack: int = ...,
+) -> int: ...
 def MP4AddAudioTrack(
     hFile: MP4FileHandle,
     timeScale: int,
@@ -318,7 +403,9 @@ def MP4GetBytesProperty(hFile: MP4FileHandle, propName: str) -> bytes: ...
 def MP4SetIntegerProperty(hFile: MP4FileHandle, propName: str, value: int) -> None: ...
 def MP4SetFloatProperty(hFile: MP4FileHandle, propName: str, value: float) -> None: ...
 def MP4SetStringProperty(hFile: MP4FileHandle, propName: str, value: str) -> None: ...
-def MP4SetBytesProperty(hFile: MP4FileHandle, propName: str, pValue: bytes) -> None: ...
+def MP4SetBytesProperty(
+    hFile: MP4FileHandle, propName: str, pValue: Union[bytes, bytearray, memoryview]
+) -> None: ...
 def MP4HaveTrackAtom(hFile: MP4FileHandle, trackId: int, atomName: str) -> bool: ...
 def MP4GetTrackMediaDataName(hFile: MP4FileHandle, trackId: int) -> str: ...
 def MP4GetTrackFixedSampleDuration(hFile: MP4FileHandle, trackId: int) -> int: ...
@@ -327,7 +414,7 @@ def MP4GetTrackVideoFrameRate(hFile: MP4FileHandle, trackId: int) -> float: ...
 def MP4GetTrackAudioChannels(hFile: MP4FileHandle, trackId: int) -> int: ...
 def MP4GetTrackESConfiguration(hFile: MP4FileHandle, trackId: int) -> bytes: ...
 def MP4SetTrackESConfiguration(
-    hFile: MP4FileHandle, trackId: int, pConfig: bytes
+    hFile: MP4FileHandle, trackId: int, pConfig: Union[bytes, bytearray, memoryview]
 ) -> None: ...
 def MP4GetTrackIntegerProperty(
     hFile: MP4FileHandle, trackId: int, propName: str
@@ -351,20 +438,39 @@ def MP4SetTrackStringProperty(
     hFile: MP4FileHandle, trackId: int, propName: str, value: str
 ) -> None: ...
 def MP4SetTrackBytesProperty(
-    hFile: MP4FileHandle, trackId: int, propName: str, pValue: bytes
+    hFile: MP4FileHandle,
+    trackId: int,
+    propName: str,
+    pValue: Union[bytes, bytearray, memoryview],
 ) -> None: ...
 def MP4ReadSample(hFile: MP4FileHandle, trackId: int, sampleId: int) -> MP4Sample: ...
+def MP4ReadSampleInto(
+    hFile: MP4FileHandle, trackId: int, sampleId: int, buf: Union[bytearray, memoryview]
+) -> MP4SampleInfo: ...
+def MP4ReadSamples(
+    hFile: MP4FileHandle, trackId: int, firstSampleId: int, numSamples: int
+) -> MP4SampleBatch: ...
+def MP4GetSampleTable(hFile: MP4FileHandle, trackId: int) -> MP4SampleTable: ...
 def MP4ReadSampleFromTime(
     hFile: MP4FileHandle, trackId: int, when: int
 ) -> MP4Sample: ...
 def MP4WriteSample(
     hFile: MP4FileHandle,
     trackId: int,
-    pBytes: bytes,
+    pBytes: Union[bytes, bytearray, memoryview],
     duration: int = ...,
     renderingOffset: int = 0,
     isSyncSample: bool = True,
 ) -> None: ...
+def MP4WriteSamples(
+    hFile: MP4FileHandle,
+    trackId: int,
+    payload: Union[bytes, bytearray, memoryview],
+    sizes: Iterable[int],
+    durations: Optional[Iterable[int]] = None,
+    renderingOffsets: Optional[Iterable[int]] = None,
+    syncFlags: Optional[Iterable[int]] = None,
+) -> None: ...
 def MP4CopySample(
     srcFile: MP4FileHandle,
     srcTrackId: int,
@@ -373,6 +479,14 @@ def MP4CopySample(
     dstTrackId: int = ...,
     dstSampleDuration: int = ...,
 ) -> None: ...
+def MP4CopySamples(
+    srcFile: MP4FileHandle,
+    srcTrackId: int,
+    firstSampleId: int,
+    numSamples: int,
+    dstFile: Optional[MP4FileHandle] = None,
+    dstTrackId: int = ...,
+) -> None: ...
 def MP4GetSampleSize(hFile: MP4FileHandle, trackId: int, sampleId: int) -> int: ...
 def MP4GetSampleIdFromTime(
     hFile: MP4FileHandle, trackId: int, when: int, wantSyncSample: bool = False
@@ -388,10 +502,15 @@ def MP4TagsFetch(tags: MP4Tags, hFile: MP4FileHandle) -> None: ...
 def MP4TagsStore(tags: MP4Tags, hFile: MP4FileHandle) -> None: ...
 def MP4TagsHasMetadata(tags: MP4Tags) -> bool: ...
 def MP4TagsAddArtwork(
-    tags: MP4Tags, data: bytes, type: MP4TagArtworkType_e = ...
+    tags: MP4Tags,
+    data: Union[bytes, bytearray, memoryview],
+    type: MP4TagArtworkType_e = ...,
 ) -> None: ...
 def MP4TagsSetArtwork(
-    tags: MP4Tags, index: int, data: bytes, type: MP4TagArtworkType_e = ...
+    tags: MP4Tags,
+    index: int,
+    data: Union[bytes, bytearray, memoryview],
+    type: MP4TagArtworkType_e = ...,
 ) -> None: ...
 def MP4TagsRemoveArtwork(tags: MP4Tags, index: int) -> None: ...
 def MP4TagsSetName(tags: MP4Tags, value: Optional[str] = None) -> None: ...
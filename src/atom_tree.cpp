@@ -0,0 +1,307 @@
+#include "pymp4v2/atom_tree.h"
+
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <mutex>
+
+#include "pymp4v2/error.h"
+
+namespace raw
+{
+    struct MP4Atom::Stream
+    {
+        std::string filename;
+        std::ifstream in;
+        std::mutex mutex;
+    };
+
+    namespace
+    {
+        // Containers whose children start right after the header, or after the fields
+        // of a full box / sample entry.
+        struct ContainerType
+        {
+            const char *type;
+            uint32_t childOffset;
+        };
+
+        constexpr ContainerType kContainers[] = {
+            {"moov", 0}, {"trak", 0}, {"tref", 0}, {"edts", 0}, {"mdia", 0}, {"minf", 0}, {"dinf", 0},
+            {"stbl", 0}, {"mvex", 0}, {"moof", 0}, {"traf", 0}, {"mfra", 0}, {"udta", 0}, {"ilst", 0},
+            {"sinf", 0}, {"schi", 0}, {"stsd", 8}, {"dref", 8},
+            // Sample entries: 8 bytes of SampleEntry plus the audio / visual fields.
+            {"mp4a", 28}, {"enca", 28}, {"alac", 28}, {"ac-3", 28}, {"ec-3", 28}, {"Opus", 28}, {"fLaC", 28},
+            {"avc1", 78}, {"avc3", 78}, {"hvc1", 78}, {"hev1", 78}, {"encv", 78}, {"mp4v", 78}, {"av01", 78},
+            {"vp09", 78},
+        };
+
+        // Child offset of `atom` inside `parent`, or nullopt for a leaf box.
+        std::optional<uint32_t> child_offset(std::istream &in, const std::string &parent, const atoms::Atom &atom)
+        {
+            if (parent == "ilst")
+            {
+                return 0u; // metadata items hold data / mean / name boxes
+            }
+            if (atom.type == "meta")
+            {
+                // ISO meta is a full box; QuickTime's starts straight with a child size.
+                if (atom.size < atom.header + 4u)
+                {
+                    return std::nullopt;
+                }
+                const std::string head = atoms::read_bytes(in, atom.body(), 4);
+                return atoms::load_be(reinterpret_cast<const unsigned char *>(head.data()), 4) == 0 ? 4u : 0u;
+            }
+            for (const auto &c : kContainers)
+            {
+                if (atom.type == c.type)
+                {
+                    return c.childOffset;
+                }
+            }
+            return std::nullopt;
+        }
+
+        // Four-character codes are bytes; show bytes above 0x7f as Latin-1.
+        std::string type_name(const std::string &fourcc)
+        {
+            std::string name;
+            for (const char ch : fourcc)
+            {
+                const auto c = static_cast<unsigned char>(ch);
+                if (c < 0x80)
+                {
+                    name += static_cast<char>(c);
+                }
+                else
+                {
+                    name += static_cast<char>(0xc0 | (c >> 6));
+                    name += static_cast<char>(0x80 | (c & 0x3f));
+                }
+            }
+            return name;
+        }
+
+        std::string describe(const std::string &type, uint64_t offset)
+        {
+            return type.empty() ? std::string("top-level atoms")
+                                : "'" + type + "' atom at offset " + std::to_string(offset);
+        }
+    } // namespace
+
+    MP4Atom::MP4Atom(std::shared_ptr<Stream> stream, atoms::Atom atom, std::optional<uint32_t> childOffset)
+        : stream_(std::move(stream)), atom_(std::move(atom)), type_(type_name(atom_.type)), child_offset_(childOffset)
+    {
+    }
+
+    std::shared_ptr<MP4Atom> MP4Atom::open(const std::string &filename)
+    {
+        auto stream = std::make_shared<Stream>();
+        stream->filename = filename;
+        stream->in.open(filename, std::ios::binary);
+        if (!stream->in)
+        {
+            throw MP4Error("Failed to open MP4 file: " + filename);
+        }
+        atoms::Atom root;
+        root.size = atoms::file_size(stream->in);
+        root.header = 0;
+        return std::shared_ptr<MP4Atom>(new MP4Atom(std::move(stream), root, 0u));
+    }
+
+    const std::string &MP4Atom::type() const
+    {
+        return type_;
+    }
+
+    uint64_t MP4Atom::offset() const
+    {
+        return atom_.start;
+    }
+
+    uint64_t MP4Atom::size() const
+    {
+        return atom_.size;
+    }
+
+    uint32_t MP4Atom::header_size() const
+    {
+        return atom_.header;
+    }
+
+    bool MP4Atom::is_container() const
+    {
+        return child_offset_.has_value();
+    }
+
+    const std::vector<std::shared_ptr<MP4Atom>> &MP4Atom::children()
+    {
+        if (children_)
+        {
+            return *children_;
+        }
+        std::vector<std::shared_ptr<MP4Atom>> nodes;
+        if (child_offset_ && atom_.size >= atom_.header + uint64_t{*child_offset_})
+        {
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(stream_->mutex);
+            auto &in = stream_->in;
+            in.clear();
+            const auto found = atoms::read_atoms(in, atom_.body() + *child_offset_, atom_.end());
+            if (!found)
+            {
+                throw MP4Error("Malformed " + describe(type_, atom_.start) + " in " + stream_->filename);
+            }
+            nodes.reserve(found->size());
+            for (const auto &child : *found)
+            {
+                const auto offset = child_offset(in, atom_.type, child);
+                nodes.push_back(std::shared_ptr<MP4Atom>(new MP4Atom(stream_, child, offset)));
+            }
+        }
+        // Another thread may have filled the cache while the GIL was released.
+        if (!children_)
+        {
+            children_ = std::move(nodes);
+        }
+        return *children_;
+    }
+
+    std::shared_ptr<MP4Atom> MP4Atom::find(const std::string &path)
+    {
+        std::shared_ptr<MP4Atom> node;
+        MP4Atom *current = this;
+        std::size_t pos = 0;
+        while (pos <= path.size())
+        {
+            const std::size_t dot = std::min(path.find('.', pos), path.size());
+            std::string segment = path.substr(pos, dot - pos);
+            pos = dot + 1;
+
+            long long index = 0;
+            const std::size_t bracket = segment.find('[');
+            if (bracket != std::string::npos)
+            {
+                std::size_t used = 0;
+                const std::string digits = segment.substr(bracket + 1, segment.size() - bracket - 2);
+                try
+                {
+                    index = std::stoll(digits, &used);
+                }
+                catch (const std::exception &)
+                {
+                    used = std::string::npos;
+                }
+                if (segment.back() != ']' || used != digits.size())
+                {
+                    throw MP4Error("Bad atom path segment '" + segment + "' in '" + path + "'");
+                }
+                segment.resize(bracket);
+            }
+            if (segment.empty())
+            {
+                throw MP4Error("Bad atom path '" + path + "'");
+            }
+
+            std::vector<std::shared_ptr<MP4Atom>> matches;
+            for (const auto &child : current->children())
+            {
+                if (child->type() == segment)
+                {
+                    matches.push_back(child);
+                }
+            }
+            const auto count = static_cast<long long>(matches.size());
+            if (index < 0)
+            {
+                index += count;
+            }
+            if (index < 0 || index >= count)
+            {
+                return nullptr;
+            }
+            node = matches[static_cast<std::size_t>(index)];
+            current = node.get();
+        }
+        return node;
+    }
+
+    std::shared_ptr<MP4Atom> MP4AtomTree_wrapper(MP4FileHandleWrapper &hFile)
+    {
+        const char *filename = MP4GetFilename(hFile.get());
+        if (filename == nullptr)
+        {
+            throw MP4Error("MP4AtomTree: handle has no filename");
+        }
+        return MP4Atom::open(filename);
+    }
+
+    void bind_atom_tree(py::module_ &m_raw)
+    {
+        py::class_<MP4Atom, std::shared_ptr<MP4Atom>>(
+            m_raw, "MP4Atom",
+            "Box of an MP4 file read from its header on disk; children are parsed on first access.")
+            .def_property_readonly("type", &MP4Atom::type, "Four-character code ('' for the root).")
+            .def_property_readonly("offset", &MP4Atom::offset, "File offset of the box header.")
+            .def_property_readonly("size", &MP4Atom::size, "Size in bytes, header included.")
+            .def_property_readonly("header_size", &MP4Atom::header_size, "8, or 16 with a 64-bit largesize.")
+            .def_property_readonly("is_container", &MP4Atom::is_container)
+            .def_property_readonly("children", [](MP4Atom &self) { return self.children(); },
+                                   "List of child boxes, parsed on first access.")
+            .def("find", &MP4Atom::find, py::arg("path"),
+                 R"doc(
+    Box at a dotted ``path`` below this one, e.g. ``"moov.trak[1].mdia.minf.stbl.stsz"``,
+    or None. ``type[i]`` picks the i-th child of that type (0-based, negative counts from
+    the end); a bare type means ``[0]``. Only the boxes along the path are parsed.
+)doc")
+            .def("__getitem__",
+                 [](MP4Atom &self, py::ssize_t index)
+                 {
+                     const auto &children = self.children();
+                     const auto count = static_cast<py::ssize_t>(children.size());
+                     if (index < 0)
+                     {
+                         index += count;
+                     }
+                     if (index < 0 || index >= count)
+                     {
+                         throw py::index_error();
+                     }
+                     return children[static_cast<std::size_t>(index)];
+                 })
+            .def("__getitem__",
+                 [](MP4Atom &self, const std::string &path)
+                 {
+                     auto node = self.find(path);
+                     if (!node)
+                     {
+                         throw py::key_error(path);
+                     }
+                     return node;
+                 })
+            .def("__len__", [](MP4Atom &self) { return self.children().size(); })
+            .def(
+                "__iter__",
+                [](MP4Atom &self)
+                {
+                    const auto &children = self.children();
+                    return py::make_iterator(children.begin(), children.end());
+                },
+                py::keep_alive<0, 1>())
+            .def("__repr__",
+                 [](const MP4Atom &self)
+                 {
+                     return "<MP4Atom '" + self.type() + "' offset=" + std::to_string(self.offset()) +
+                            " size=" + std::to_string(self.size()) + ">";
+                 });
+
+        m_raw.def("MP4AtomTree", &MP4AtomTree_wrapper, py::arg("hFile"),
+                  R"doc(
+    Root MP4Atom of the file behind ``hFile``, read from the atom headers on disk instead of
+    printed like ``MP4Dump``. Iterating, indexing or ``find()`` parse only the headers of
+    the boxes visited. On a create/modify handle the tree shows the file as last written;
+    mp4v2 writes moov on ``MP4Close``.
+)doc");
+    }
+} // namespace raw
@@ -0,0 +1,123 @@
+#include "pymp4v2/atoms.h"
+
+#include <cstring>
+
+#include "pymp4v2/error.h"
+
+namespace atoms
+{
+    uint64_t load_be(const unsigned char *p, int n)
+    {
+        uint64_t value = 0;
+        for (int i = 0; i < n; ++i)
+        {
+            value = (value << 8) | p[i];
+        }
+        return value;
+    }
+
+    void store_be(unsigned char *p, uint64_t value, int n)
+    {
+        for (int i = n - 1; i >= 0; --i)
+        {
+            p[i] = static_cast<unsigned char>(value & 0xff);
+            value >>= 8;
+        }
+    }
+
+    uint64_t file_size(std::istream &in)
+    {
+        in.seekg(0, std::ios::end);
+        return static_cast<uint64_t>(in.tellg());
+    }
+
+    std::optional<std::vector<Atom>> read_atoms(std::istream &in, uint64_t begin, uint64_t end)
+    {
+        std::vector<Atom> atoms;
+        uint64_t pos = begin;
+        while (pos < end)
+        {
+            if (end - pos < 8)
+            {
+                return std::nullopt;
+            }
+            unsigned char h[16];
+            in.seekg(static_cast<std::streamoff>(pos));
+            in.read(reinterpret_cast<char *>(h), 8);
+            if (!in)
+            {
+                return std::nullopt;
+            }
+            Atom atom;
+            atom.start = pos;
+            atom.size = load_be(h, 4);
+            atom.header = 8;
+            atom.type.assign(reinterpret_cast<const char *>(h + 4), 4);
+            if (atom.size == 1)
+            {
+                in.read(reinterpret_cast<char *>(h + 8), 8);
+                if (!in)
+                {
+                    return std::nullopt;
+                }
+                atom.size = load_be(h + 8, 8);
+                atom.header = 16;
+            }
+            else if (atom.size == 0)
+            {
+                atom.size = end - pos;
+            }
+            if (atom.size < atom.header || atom.size > end - pos)
+            {
+                return std::nullopt;
+            }
+            atoms.push_back(atom);
+            pos += atom.size;
+        }
+        return atoms;
+    }
+
+    const Atom *find_atom(const std::vector<Atom> &atoms, const char *type)
+    {
+        for (const auto &atom : atoms)
+        {
+            if (atom.type == type)
+            {
+                return &atom;
+            }
+        }
+        return nullptr;
+    }
+
+    bool leads_to_stbl(const std::string &type)
+    {
+        return type == "trak" || type == "mdia" || type == "minf" || type == "stbl";
+    }
+
+    std::string make_header(const std::string &type, uint64_t bodySize)
+    {
+        unsigned char h[16];
+        if (bodySize <= UINT32_MAX - 8)
+        {
+            store_be(h, bodySize + 8, 4);
+            std::memcpy(h + 4, type.data(), 4);
+            return std::string(reinterpret_cast<const char *>(h), 8);
+        }
+        store_be(h, 1, 4);
+        std::memcpy(h + 4, type.data(), 4);
+        store_be(h + 8, bodySize + 16, 8);
+        return std::string(reinterpret_cast<const char *>(h), 16);
+    }
+
+    std::string read_bytes(std::istream &in, uint64_t start, uint64_t size)
+    {
+        std::string bytes(static_cast<std::size_t>(size), '\0');
+        in.seekg(static_cast<std::streamoff>(start));
+        in.read(&bytes[0], static_cast<std::streamsize>(size));
+        if (!in)
+        {
+            throw MP4Error("Failed to read atom data");
+        }
+        return bytes;
+    }
+} // namespace atoms
@@ -0,0 +1,146 @@
+#include "pymp4v2/buffer.h"
+
+#include <cstring>
+#include <string>
+#include <type_traits>
+
+#include "mp4v2/mp4v2.h"
+#include "pymp4v2/error.h"
+
+namespace py = pybind11;
+
+namespace raw
+{
+    namespace
+    {
+        template <typename T>
+        void bind_native_array(py::module_ &m_raw, const char *name)
+        {
+            py::class_<NativeArray<T>>(m_raw, name, py::buffer_protocol(),
+                                       "Read-only native array; use memoryview() or numpy.asarray().")
+                .def_buffer(
+                    [](const NativeArray<T> &self)
+                    {
+                        // memoryview needs a non-null pointer even for zero-length arrays.
+                        static const T empty{};
+                        const T *ptr = self.size() > 0 ? self.data() : &empty;
+                        return py::buffer_info(const_cast<T *>(ptr), static_cast<py::ssize_t>(sizeof(T)),
+                                               py::format_descriptor<T>::format(), 1,
+                                               {static_cast<py::ssize_t>(self.size())},
+                                               {static_cast<py::ssize_t>(sizeof(T))}, true);
+                    })
+                .def("__len__", &NativeArray<T>::size);
+        }
+
+        template <typename T>
+        uint64_t load_uint(const uint8_t *p, std::size_t i, const char *what)
+        {
+            T value;
+            std::memcpy(&value, p + i * sizeof(T), sizeof(T));
+            if constexpr (std::is_signed_v<T>)
+            {
+                if (value < 0)
+                {
+                    throw MP4Error(std::string(what) + ": negative value at position " + std::to_string(i));
+                }
+            }
+            return static_cast<uint64_t>(value);
+        }
+    } // namespace
+
+    std::vector<uint64_t> uint_column(py::handle obj, const char *what)
+    {
+        std::vector<uint64_t> out;
+        if (!PyObject_CheckBuffer(obj.ptr()))
+        {
+            std::size_t i = 0;
+            for (auto item : py::iter(obj))
+            {
+                try
+                {
+                    out.push_back(item.cast<uint64_t>());
+                }
+                catch (const py::cast_error &)
+                {
+                    throw MP4Error(std::string(what) + ": expected a non-negative integer at position " +
+                                   std::to_string(i));
+                }
+                ++i;
+            }
+            return out;
+        }
+
+        const py::buffer_info info = py::reinterpret_borrow<py::buffer>(obj).request();
+        std::string format = info.format;
+        if (!format.empty() && std::strchr("@=<", format[0]) != nullptr)
+        {
+            format.erase(0, 1);
+        }
+        if (format.size() != 1 || std::strchr("?bBhHiIlLqQnN", format[0]) == nullptr)
+        {
+            throw MP4Error(std::string(what) + ": expected an integer array (got format '" + info.format + "')");
+        }
+        if (info.ndim != 1 || (info.size > 1 && info.strides[0] != info.itemsize))
+        {
+            throw MP4Error(std::string(what) + ": expected a contiguous 1-D array");
+        }
+
+        // Signed formats are lower case; sizes come from itemsize ('<l' is 4 bytes, '@l' may be 8).
+        const bool is_signed = format[0] >= 'a' && format[0] <= 'z';
+        const auto *p = static_cast<const uint8_t *>(info.ptr);
+        const auto n = static_cast<std::size_t>(info.size);
+        out.resize(n);
+        for (std::size_t i = 0; i < n; ++i)
+        {
+            switch (info.itemsize)
+            {
+            case 1:
+                out[i] = is_signed ? load_uint<int8_t>(p, i, what) : load_uint<uint8_t>(p, i, what);
+                break;
+            case 2:
+                out[i] = is_signed ? load_uint<int16_t>(p, i, what) : load_uint<uint16_t>(p, i, what);
+                break;
+            case 4:
+                out[i] = is_signed ? load_uint<int32_t>(p, i, what) : load_uint<uint32_t>(p, i, what);
+                break;
+            case 8:
+                out[i] = is_signed ? load_uint<int64_t>(p, i, what) : load_uint<uint64_t>(p, i, what);
+                break;
+            default:
+                throw MP4Error(std::string(what) + ": unsupported item size " + std::to_string(info.itemsize));
+            }
+        }
+        return out;
+    }
+
+    ByteArray adopt_mp4_bytes(uint8_t *bytes, uint32_t size)
+    {
+        if (bytes == nullptr)
+        {
+            return ByteArray();
+        }
+        std::shared_ptr<const void> owner(bytes, [](const void *p)
+                                          { MP4Free(const_cast<void *>(p)); });
+        return ByteArray(std::move(owner), bytes, size);
+    }
+
+    BufferView::BufferView(py::handle obj, bool writable)
+    {
+        if (PyObject_GetBuffer(obj.ptr(), &view_, writable ? PyBUF_WRITABLE : PyBUF_SIMPLE) != 0)
+        {
+            throw py::error_already_set();
+        }
+    }
+
+    BufferView::~BufferView()
+    {
+        PyBuffer_Release(&view_);
+    }
+
+    void bind_buffers(py::module_ &m_raw)
+    {
+        bind_native_array<uint8_t>(m_raw, "_ByteArray");
+        bind_native_array<uint32_t>(m_raw, "_UInt32Array");
+        bind_native_array<uint64_t>(m_raw, "_UInt64Array");
+    }
+} // namespace raw
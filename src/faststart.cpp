@@ -0,0 +1,264 @@
+#include "pymp4v2/faststart.h"
+
+#include <algorithm>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+#include <iterator>
+#include <vector>
+
+#include "pymp4v2/atoms.h"
+#include "pymp4v2/error.h"
+
+namespace
+{
+    using atoms::Atom;
+
+    // Old byte ranges of the copied top-level atoms and where each one lands.
+    struct Relocation
+    {
+        struct Span
+        {
+            uint64_t start;
+            uint64_t end;
+            uint64_t target;
+        };
+        std::vector<Span> spans; // sorted by start
+
+        uint64_t map(uint64_t offset) const
+        {
+            auto it = std::upper_bound(spans.begin(), spans.end(), offset,
+                                       [](uint64_t o, const Span &s) { return o < s.start; });
+            if (it == spans.begin() || offset >= std::prev(it)->end)
+            {
+                throw MP4Error("Chunk offset " + std::to_string(offset) + " points outside the media data");
+            }
+            --it;
+            return offset - it->start + it->target;
+        }
+    };
+
+    // stco/co64 with every entry relocated; stco becomes co64 once an entry no longer fits.
+    std::string chunk_offsets(std::istream &in, const Atom &atom, const Relocation &reloc)
+    {
+        const int width = atom.type == "co64" ? 8 : 4;
+        if (atom.size < atom.header + 8u)
+        {
+            throw MP4Error("Truncated '" + atom.type + "' atom");
+        }
+        const std::string head = atoms::read_bytes(in, atom.body(), 8);
+        const uint64_t count = atoms::load_be(reinterpret_cast<const unsigned char *>(head.data()) + 4, 4);
+        if ((atom.size - atom.header - 8) / width < count)
+        {
+            throw MP4Error("Truncated '" + atom.type + "' atom");
+        }
+        const std::string table = atoms::read_bytes(in, atom.body() + 8, count * width);
+        const auto *p = reinterpret_cast<const unsigned char *>(table.data());
+
+        std::vector<uint64_t> offsets(static_cast<std::size_t>(count));
+        bool wide = width == 8;
+        for (std::size_t i = 0; i < offsets.size(); ++i)
+        {
+            offsets[i] = reloc.map(atoms::load_be(p + i * width, width));
+            wide = wide || offsets[i] > UINT32_MAX;
+        }
+
+        const int outWidth = wide ? 8 : 4;
+        std::string body(8 + offsets.size() * outWidth, '\0');
+        auto *out = reinterpret_cast<unsigned char *>(&body[0]);
+        std::memcpy(out, head.data(), 4); // version + flags
+        atoms::store_be(out + 4, count, 4);
+        for (std::size_t i = 0; i < offsets.size(); ++i)
+        {
+            atoms::store_be(out + 8 + i * outWidth, offsets[i], outWidth);
+        }
+        return atoms::make_header(wide ? "co64" : "stco", body.size()) + body;
+    }
+
+    // `atom` (moov or a container below it) with its chunk offset tables rewritten.
+    std::string relocate(std::istream &in, const Atom &atom, const Relocation &reloc)
+    {
+        const auto children = atoms::read_atoms(in, atom.body(), atom.end());
+        if (!children)
+        {
+            throw MP4Error("Malformed '" + atom.type + "' atom");
+        }
+        std::string body;
+        for (const auto &child : *children)
+        {
+            if (atom.type == "stbl" && (child.type == "stco" || child.type == "co64"))
+            {
+                body += chunk_offsets(in, child, reloc);
+            }
+            else if (atoms::leads_to_stbl(child.type))
+            {
+                body += relocate(in, child, reloc);
+            }
+            else
+            {
+                body += atoms::read_bytes(in, child.start, child.size);
+            }
+        }
+        return atoms::make_header(atom.type, body.size()) + body;
+    }
+
+    // Removes the temp output unless the rename went through.
+    struct TempOutput
+    {
+        std::string path;
+        bool committed = false;
+
+        ~TempOutput()
+        {
+            if (!committed)
+            {
+                std::remove(path.c_str());
+            }
+        }
+    };
+} // namespace
+
+bool faststart(const std::string &src, const std::string &dst, std::size_t chunkSize, const FaststartTick &tick)
+{
+    if (chunkSize == 0)
+    {
+        throw MP4Error("chunk_size must be positive");
+    }
+    std::ifstream in(src, std::ios::binary);
+    if (!in)
+    {
+        throw MP4Error("Failed to open MP4 file: " + src);
+    }
+    const auto top = atoms::read_atoms(in, 0, atoms::file_size(in));
+    if (!top)
+    {
+        throw MP4Error("Malformed top-level atoms in " + src);
+    }
+    const Atom *moov = atoms::find_atom(*top, "moov");
+    if (!moov)
+    {
+        throw MP4Error("No moov atom in " + src);
+    }
+    if (atoms::find_atom(*top, "moof"))
+    {
+        throw MP4Error("Fragmented MP4 files cannot be optimized: " + src);
+    }
+    const Atom *ftyp = atoms::find_atom(*top, "ftyp");
+
+    std::vector<const Atom *> media;
+    for (const auto &atom : *top)
+    {
+        if (&atom != moov && &atom != ftyp && !atom.is_free())
+        {
+            media.push_back(&atom);
+        }
+    }
+
+    const uint64_t head = ftyp ? ftyp->size : 0;
+    uint64_t mediaSize = 0;
+    for (const Atom *atom : media)
+    {
+        mediaSize += atom->size;
+    }
+
+    if (src == dst && (media.empty() || moov->start < media.front()->start))
+    {
+        // Already moov-first; nothing to move.
+        const uint64_t total = head + moov->size + mediaSize;
+        tick(total, total);
+        return true;
+    }
+
+    // Offsets depend on the moov size, which grows if stco has to widen. The new
+    // size is monotone in the assumed one, so this settles in a few rounds.
+    std::string moovBytes;
+    uint64_t moovSize = moov->size;
+    for (int round = 0;; ++round)
+    {
+        Relocation reloc;
+        uint64_t pos = head + moovSize;
+        for (const Atom *atom : media)
+        {
+            reloc.spans.push_back({atom->start, atom->end(), pos});
+            pos += atom->size;
+        }
+        moovBytes = relocate(in, *moov, reloc);
+        if (moovBytes.size() == moovSize)
+        {
+            break;
+        }
+        if (round == 8)
+        {
+            throw MP4Error("Chunk offsets did not settle while relocating moov");
+        }
+        moovSize = moovBytes.size();
+    }
+
+    const uint64_t total = head + moovSize + mediaSize;
+    TempOutput tmp{dst + ".pymp4v2-optimize"};
+    std::ofstream out(tmp.path, std::ios::binary | std::ios::trunc);
+    if (!out)
+    {
+        throw MP4Error("Failed to create " + tmp.path);
+    }
+
+    uint64_t done = 0;
+    if (!tick(done, total))
+    {
+        return false;
+    }
+    if (ftyp)
+    {
+        const std::string bytes = atoms::read_bytes(in, ftyp->start, ftyp->size);
+        out.write(bytes.data(), static_cast<std::streamsize>(bytes.size()));
+        done += bytes.size();
+    }
+    out.write(moovBytes.data(), static_cast<std::streamsize>(moovBytes.size()));
+    done += moovBytes.size();
+    std::string().swap(moovBytes);
+
+    std::vector<char> buffer(chunkSize);
+    for (const Atom *atom : media)
+    {
+        in.clear();
+        in.seekg(static_cast<std::streamoff>(atom->start));
+        for (uint64_t left = atom->size; left > 0;)
+        {
+            const auto n = static_cast<std::size_t>(std::min<uint64_t>(left, chunkSize));
+            in.read(buffer.data(), static_cast<std::streamsize>(n));
+            if (!in)
+            {
+                throw MP4Error("Failed to read media data from " + src);
+            }
+            out.write(buffer.data(), static_cast<std::streamsize>(n));
+            if (!out)
+            {
+                throw MP4Error("Failed to write " + tmp.path);
+            }
+            left -= n;
+            done += n;
+            if (!tick(done, total))
+            {
+                return false;
+            }
+        }
+    }
+
+    in.close();
+    out.close();
+    if (!out)
+    {
+        throw MP4Error("Failed to write " + tmp.path);
+    }
+    if (std::rename(tmp.path.c_str(), dst.c_str()) != 0)
+    {
+        // Windows will not rename over an existing file.
+        std::remove(dst.c_str());
+        if (std::rename(tmp.path.c_str(), dst.c_str()) != 0)
+        {
+            throw MP4Error("Failed to replace " + dst);
+        }
+    }
+    tmp.committed = true;
+    return true;
+}
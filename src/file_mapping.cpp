@@ -0,0 +1,125 @@
+#include "pymp4v2/file_mapping.h"
+
+#include "pymp4v2/error.h"
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#ifdef _WIN32
+
+FileMapping::FileMapping(const std::string &filename)
+{
+    // mp4v2 takes UTF-8 paths on Windows; do the same.
+    const int wideLen = MultiByteToWideChar(CP_UTF8, 0, filename.c_str(), -1, nullptr, 0);
+    std::wstring wide(wideLen > 0 ? wideLen : 1, L'\0');
+    MultiByteToWideChar(CP_UTF8, 0, filename.c_str(), -1, &wide[0], wideLen);
+    HANDLE file = CreateFileW(wide.c_str(), GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE,
+                              nullptr, OPEN_EXISTING, FILE_FLAG_RANDOM_ACCESS, nullptr);
+    if (file == INVALID_HANDLE_VALUE)
+    {
+        throw MP4Error("Failed to open file for mapping: " + filename);
+    }
+    file_ = file;
+    LARGE_INTEGER size;
+    if (!GetFileSizeEx(file, &size))
+    {
+        CloseHandle(file);
+        throw MP4Error("Failed to get size for mapping: " + filename);
+    }
+    size_ = static_cast<std::size_t>(size.QuadPart);
+    if (size_ == 0)
+    {
+        return;
+    }
+    HANDLE mapping = CreateFileMappingW(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+    if (mapping == nullptr)
+    {
+        CloseHandle(file);
+        throw MP4Error("Failed to map file: " + filename);
+    }
+    mapping_ = mapping;
+    data_ = static_cast<const uint8_t *>(MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0));
+    if (data_ == nullptr)
+    {
+        CloseHandle(mapping);
+        CloseHandle(file);
+        throw MP4Error("Failed to map file: " + filename);
+    }
+}
+
+FileMapping::~FileMapping()
+{
+    if (data_ != nullptr)
+    {
+        UnmapViewOfFile(data_);
+    }
+    if (mapping_ != nullptr)
+    {
+        CloseHandle(static_cast<HANDLE>(mapping_));
+    }
+    if (file_ != nullptr)
+    {
+        CloseHandle(static_cast<HANDLE>(file_));
+    }
+}
+
+#else
+
+FileMapping::FileMapping(const std::string &filename)
+{
+    const int fd = ::open(filename.c_str(), O_RDONLY);
+    if (fd < 0)
+    {
+        throw MP4Error("Failed to open file for mapping: " + filename);
+    }
+    struct stat st;
+    if (::fstat(fd, &st) != 0)
+    {
+        ::close(fd);
+        throw MP4Error("Failed to get size for mapping: " + filename);
+    }
+    size_ = static_cast<std::size_t>(st.st_size);
+    if (size_ > 0)
+    {
+        void *p = ::mmap(nullptr, size_, PROT_READ, MAP_SHARED, fd, 0);
+        if (p == MAP_FAILED)
+        {
+            ::close(fd);
+            throw MP4Error("Failed to map file: " + filename);
+        }
+        // Thumbnail / scrubbing access jumps around; skip kernel read-ahead.
+        ::madvise(p, size_, MADV_RANDOM);
+        data_ = static_cast<const uint8_t *>(p);
+    }
+    // The mapping keeps its own reference to the file.
+    ::close(fd);
+}
+
+FileMapping::~FileMapping()
+{
+    if (data_ != nullptr)
+    {
+        ::munmap(const_cast<uint8_t *>(data_), size_);
+    }
+}
+
+#endif
+
+const uint8_t *FileMapping::data() const
+{
+    return data_;
+}
+
+std::size_t FileMapping::size() const
+{
+    return size_;
+}
@@ -0,0 +1,389 @@
+#include "pymp4v2/io_source.h"
+
+#include <algorithm>
+#include <cstring>
+#include <string_view>
+
+#include "pymp4v2/error.h"
+
+const MP4IOCallbacks *IOSource::callbacks()
+{
+    static const MP4IOCallbacks callbacks = {&IOSource::io_size, &IOSource::io_seek, &IOSource::io_read,
+                                             &IOSource::io_write, &IOSource::io_truncate};
+    return &callbacks;
+}
+
+MP4FileHandle IOSource::open()
+{
+    pos_ = 0;
+    error_.clear();
+    return MP4ReadCallbacks(callbacks(), this);
+}
+
+MP4FileHandle IOSource::create()
+{
+    pos_ = 0;
+    error_.clear();
+    return MP4CreateCallbacks(callbacks(), this);
+}
+
+MP4FileHandle IOSource::modify()
+{
+    pos_ = 0;
+    error_.clear();
+    return MP4ModifyCallbacks(callbacks(), this);
+}
+
+bool IOSource::write_at(int64_t, const void *, int64_t)
+{
+    error_ = "source is read-only";
+    return false;
+}
+
+bool IOSource::truncate(int64_t)
+{
+    error_ = "source is read-only";
+    return false;
+}
+
+const std::string &IOSource::error() const
+{
+    return error_;
+}
+
+int64_t IOSource::io_size(void *handle)
+{
+    return static_cast<IOSource *>(handle)->size();
+}
+
+int IOSource::io_seek(void *handle, int64_t pos)
+{
+    auto *self = static_cast<IOSource *>(handle);
+    if (pos < 0 || pos > self->size())
+    {
+        return -1;
+    }
+    self->pos_ = pos;
+    return 0;
+}
+
+int IOSource::io_read(void *handle, void *buffer, int64_t size, int64_t *nin)
+{
+    auto *self = static_cast<IOSource *>(handle);
+    const int64_t n = std::min<int64_t>(size, self->size() - self->pos_);
+    if (n > 0 && !self->read_at(self->pos_, buffer, n))
+    {
+        return -1;
+    }
+    self->pos_ += n;
+    *nin = n;
+    return 0;
+}
+
+int IOSource::io_write(void *handle, const void *buffer, int64_t size, int64_t *nout)
+{
+    auto *self = static_cast<IOSource *>(handle);
+    if (size > 0 && !self->write_at(self->pos_, buffer, size))
+    {
+        return -1;
+    }
+    self->pos_ += size;
+    *nout = size;
+    return 0;
+}
+
+int IOSource::io_truncate(void *handle, int64_t size)
+{
+    auto *self = static_cast<IOSource *>(handle);
+    if (size < 0 || !self->truncate(size))
+    {
+        return -1;
+    }
+    self->pos_ = std::min(self->pos_, size);
+    return 0;
+}
+
+BufferSource::BufferSource(py::handle obj) : view_(std::make_unique<raw::BufferView>(obj, false))
+{
+}
+
+BufferSource::~BufferSource()
+{
+    py::gil_scoped_acquire gil;
+    view_.reset();
+}
+
+int64_t BufferSource::size() const
+{
+    return static_cast<int64_t>(view_->size());
+}
+
+bool BufferSource::read_at(int64_t pos, void *buffer, int64_t size)
+{
+    std::memcpy(buffer, view_->data() + pos, static_cast<std::size_t>(size));
+    return true;
+}
+
+FileObjectSource::FileObjectSource(py::object file, std::size_t readSize) : file_(std::move(file))
+{
+    if (readSize == 0)
+    {
+        throw MP4Error("read_size must be positive");
+    }
+    if (py::hasattr(file_, "seekable") && !file_.attr("seekable")().cast<bool>())
+    {
+        throw MP4Error("from_fileobj needs a seekable binary file object");
+    }
+    file_.attr("seek")(0, 2);
+    size_ = file_.attr("tell")().cast<int64_t>();
+    file_pos_ = size_;
+    window_.resize(readSize);
+}
+
+FileObjectSource::~FileObjectSource()
+{
+    py::gil_scoped_acquire gil;
+    file_ = py::object();
+}
+
+int64_t FileObjectSource::size() const
+{
+    return size_;
+}
+
+int64_t FileObjectSource::fill(int64_t pos, char *buffer, int64_t size)
+{
+    if (file_pos_ != pos)
+    {
+        file_.attr("seek")(pos);
+        file_pos_ = pos;
+    }
+    const bool hasReadinto = py::hasattr(file_, "readinto");
+    int64_t done = 0;
+    while (done < size)
+    {
+        int64_t n = 0;
+        if (hasReadinto)
+        {
+            const py::object got = file_.attr("readinto")(
+                py::memoryview::from_memory(buffer + done, static_cast<py::ssize_t>(size - done), false));
+            n = got.is_none() ? 0 : got.cast<int64_t>();
+        }
+        else
+        {
+            const py::bytes got = file_.attr("read")(size - done);
+            const std::string_view bytes = got;
+            n = std::min<int64_t>(static_cast<int64_t>(bytes.size()), size - done);
+            std::memcpy(buffer + done, bytes.data(), static_cast<std::size_t>(n));
+        }
+        if (n <= 0)
+        {
+            break;
+        }
+        done += n;
+        file_pos_ += n;
+    }
+    return done;
+}
+
+bool FileObjectSource::read_at(int64_t pos, void *buffer, int64_t size)
+{
+    py::gil_scoped_acquire gil;
+    try
+    {
+        auto *out = static_cast<char *>(buffer);
+        const auto windowSize = static_cast<int64_t>(window_.size());
+        while (size > 0)
+        {
+            if (pos >= window_start_ && pos < window_start_ + window_len_)
+            {
+                const int64_t n = std::min(size, window_start_ + window_len_ - pos);
+                std::memcpy(out, window_.data() + (pos - window_start_), static_cast<std::size_t>(n));
+                out += n;
+                pos += n;
+                size -= n;
+                continue;
+            }
+            if (size >= windowSize)
+            {
+                if (fill(pos, out, size) != size)
+                {
+                    throw MP4Error("Short read from file object at offset " + std::to_string(pos));
+                }
+                return true;
+            }
+            window_start_ = pos;
+            window_len_ = fill(pos, window_.data(), std::min(windowSize, size_ - pos));
+            if (window_len_ < size)
+            {
+                throw MP4Error("Short read from file object at offset " + std::to_string(pos));
+            }
+        }
+        return true;
+    }
+    catch (const std::exception &e)
+    {
+        window_len_ = 0;
+        error_ = e.what();
+        return false;
+    }
+}
+
+int64_t MemorySink::size() const
+{
+    return static_cast<int64_t>(data_.size());
+}
+
+raw::ByteArray MemorySink::take()
+{
+    return raw::ByteArray(std::move(data_));
+}
+
+bool MemorySink::read_at(int64_t pos, void *buffer, int64_t size)
+{
+    std::memcpy(buffer, data_.data() + pos, static_cast<std::size_t>(size));
+    return true;
+}
+
+bool MemorySink::write_at(int64_t pos, const void *buffer, int64_t size)
+{
+    const auto end = static_cast<std::size_t>(pos + size);
+    if (end > data_.size())
+    {
+        data_.resize(end);
+    }
+    std::memcpy(data_.data() + pos, buffer, static_cast<std::size_t>(size));
+    return true;
+}
+
+bool MemorySink::truncate(int64_t size)
+{
+    data_.resize(static_cast<std::size_t>(size));
+    return true;
+}
+
+FileObjectSink::FileObjectSink(py::object file) : file_(std::move(file))
+{
+    if (!py::hasattr(file_, "write") || !py::hasattr(file_, "seek"))
+    {
+        throw MP4Error("create_fileobj needs a binary file object with write() and seek()");
+    }
+    if (py::hasattr(file_, "seekable") && !file_.attr("seekable")().cast<bool>())
+    {
+        throw MP4Error("create_fileobj needs a seekable binary file object");
+    }
+    file_.attr("seek")(0);
+    if (py::hasattr(file_, "truncate"))
+    {
+        file_.attr("truncate")(0);
+    }
+}
+
+FileObjectSink::~FileObjectSink()
+{
+    py::gil_scoped_acquire gil;
+    file_ = py::object();
+}
+
+int64_t FileObjectSink::size() const
+{
+    return size_;
+}
+
+void FileObjectSink::seek(int64_t pos)
+{
+    if (file_pos_ != pos)
+    {
+        file_.attr("seek")(pos);
+        file_pos_ = pos;
+    }
+}
+
+bool FileObjectSink::read_at(int64_t pos, void *buffer, int64_t size)
+{
+    py::gil_scoped_acquire gil;
+    try
+    {
+        seek(pos);
+        auto *out = static_cast<char *>(buffer);
+        int64_t done = 0;
+        while (done < size)
+        {
+            int64_t n = 0;
+            if (py::hasattr(file_, "readinto"))
+            {
+                const py::object got = file_.attr("readinto")(
+                    py::memoryview::from_memory(out + done, static_cast<py::ssize_t>(size - done), false));
+                n = got.is_none() ? 0 : got.cast<int64_t>();
+            }
+            else
+            {
+                const py::bytes got = file_.attr("read")(size - done);
+                const std::string_view bytes = got;
+                n = std::min<int64_t>(static_cast<int64_t>(bytes.size()), size - done);
+                std::memcpy(out + done, bytes.data(), static_cast<std::size_t>(n));
+            }
+            if (n <= 0)
+            {
+                throw MP4Error("Short read from file object at offset " + std::to_string(pos + done));
+            }
+            done += n;
+            file_pos_ += n;
+        }
+        return true;
+    }
+    catch (const std::exception &e)
+    {
+        file_pos_ = -1;
+        error_ = e.what();
+        return false;
+    }
+}
+
+bool FileObjectSink::write_at(int64_t pos, const void *buffer, int64_t size)
+{
+    py::gil_scoped_acquire gil;
+    try
+    {
+        seek(pos);
+        const auto *in = static_cast<const char *>(buffer);
+        int64_t done = 0;
+        while (done < size)
+        {
+            const py::object wrote = file_.attr("write")(py::memoryview::from_memory(
+                const_cast<char *>(in + done), static_cast<py::ssize_t>(size - done), true));
+            // Buffered writers return None or the full length; raw ones may write less.
+            const int64_t n = wrote.is_none() ? size - done : wrote.cast<int64_t>();
+            if (n <= 0)
+            {
+                throw MP4Error("File object accepted no bytes at offset " + std::to_string(pos + done));
+            }
+            done += n;
+            file_pos_ += n;
+        }
+        size_ = std::max(size_, pos + size);
+        return true;
+    }
+    catch (const std::exception &e)
+    {
+        file_pos_ = -1;
+        error_ = e.what();
+        return false;
+    }
+}
+
+bool FileObjectSink::truncate(int64_t size)
+{
+    py::gil_scoped_acquire gil;
+    try
+    {
+        file_.attr("truncate")(size);
+        size_ = size;
+        return true;
+    }
+    catch (const std::exception &e)
+    {
+        error_ = e.what();
+        return false;
+    }
+}
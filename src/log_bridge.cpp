@@ -0,0 +1,257 @@
+#include "pymp4v2/log_bridge.h"
+
+#include <atomic>
+#include <condition_variable>
+#include <cstdarg>
+#include <cstdio>
+#include <deque>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <utility>
+
+namespace
+{
+    // Messages waiting for the delivery thread; later ones are counted and dropped.
+    constexpr std::size_t kMaxPending = 10000;
+
+    struct LogMessage
+    {
+        MP4LogLevel level;
+        std::string text;
+    };
+
+    class LogBridge
+    {
+    public:
+        // Never destroyed: mp4v2 may still log from static destructors after the
+        // interpreter is gone.
+        static LogBridge &instance()
+        {
+            static auto *bridge = new LogBridge();
+            return *bridge;
+        }
+
+        bool accepts(MP4LogLevel level) const
+        {
+            return level <= threshold_.load(std::memory_order_relaxed);
+        }
+
+        void push(MP4LogLevel level, std::string text)
+        {
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                if (queue_.size() >= kMaxPending)
+                {
+                    ++dropped_;
+                    return;
+                }
+                queue_.push_back({level, std::move(text)});
+                ++queued_;
+            }
+            ready_.notify_one();
+        }
+
+        // GIL held.
+        void start(py::object handler, MP4LogLevel level)
+        {
+            handler_ = std::move(handler);
+            threshold_.store(level, std::memory_order_relaxed);
+            bool running;
+            {
+                // A thread told to stop from its own handler keeps going if it has not
+                // left its loop yet.
+                std::lock_guard<std::mutex> lock(mutex_);
+                stopping_ = false;
+                running = running_;
+                running_ = true;
+            }
+            if (running)
+            {
+                return;
+            }
+            if (thread_.joinable())
+            {
+                py::gil_scoped_release release;
+                thread_.join();
+            }
+            thread_ = std::thread(&LogBridge::run, this);
+        }
+
+        // GIL held. Delivers what is already queued, then joins the thread. From the
+        // handler itself the thread cannot join itself: it is only told to exit once the
+        // queue is drained, and the next start() or stop() joins it.
+        void stop()
+        {
+            threshold_.store(MP4_LOG_NONE, std::memory_order_relaxed);
+            if (!thread_.joinable())
+            {
+                return;
+            }
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                stopping_ = true;
+            }
+            ready_.notify_one();
+            if (std::this_thread::get_id() == thread_.get_id())
+            {
+                return;
+            }
+            {
+                py::gil_scoped_release release;
+                thread_.join();
+            }
+            stopping_ = false;
+            handler_ = py::object();
+        }
+
+        // GIL held.
+        void flush()
+        {
+            if (!thread_.joinable() || std::this_thread::get_id() == thread_.get_id())
+            {
+                return;
+            }
+            py::gil_scoped_release release;
+            std::unique_lock<std::mutex> lock(mutex_);
+            const uint64_t target = queued_;
+            delivered_.wait(lock, [&] { return delivered_count_ >= target; });
+        }
+
+    private:
+        LogBridge() = default;
+
+        void run()
+        {
+            for (;;)
+            {
+                std::deque<LogMessage> batch;
+                uint64_t dropped = 0;
+                {
+                    std::unique_lock<std::mutex> lock(mutex_);
+                    ready_.wait(lock, [&] { return !queue_.empty() || dropped_ > 0 || stopping_; });
+                    if (queue_.empty() && dropped_ == 0)
+                    {
+                        running_ = false;
+                        break;
+                    }
+                    batch.swap(queue_);
+                    std::swap(dropped, dropped_);
+                }
+                {
+                    py::gil_scoped_acquire gil;
+                    if (dropped > 0)
+                    {
+                        deliver(MP4_LOG_WARNING, std::to_string(dropped) +
+                                                     " mp4v2 log messages dropped (pymp4v2 log queue full)");
+                    }
+                    for (const auto &message : batch)
+                    {
+                        deliver(message.level, message.text);
+                    }
+                }
+                {
+                    std::lock_guard<std::mutex> lock(mutex_);
+                    delivered_count_ += batch.size();
+                }
+                delivered_.notify_all();
+            }
+        }
+
+        // GIL held. A raising handler is reported through sys.unraisablehook.
+        void deliver(MP4LogLevel level, const std::string &text)
+        {
+            if (!handler_)
+            {
+                return;
+            }
+            try
+            {
+                auto message = py::reinterpret_steal<py::str>(
+                    PyUnicode_DecodeUTF8(text.data(), static_cast<Py_ssize_t>(text.size()), "replace"));
+                handler_(level, message);
+            }
+            catch (py::error_already_set &e)
+            {
+                e.discard_as_unraisable("pymp4v2 log handler");
+            }
+        }
+
+        std::atomic<int> threshold_{MP4_LOG_NONE};
+        std::mutex mutex_;
+        std::condition_variable ready_;
+        std::condition_variable delivered_;
+        std::deque<LogMessage> queue_;
+        uint64_t queued_ = 0;
+        uint64_t delivered_count_ = 0;
+        uint64_t dropped_ = 0;
+        bool stopping_ = false;
+        // Set by start(), cleared by the thread as it leaves its loop.
+        bool running_ = false;
+        std::thread thread_;
+        // Only touched with the GIL held.
+        py::object handler_;
+    };
+
+    // Runs on whichever thread mp4v2 logs from, usually with the GIL released.
+    void log_callback(MP4LogLevel level, const char *fmt, va_list ap)
+    {
+        auto &bridge = LogBridge::instance();
+        if (!bridge.accepts(level))
+        {
+            return;
+        }
+        va_list copy;
+        va_copy(copy, ap);
+        const int n = std::vsnprintf(nullptr, 0, fmt, copy);
+        va_end(copy);
+        if (n < 0)
+        {
+            return;
+        }
+        std::string text(static_cast<std::size_t>(n), '\0');
+        std::vsnprintf(&text[0], text.size() + 1, fmt, ap);
+        while (!text.empty() && (text.back() == '\n' || text.back() == '\r'))
+        {
+            text.pop_back();
+        }
+        bridge.push(level, std::move(text));
+    }
+} // namespace
+
+void set_log_handler(py::object handler, MP4LogLevel level)
+{
+    auto &bridge = LogBridge::instance();
+    if (handler.is_none())
+    {
+        MP4SetLogCallback(nullptr);
+        bridge.stop();
+        return;
+    }
+    if (!PyCallable_Check(handler.ptr()))
+    {
+        throw py::type_error("log handler must be callable or None");
+    }
+    bridge.start(std::move(handler), level);
+    MP4LogSetLevel(level);
+    MP4SetLogCallback(&log_callback);
+}
+
+void flush_logs()
+{
+    LogBridge::instance().flush();
+}
+
+void bind_log(py::module_ &m)
+{
+    m.def("_set_log_handler", &set_log_handler, py::arg("handler"), py::arg("level"));
+    m.def("flush_logs", &flush_logs,
+          R"doc(
+    Block until every mp4v2 log message queued so far has been passed to the handler
+    installed with ``set_log_handler``. Returns at once if there is none, or when called
+    from the handler itself.
+)doc");
+    // Deliver what is left and join the delivery thread before the interpreter finalizes.
+    py::module_::import("atexit").attr("register")(
+        py::cpp_function([] { set_log_handler(py::none(), MP4_LOG_NONE); }));
+}
@@ -1,5 +1,6 @@
 #include <pybind11/pybind11.h>
 #include "pymp4v2/error.h"
+#include "pymp4v2/log_bridge.h"
 #include "pymp4v2/mp4file.h"
 #include "pymp4v2/raw.h"
 
@@ -316,4 +317,5 @@ PYBIND11_MODULE(_pymp4v2, m)
 
     raw::bind_extended(m_raw);
     bind_highlevel(m, m_raw);
+    bind_log(m);
 }
@@ -1,9 +1,14 @@
 #include "pymp4v2/mp4file.h"
 
+#include <algorithm>
+#include <functional>
+
 #include <pybind11/stl.h>
 
 #include "mp4v2/mp4v2.h"
 #include "pymp4v2/error.h"
+#include "pymp4v2/faststart.h"
+#include "pymp4v2/tag_writer.h"
 
 namespace py = pybind11;
 
@@ -30,6 +35,81 @@ namespace
         }
         return index;
     }
+
+    // Clamp a slice bound to [0, count] the way Python slicing does.
+    py::ssize_t clamp_index(py::ssize_t index, py::ssize_t count)
+    {
+        if (index < 0)
+        {
+            index += count;
+            return index < 0 ? 0 : index;
+        }
+        return index > count ? count : index;
+    }
+
+    // Handler type for Tracks.of_type(): a friendly name or the four-character code.
+    std::string handler_type(const std::string &type)
+    {
+        static const std::map<std::string, std::string> aliases = {
+            {"audio", MP4_AUDIO_TRACK_TYPE},     {"video", MP4_VIDEO_TRACK_TYPE}, {"text", MP4_TEXT_TRACK_TYPE},
+            {"subtitle", MP4_SUBTITLE_TRACK_TYPE}, {"hint", MP4_HINT_TRACK_TYPE}, {"od", MP4_OD_TRACK_TYPE},
+            {"scene", MP4_SCENE_TRACK_TYPE},
+        };
+        const auto it = aliases.find(type);
+        return it != aliases.end() ? it->second : type;
+    }
+
+    // Every TrackInfo field from direct mp4v2 calls; "absent" is a return value, not an
+    // exception. Video / audio specific getters only run for matching tracks, since
+    // mp4v2 logs an error for each missing property. Call with the GIL released.
+    TrackInfo read_track_info(MP4FileHandle h, py::ssize_t index, MP4TrackId id, const std::string &type,
+                              bool withBitrate)
+    {
+        TrackInfo info;
+        info.index = index;
+        info.id = id;
+        info.type = type;
+        if (const char *codec = MP4GetTrackMediaDataName(h, id))
+        {
+            info.codec = std::string(codec);
+        }
+        info.duration = MP4GetTrackDuration(h, id);
+        info.timescale = MP4GetTrackTimeScale(h, id);
+        info.sample_count = MP4GetTrackNumberOfSamples(h, id);
+        char code[4] = {};
+        if (MP4GetTrackLanguage(h, id, code))
+        {
+            info.language = std::string(code);
+        }
+        char *name = nullptr;
+        if (MP4GetTrackName(h, id, &name) && name != nullptr)
+        {
+            info.name = std::string(name);
+        }
+        if (name != nullptr)
+        {
+            MP4Free(name);
+        }
+        if (withBitrate)
+        {
+            info.bitrate = MP4GetTrackBitRate(h, id);
+        }
+        if (type == MP4_VIDEO_TRACK_TYPE)
+        {
+            info.width = MP4GetTrackVideoWidth(h, id);
+            info.height = MP4GetTrackVideoHeight(h, id);
+            info.frame_rate = MP4GetTrackVideoFrameRate(h, id);
+        }
+        else if (type == MP4_AUDIO_TRACK_TYPE)
+        {
+            const int channels = MP4GetTrackAudioChannels(h, id);
+            if (channels >= 0)
+            {
+                info.audio_channels = channels;
+            }
+        }
+        return info;
+    }
 } // namespace
 
 Track::Track(MP4File *file, MP4TrackId id) : file_(file), id_(id) {}
@@ -95,6 +175,7 @@ uint16_t Track::height() const
 
 uint32_t Track::bitrate() const
 {
+    file_->require_sample_tables();
     return raw::MP4GetTrackBitRate_wrapper(file_->handle(), id_);
 }
 
@@ -115,25 +196,341 @@ std::optional<int> Track::audio_channels() const
     }
 }
 
+TrackInfo Track::info() const
+{
+    const auto &index = file_->track_index();
+    const auto it = std::find_if(index.begin(), index.end(), [this](const TrackEntry &e)
+                                 { return e.id == id_; });
+    if (it == index.end())
+    {
+        throw MP4Error("Track " + std::to_string(id_) + " is no longer in " + file_->filename());
+    }
+    const py::ssize_t position = it - index.begin();
+    const std::string type = it->type;
+    const bool withBitrate = file_->load_sample_tables();
+    // The lease keeps a concurrent close() from freeing the handle while the GIL is released.
+    auto lease = file_->read_handle();
+    MP4FileHandle h = lease.handle().get();
+    py::gil_scoped_release release;
+    return read_track_info(h, position, id_, type, withBitrate);
+}
+
 raw::MP4SampleData Track::read_sample(py::ssize_t index) const
 {
+    file_->require_sample_tables();
+    const auto count = static_cast<py::ssize_t>(sample_count());
+    const auto i = normalize_index(index, count);
+    auto lease = file_->read_handle();
+    return raw::MP4ReadSample_wrapper(lease.handle(), id_, static_cast<MP4SampleId>(i + 1));
+}
+
+uint32_t Track::max_sample_size() const
+{
+    file_->require_sample_tables();
+    return raw::MP4GetTrackMaxSampleSize_wrapper(file_->handle(), id_);
+}
+
+raw::MP4SampleInfo Track::read_sample_into(py::ssize_t index, py::buffer buf) const
+{
+    file_->require_sample_tables();
     const auto count = static_cast<py::ssize_t>(sample_count());
     const auto i = normalize_index(index, count);
-    return raw::MP4ReadSample_wrapper(file_->handle(), id_, static_cast<MP4SampleId>(i + 1));
+    auto lease = file_->read_handle();
+    return raw::MP4ReadSampleInto_wrapper(lease.handle(), id_, static_cast<MP4SampleId>(i + 1), std::move(buf));
+}
+
+raw::MP4SampleBatch Track::read_samples(py::ssize_t start, std::optional<py::ssize_t> stop) const
+{
+    file_->require_sample_tables();
+    const auto count = static_cast<py::ssize_t>(sample_count());
+    const auto first = clamp_index(start, count);
+    const auto last = stop ? clamp_index(*stop, count) : count;
+    const auto n = last > first ? last - first : 0;
+    auto lease = file_->read_handle();
+    return raw::MP4ReadSamples_wrapper(lease.handle(), id_, static_cast<MP4SampleId>(first + 1),
+                                       static_cast<uint32_t>(n));
+}
+
+raw::MP4SampleTable Track::sample_table() const
+{
+    file_->require_sample_tables();
+    // The lease keeps a concurrent close() from freeing the handle while the table is
+    // built with the GIL released.
+    auto lease = file_->read_handle();
+    return raw::MP4GetSampleTable_wrapper(lease.handle(), id_);
+}
+
+void Track::write_samples(py::buffer payload, py::object sizes, py::object durations, py::object rendering_offsets,
+                          py::object sync) const
+{
+    if (!file_->handle_writable())
+    {
+        throw MP4Error("Cannot write samples to a read-only MP4File: " + file_->filename());
+    }
+    auto lease = file_->read_handle();
+    file_->keyframes_.erase(id_);
+    raw::MP4WriteSamples_wrapper(lease.handle(), id_, std::move(payload), std::move(sizes), std::move(durations),
+                                 std::move(rendering_offsets), std::move(sync));
+}
+
+py::memoryview Track::sample_view(py::ssize_t index) const
+{
+    file_->ensure_open();
+    if (!file_->mapping_)
+    {
+        throw MP4Error("sample_view needs MP4File(..., mmap=True): " + file_->filename());
+    }
+    const auto table = file_->cached_sample_table(id_);
+    const auto i = static_cast<std::size_t>(normalize_index(index, static_cast<py::ssize_t>(table->sizes.size())));
+    const uint64_t offset = table->offsets.data()[i];
+    const uint32_t size = table->sizes.data()[i];
+    const std::shared_ptr<FileMapping> &mapping = file_->mapping_;
+    if (offset > mapping->size() || size > mapping->size() - offset)
+    {
+        throw MP4Error("Sample " + std::to_string(i) + " lies outside the mapped file: " + file_->filename());
+    }
+    // The view keeps the mapping alive, so it outlives close() and later reopens.
+    return raw::to_memoryview(raw::ByteArray(mapping, mapping->data() + offset, size));
+}
+
+std::shared_ptr<Keyframes> Track::keyframes() const
+{
+    return file_->keyframes(id_);
+}
+
+uint32_t Track::seek(MP4Timestamp time, const std::string &mode) const
+{
+    if (mode != "prev_key" && mode != "next_key" && mode != "nearest")
+    {
+        throw MP4Error("Unsupported seek mode '" + mode + "' (expected prev_key, next_key or nearest)");
+    }
+    const auto index = keyframes();
+    const auto n = index->times.size();
+    if (n == 0)
+    {
+        throw py::index_error("track has no keyframes");
+    }
+    const uint64_t *times = index->times.data();
+    const uint32_t *indices = index->indices.data();
+
+    // First keyframe starting after time; the one before it is the previous keyframe.
+    const auto after = static_cast<std::size_t>(std::upper_bound(times, times + n, time) - times);
+    const std::size_t prev = after > 0 ? after - 1 : 0;
+    std::size_t next = after > 0 && times[after - 1] == time ? after - 1 : after;
+    next = next < n ? next : n - 1;
+
+    std::size_t pick = prev;
+    if (mode == "next_key")
+    {
+        pick = next;
+    }
+    else if (mode == "nearest")
+    {
+        const uint64_t before = time > times[prev] ? time - times[prev] : times[prev] - time;
+        const uint64_t past = times[next] > time ? times[next] - time : time - times[next];
+        pick = past < before ? next : prev;
+    }
+    return indices[pick];
+}
+
+SampleIterator Track::iter_samples(py::ssize_t start, std::optional<py::ssize_t> stop, py::ssize_t step,
+                                   const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range,
+                                   uint32_t chunk, std::size_t prefetch) const
+{
+    file_->require_sample_tables();
+    if (step <= 0)
+    {
+        throw MP4Error("iter_samples step must be positive");
+    }
+    if (prefetch > 0 && file_->mode() != "r")
+    {
+        throw MP4Error("iter_samples prefetch needs a file opened with mode 'r': " + file_->filename());
+    }
+    if (prefetch > 0 && file_->source_)
+    {
+        throw MP4Error("iter_samples prefetch needs a file path: " + file_->filename());
+    }
+    const auto [first, last] = sample_bounds(start, stop, time_range);
+    return SampleIterator(file_, id_, static_cast<MP4SampleId>(first + 1), static_cast<MP4SampleId>(last + 1),
+                          static_cast<uint32_t>(step), chunk, prefetch);
+}
+
+std::pair<py::ssize_t, py::ssize_t>
+Track::sample_bounds(py::ssize_t start, std::optional<py::ssize_t> stop,
+                     const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range) const
+{
+    const auto count = static_cast<py::ssize_t>(sample_count());
+    auto first = clamp_index(start, count);
+    auto last = stop ? clamp_index(*stop, count) : count;
+    if (time_range)
+    {
+        // Keep samples overlapping [begin, end): from the one containing begin up to
+        // the last one starting before end.
+        MP4FileHandle h = file_->handle().get();
+        const MP4Duration trackDuration = duration();
+        const auto index_at = [&](MP4Timestamp when) -> py::ssize_t
+        {
+            if (when >= trackDuration)
+            {
+                return count;
+            }
+            const MP4SampleId id = MP4GetSampleIdFromTime(h, id_, when, false);
+            return id == MP4_INVALID_SAMPLE_ID ? count : static_cast<py::ssize_t>(id) - 1;
+        };
+        const auto [begin, end] = *time_range;
+        first = std::max(first, index_at(begin));
+        auto endIndex = index_at(end);
+        if (endIndex < count && MP4GetSampleTime(h, id_, static_cast<MP4SampleId>(endIndex + 1)) < end)
+        {
+            ++endIndex;
+        }
+        last = std::min(last, endIndex);
+    }
+    if (last < first)
+    {
+        last = first;
+    }
+    return {first, last};
+}
+
+SampleIterator::SampleIterator(MP4File *file, MP4TrackId trackId, MP4SampleId first, MP4SampleId stop, uint32_t step,
+                               uint32_t chunk, std::size_t prefetch)
+    : file_(file), track_id_(trackId), next_id_(first), stop_(stop), step_(step), chunk_(chunk > 0 ? chunk : 1)
+{
+    if (prefetch > 0 && first < stop)
+    {
+        // The worker reads the range on its own handle; this iterator only consumes.
+        prefetch_ = std::make_shared<SamplePrefetcher>(file->filename(), trackId, first, stop, step, prefetch);
+    }
+}
+
+void SampleIterator::fill()
+{
+    auto lease = file_->read_handle();
+    MP4FileHandle h = lease.handle().get();
+    buffer_.clear();
+    pos_ = 0;
+    MP4SampleId failed = MP4_INVALID_SAMPLE_ID;
+    {
+        py::gil_scoped_release release;
+        for (uint32_t i = 0; i < chunk_ && next_id_ < stop_; ++i)
+        {
+            uint8_t *bytes = nullptr;
+            uint32_t numBytes = 0;
+            raw::MP4SampleData sample;
+            if (!MP4ReadSample(h, track_id_, next_id_, &bytes, &numBytes, &sample.startTime, &sample.duration,
+                               &sample.renderingOffset, &sample.isSyncSample))
+            {
+                MP4Free(bytes);
+                failed = next_id_;
+                break;
+            }
+            sample.data = raw::adopt_mp4_bytes(bytes, numBytes);
+            buffer_.push_back(std::move(sample));
+            next_id_ = stop_ - next_id_ > step_ ? next_id_ + step_ : stop_;
+        }
+    }
+    if (failed != MP4_INVALID_SAMPLE_ID)
+    {
+        next_id_ = stop_;
+        throw MP4Error("MP4ReadSample failed at sampleId " + std::to_string(failed));
+    }
+}
+
+raw::MP4SampleData SampleIterator::next()
+{
+    if (prefetch_)
+    {
+        raw::MP4SampleData sample;
+        if (next_id_ >= stop_ || !prefetch_->pop(sample))
+        {
+            next_id_ = stop_;
+            throw py::stop_iteration();
+        }
+        next_id_ = stop_ - next_id_ > step_ ? next_id_ + step_ : stop_;
+        return sample;
+    }
+    if (pos_ == buffer_.size())
+    {
+        if (next_id_ >= stop_)
+        {
+            throw py::stop_iteration();
+        }
+        fill();
+    }
+    return std::move(buffer_[pos_++]);
+}
+
+std::size_t SampleIterator::remaining() const
+{
+    const std::size_t pending = next_id_ < stop_ ? (stop_ - next_id_ + step_ - 1) / step_ : 0;
+    return buffer_.size() - pos_ + pending;
+}
+
+std::optional<PrefetchStats> SampleIterator::stats() const
+{
+    if (!prefetch_)
+    {
+        return std::nullopt;
+    }
+    return prefetch_->stats();
 }
 
 Tracks::Tracks(MP4File *file) : file_(file) {}
 
 py::ssize_t Tracks::size() const
 {
-    return static_cast<py::ssize_t>(file_->get_track_count());
+    return static_cast<py::ssize_t>(file_->track_index().size());
 }
 
 Track Tracks::getitem(py::ssize_t index) const
 {
-    const auto i = normalize_index(index, size());
-    const MP4TrackId id = raw::MP4FindTrackId_wrapper(file_->handle(), static_cast<uint16_t>(i), std::nullopt, 0);
-    return Track(file_, id);
+    const auto &entries = file_->track_index();
+    const auto i = normalize_index(index, static_cast<py::ssize_t>(entries.size()));
+    return Track(file_, entries[static_cast<std::size_t>(i)].id);
+}
+
+Track Tracks::by_id(MP4TrackId id) const
+{
+    for (const auto &entry : file_->track_index())
+    {
+        if (entry.id == id)
+        {
+            return Track(file_, id);
+        }
+    }
+    throw py::key_error("no track with id " + std::to_string(id));
+}
+
+std::vector<Track> Tracks::of_type(const std::string &type) const
+{
+    const std::string wanted = handler_type(type);
+    std::vector<Track> tracks;
+    for (const auto &entry : file_->track_index())
+    {
+        if (entry.type == wanted)
+        {
+            tracks.emplace_back(file_, entry.id);
+        }
+    }
+    return tracks;
+}
+
+std::vector<TrackInfo> Tracks::snapshot() const
+{
+    // A copy: the cached index may be dropped while the GIL is released.
+    const std::vector<TrackEntry> entries = file_->track_index();
+    const bool withBitrate = file_->load_sample_tables();
+    std::vector<TrackInfo> infos;
+    infos.reserve(entries.size());
+    auto lease = file_->read_handle();
+    MP4FileHandle h = lease.handle().get();
+    py::gil_scoped_release release;
+    for (std::size_t i = 0; i < entries.size(); ++i)
+    {
+        infos.push_back(read_track_info(h, static_cast<py::ssize_t>(i), entries[i].id, entries[i].type, withBitrate));
+    }
+    return infos;
 }
 
 Tags::Tags(MP4File *file) : file_(file)
@@ -150,14 +547,20 @@ void Tags::fetch()
 void Tags::store()
 {
     check_writable();
+    if (file_->mode() == "t")
+    {
+        // Reopening the file afterwards fetches these tags back and clears dirty_.
+        file_->flush_tags();
+        return;
+    }
     raw::MP4TagsStore_wrapper(tags_, file_->handle());
     dirty_ = false;
 }
 
-void Tags::add_artwork(const std::string &data, MP4TagArtworkType type)
+void Tags::add_artwork(py::buffer data, MP4TagArtworkType type)
 {
     check_writable();
-    raw::MP4TagsAddArtwork_wrapper(tags_, data, type);
+    raw::MP4TagsAddArtwork_wrapper(tags_, std::move(data), type);
     dirty_ = true;
 }
 
@@ -225,15 +628,76 @@ const raw::MP4TagsWrapper &Tags::raw_tags() const
     return tags_;
 }
 
-MP4File::MP4File(const std::string &filename, const std::string &mode)
-    : filename_(filename), mode_(mode)
+MP4File::MP4File(const std::string &filename, const std::string &mode, std::size_t readers, uint32_t padding,
+                 bool load_sample_tables, bool mmap)
+    : filename_(filename), mode_(mode), readers_(readers), padding_(padding), load_sample_tables_(load_sample_tables),
+      mmap_(mmap)
 {
+    if (readers_ > 0 && mode_ != "r")
+    {
+        throw MP4Error("readers needs mode 'r' (got '" + mode_ + "') for file: " + filename_);
+    }
+    if (!load_sample_tables_ && (mode_ != "r" && mode_ != "t"))
+    {
+        throw MP4Error("load_sample_tables=False needs mode 'r' or 't' (got '" + mode_ + "') for file: " + filename_);
+    }
+    if (!load_sample_tables_ && readers_ > 0)
+    {
+        throw MP4Error("readers needs load_sample_tables=True for file: " + filename_);
+    }
+    if (mmap_ && (mode_ != "r" || !load_sample_tables_))
+    {
+        throw MP4Error("mmap needs mode 'r' with load_sample_tables=True for file: " + filename_);
+    }
     open();
 }
 
+MP4File::MP4File(std::string name, std::string mode, std::shared_ptr<IOSource> source)
+    : filename_(std::move(name)), mode_(std::move(mode)), has_path_(false), source_(std::move(source))
+{
+    open();
+}
+
+namespace
+{
+    std::string fileobj_label(const py::object &fileobj)
+    {
+        const py::object name = py::getattr(fileobj, "name", py::none());
+        return py::isinstance<py::str>(name) ? name.cast<std::string>() : "<fileobj>";
+    }
+} // namespace
+
+MP4File MP4File::from_buffer(py::handle buffer)
+{
+    return MP4File("<buffer>", "r", std::make_shared<BufferSource>(buffer));
+}
+
+MP4File MP4File::from_fileobj(py::object fileobj, std::size_t readSize)
+{
+    std::string label = fileobj_label(fileobj);
+    return MP4File(std::move(label), "r", std::make_shared<FileObjectSource>(std::move(fileobj), readSize));
+}
+
+MP4File MP4File::create_buffer()
+{
+    return MP4File("<buffer>", "w", std::make_shared<MemorySink>());
+}
+
+MP4File MP4File::create_fileobj(py::object fileobj)
+{
+    std::string label = fileobj_label(fileobj);
+    return MP4File(std::move(label), "w", std::make_shared<FileObjectSink>(std::move(fileobj)));
+}
+
 MP4File::MP4File(MP4File &&other) noexcept
-    : filename_(std::move(other.filename_)), mode_(std::move(other.mode_)), handle_(std::move(other.handle_)),
-      tags_(std::move(other.tags_))
+    : filename_(std::move(other.filename_)), mode_(std::move(other.mode_)), readers_(other.readers_),
+      padding_(other.padding_), load_sample_tables_(other.load_sample_tables_), mmap_(other.mmap_),
+      has_path_(other.has_path_), last_tag_write_(std::move(other.last_tag_write_)), probe_(std::move(other.probe_)),
+      source_(std::move(other.source_)), handle_(std::move(other.handle_)), output_(std::move(other.output_)),
+      reader_pool_(std::move(other.reader_pool_)), read_mutex_(std::move(other.read_mutex_)),
+      tags_(std::move(other.tags_)), keyframes_(std::move(other.keyframes_)), mapping_(std::move(other.mapping_)),
+      sample_tables_(std::move(other.sample_tables_)),
+      track_index_(std::move(other.track_index_))
 {
     if (tags_)
     {
@@ -247,8 +711,23 @@ MP4File &MP4File::operator=(MP4File &&other) noexcept
     {
         filename_ = std::move(other.filename_);
         mode_ = std::move(other.mode_);
+        readers_ = other.readers_;
+        padding_ = other.padding_;
+        load_sample_tables_ = other.load_sample_tables_;
+        mmap_ = other.mmap_;
+        has_path_ = other.has_path_;
+        last_tag_write_ = std::move(other.last_tag_write_);
         handle_ = std::move(other.handle_);
+        probe_ = std::move(other.probe_);
+        source_ = std::move(other.source_);
+        output_ = std::move(other.output_);
+        reader_pool_ = std::move(other.reader_pool_);
+        read_mutex_ = std::move(other.read_mutex_);
         tags_ = std::move(other.tags_);
+        keyframes_ = std::move(other.keyframes_);
+        mapping_ = std::move(other.mapping_);
+        sample_tables_ = std::move(other.sample_tables_);
+        track_index_ = std::move(other.track_index_);
         if (tags_)
         {
             tags_->set_file(this);
@@ -262,22 +741,22 @@ void MP4File::open()
     MP4FileHandle h = nullptr;
     std::string action;
 
-    if (mode_ != "r" && mode_ != "w" && mode_ != "a" && mode_ != "r+")
+    if (mode_ != "r" && mode_ != "w" && mode_ != "a" && mode_ != "r+" && mode_ != "t")
     {
         throw MP4Error("Unsupported mode '" + mode_ + "' for file: " + filename_);
     }
 
     {
         py::gil_scoped_release release;
-        if (mode_ == "r")
+        if (!handle_writable())
         {
             action = "open";
-            h = MP4Read(filename_.c_str());
+            h = open_read();
         }
         else if (mode_ == "w")
         {
             action = "create";
-            h = MP4Create(filename_.c_str());
+            h = source_ ? source_->create() : MP4Create(filename_.c_str());
         }
         else
         {
@@ -288,10 +767,22 @@ void MP4File::open()
 
     if (h == nullptr)
     {
+        if (source_ && !source_->error().empty())
+        {
+            throw MP4Error("Failed to " + action + " MP4 file: " + filename_ + " (" + source_->error() + ")");
+        }
         throw MP4Error("Failed to " + action + " MP4 file: " + filename_);
     }
 
     handle_ = raw::MP4FileHandleWrapper(h);
+    if (readers_ > 0)
+    {
+        reader_pool_ = std::make_shared<ReaderPool>(filename_, readers_);
+    }
+    if (mmap_)
+    {
+        mapping_ = std::make_shared<FileMapping>(filename_);
+    }
 }
 
 void MP4File::ensure_open() const
@@ -308,26 +799,38 @@ raw::MP4FileHandleWrapper &MP4File::handle()
     return handle_;
 }
 
-void MP4File::reopen_existing()
+void MP4File::reopen_existing(bool fetchTags)
 {
     MP4FileHandle h = nullptr;
     {
         py::gil_scoped_release release;
-        if (mode_ == "r")
+        if (!handle_writable())
         {
-            h = MP4Read(filename_.c_str());
+            h = open_read();
         }
         else
         {
-            h = MP4Modify(filename_.c_str());
+            h = source_ ? source_->modify() : MP4Modify(filename_.c_str());
         }
     }
     if (h == nullptr)
     {
+        if (source_ && !source_->error().empty())
+        {
+            throw MP4Error("Failed to reopen MP4 file: " + filename_ + " (" + source_->error() + ")");
+        }
         throw MP4Error("Failed to reopen MP4 file: " + filename_);
     }
     handle_ = raw::MP4FileHandleWrapper(h);
-    if (tags_)
+    if (readers_ > 0)
+    {
+        reader_pool_ = std::make_shared<ReaderPool>(filename_, readers_);
+    }
+    if (mmap_)
+    {
+        mapping_ = std::make_shared<FileMapping>(filename_);
+    }
+    if (tags_ && fetchTags)
     {
         tags_->fetch();
     }
@@ -335,11 +838,110 @@ void MP4File::reopen_existing()
 
 void MP4File::close()
 {
-    if (tags_ && tags_->dirty() && handle_.is_valid() && mode_ != "r")
+    const bool storeInPlace = mode_ == "t" && tags_ && tags_->dirty() && handle_.is_valid();
+    if (tags_ && tags_->dirty() && handle_.is_valid() && handle_writable())
     {
         tags_->store();
     }
-    handle_.close();
+    close_handle();
+    if (auto *sink = dynamic_cast<MemorySink *>(source_.get()))
+    {
+        output_ = sink->take();
+    }
+    source_.reset();
+    if (storeInPlace)
+    {
+        write_tags_in_place();
+    }
+}
+
+bool MP4File::has_output() const
+{
+    return output_.has_value();
+}
+
+py::memoryview MP4File::getvalue() const
+{
+    if (output_)
+    {
+        return raw::to_memoryview(*output_);
+    }
+    if (dynamic_cast<MemorySink *>(source_.get()))
+    {
+        throw MP4Error("getvalue() needs close() first (mp4v2 writes moov on close): " + filename_);
+    }
+    throw MP4Error("getvalue() is only available on MP4File.create_buffer() files: " + filename_);
+}
+
+bool MP4File::handle_writable() const
+{
+    return mode_ != "r" && mode_ != "t";
+}
+
+void MP4File::close_handle(std::optional<uint32_t> flags)
+{
+    {
+        // Let an in-flight read on handle_ finish first. Pooled handles close once
+        // their last lease is returned.
+        std::unique_lock<std::mutex> lock(*read_mutex_, std::defer_lock);
+        {
+            py::gil_scoped_release release;
+            lock.lock();
+        }
+        handle_.close(flags);
+    }
+    probe_.reset();
+    reader_pool_.reset();
+    keyframes_.clear();
+    mapping_.reset();
+    sample_tables_.clear();
+    track_index_.reset();
+}
+
+MP4FileHandle MP4File::open_read()
+{
+    if (source_)
+    {
+        return source_->open();
+    }
+    if (load_sample_tables_)
+    {
+        return MP4Read(filename_.c_str());
+    }
+    probe_ = std::make_shared<ProbeImage>(filename_);
+    return probe_->open();
+}
+
+void MP4File::require_sample_tables() const
+{
+    if (!load_sample_tables_)
+    {
+        throw MP4Error("Sample tables were not loaded (load_sample_tables=False): " + filename_);
+    }
+}
+
+void MP4File::write_tags_in_place()
+{
+    const MP4Tags *tags = tags_->raw_tags().get();
+    std::string path;
+    {
+        py::gil_scoped_release release;
+        path = store_tags_in_place(filename_, tags, padding_);
+    }
+    last_tag_write_ = std::move(path);
+}
+
+void MP4File::flush_tags()
+{
+    ensure_open();
+    close_handle();
+    write_tags_in_place();
+    reopen_existing();
+}
+
+const std::optional<std::string> &MP4File::last_tag_write() const
+{
+    return last_tag_write_;
 }
 
 int MP4File::get_track_count() const
@@ -355,9 +957,43 @@ void MP4File::save()
     {
         return;
     }
+    if (mode_ == "t")
+    {
+        close();
+        reopen_existing();
+        return;
+    }
+    commit(handle_.close_flags());
+}
 
-    close();
-    reopen_existing();
+void MP4File::checkpoint()
+{
+    ensure_open();
+    if (!handle_writable())
+    {
+        // Mode "t" stores tags in place; the read handle never has pending writes.
+        if (tags_ && tags_->dirty())
+        {
+            tags_->store();
+        }
+        return;
+    }
+    commit(handle_.close_flags() | MP4_CLOSE_DO_NOT_COMPUTE_BITRATE);
+}
+
+void MP4File::commit(uint32_t closeFlags)
+{
+    if (tags_ && tags_->dirty())
+    {
+        tags_->store();
+    }
+    // Closing only serialises moov; sample tables, track ids and tags stay as they are.
+    auto keyframes = std::move(keyframes_);
+    auto trackIndex = std::move(track_index_);
+    close_handle(closeFlags);
+    reopen_existing(false);
+    keyframes_ = std::move(keyframes);
+    track_index_ = std::move(trackIndex);
 }
 
 bool MP4File::is_open() const
@@ -400,18 +1036,273 @@ uint32_t MP4File::timescale() const
     return MP4GetTimeScale(handle_.get());
 }
 
-void MP4File::optimize(const std::optional<std::string> &newFileName)
+namespace
+{
+    constexpr std::size_t kOptimizeChunk = 8 << 20;
+}
+
+bool MP4File::optimize(const std::optional<std::string> &newFileName, const py::object &progress,
+                       std::optional<std::size_t> chunkSize, const py::object &cancel)
 {
+    if (source_)
+    {
+        throw MP4Error("optimize needs a file path: " + filename_);
+    }
+    const bool streaming = !progress.is_none() || !cancel.is_none() || chunkSize.has_value();
+    if (chunkSize && *chunkSize == 0)
+    {
+        throw MP4Error("chunk_size must be positive");
+    }
     const bool reopen = is_open();
     if (reopen)
     {
         close();
     }
-    raw::MP4Optimize_wrapper(filename_.c_str(), newFileName ? newFileName->c_str() : nullptr);
+    bool completed = true;
+    try
+    {
+        if (!streaming)
+        {
+            raw::MP4Optimize_wrapper(filename_.c_str(), newFileName ? newFileName->c_str() : nullptr);
+        }
+        else
+        {
+            const bool hasIsSet = py::hasattr(cancel, "is_set");
+            FaststartTick tick = [&](uint64_t done, uint64_t total)
+            {
+                py::gil_scoped_acquire gil;
+                if (!progress.is_none())
+                {
+                    progress(done, total);
+                }
+                if (cancel.is_none())
+                {
+                    return true;
+                }
+                return !(hasIsSet ? cancel.attr("is_set")() : cancel()).cast<bool>();
+            };
+            py::gil_scoped_release release;
+            completed = faststart(filename_, newFileName.value_or(filename_), chunkSize.value_or(kOptimizeChunk), tick);
+        }
+    }
+    catch (...)
+    {
+        if (reopen)
+        {
+            reopen_existing();
+        }
+        throw;
+    }
     if (reopen)
     {
         reopen_existing();
     }
+    return completed;
+}
+
+std::shared_ptr<Keyframes> MP4File::keyframes(MP4TrackId trackId)
+{
+    require_sample_tables();
+    auto it = keyframes_.find(trackId);
+    if (it != keyframes_.end())
+    {
+        return it->second;
+    }
+    // Only stss and stts are read; the rest of the sample table is not built.
+    raw::MP4SyncSamples sync;
+    {
+        auto lease = read_handle();
+        sync = raw::read_sync_samples(lease.handle(), trackId);
+    }
+    auto index = std::make_shared<Keyframes>();
+    index->indices = std::move(sync.indices);
+    index->times = std::move(sync.times);
+    keyframes_.emplace(trackId, index);
+    return index;
+}
+
+std::shared_ptr<const raw::MP4SampleTable> MP4File::cached_sample_table(MP4TrackId trackId)
+{
+    auto it = sample_tables_.find(trackId);
+    if (it != sample_tables_.end())
+    {
+        return it->second;
+    }
+    std::shared_ptr<const raw::MP4SampleTable> table;
+    {
+        auto lease = read_handle();
+        table = std::make_shared<const raw::MP4SampleTable>(raw::MP4GetSampleTable_wrapper(lease.handle(), trackId));
+    }
+    sample_tables_.emplace(trackId, table);
+    return table;
+}
+
+const std::vector<TrackEntry> &MP4File::track_index()
+{
+    ensure_open();
+    if (!track_index_)
+    {
+        std::vector<TrackEntry> entries;
+        {
+            auto lease = read_handle();
+            MP4FileHandle h = lease.handle().get();
+            py::gil_scoped_release release;
+            const uint32_t count = MP4GetNumberOfTracks(h);
+            entries.reserve(count);
+            for (uint32_t i = 0; i < count; ++i)
+            {
+                const MP4TrackId id = MP4FindTrackId(h, static_cast<uint16_t>(i));
+                const char *type = MP4GetTrackType(h, id);
+                entries.push_back(TrackEntry{id, type != nullptr ? type : ""});
+            }
+        }
+        if (!track_index_)
+        {
+            track_index_ = std::move(entries);
+        }
+    }
+    return *track_index_;
+}
+
+Track MP4File::resolve_track(const TrackRef &ref)
+{
+    if (const auto *index = std::get_if<py::ssize_t>(&ref))
+    {
+        return tracks().getitem(*index);
+    }
+    const Track &track = std::get<Track>(ref);
+    if (track.file_ != this)
+    {
+        throw MP4Error("Track " + std::to_string(track.id()) + " does not belong to " + filename_);
+    }
+    return track;
+}
+
+Track MP4File::copy_samples(const Track &src, py::ssize_t first, py::ssize_t last)
+{
+    if (!handle_writable())
+    {
+        throw MP4Error("Cannot copy tracks into a read-only MP4File: " + filename_);
+    }
+    MP4File &srcFile = *src.file_;
+    srcFile.require_sample_tables();
+    // Lock both files in address order so concurrent copies A->B and B->A cannot deadlock.
+    // A source with a reader pool hands out a pooled handle and does not block writers.
+    const bool srcFirst = std::less<MP4File *>()(&srcFile, this);
+    MP4File *lockFirst = srcFirst ? &srcFile : this;
+    MP4File *lockSecond = srcFirst ? this : &srcFile;
+    std::optional<ReadLease> firstLease(lockFirst->read_handle());
+    std::optional<ReadLease> secondLease;
+    if (lockSecond != lockFirst)
+    {
+        secondLease.emplace(lockSecond->read_handle());
+    }
+    const ReadLease &srcLease = lockFirst == &srcFile ? *firstLease : *secondLease;
+    const ReadLease &dstLease = lockFirst == this ? *firstLease : *secondLease;
+
+    const MP4TrackId dstId =
+        raw::MP4CloneTrack_wrapper(srcLease.handle(), src.id(), &dstLease.handle(), MP4_INVALID_TRACK_ID);
+    keyframes_.erase(dstId);
+    track_index_.reset();
+    raw::MP4CopySamples_wrapper(srcLease.handle(), src.id(), static_cast<MP4SampleId>(first + 1),
+                                static_cast<uint32_t>(last - first), &dstLease.handle(), dstId);
+    return Track(this, dstId);
+}
+
+Track MP4File::copy_track(MP4File &src_file, const TrackRef &src_track,
+                          const std::optional<std::pair<py::ssize_t, py::ssize_t>> &sample_range,
+                          const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range)
+{
+    const Track src = src_file.resolve_track(src_track);
+    const auto [first, last] = src.sample_bounds(sample_range ? sample_range->first : 0,
+                                                 sample_range ? std::optional<py::ssize_t>(sample_range->second)
+                                                              : std::nullopt,
+                                                 time_range);
+    return copy_samples(src, first, last);
+}
+
+std::vector<Track> MP4File::copy_tracks(MP4File &src_file, const std::optional<std::vector<TrackRef>> &src_tracks,
+                                        const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range)
+{
+    std::vector<Track> sources;
+    if (src_tracks)
+    {
+        for (const auto &ref : *src_tracks)
+        {
+            sources.push_back(src_file.resolve_track(ref));
+        }
+    }
+    else
+    {
+        const Tracks all = src_file.tracks();
+        for (py::ssize_t i = 0; i < all.size(); ++i)
+        {
+            sources.push_back(all.getitem(i));
+        }
+    }
+
+    std::vector<Track> copies;
+    const uint32_t movieScale = src_file.timescale();
+    for (const auto &src : sources)
+    {
+        // time_range is in the movie timescale; each track filters in its own.
+        std::optional<std::pair<MP4Timestamp, MP4Timestamp>> trackRange;
+        if (time_range)
+        {
+            MP4FileHandle h = src_file.handle().get();
+            trackRange.emplace(MP4ConvertToTrackTimestamp(h, src.id(), time_range->first, movieScale),
+                               MP4ConvertToTrackTimestamp(h, src.id(), time_range->second, movieScale));
+        }
+        const auto [first, last] = src.sample_bounds(0, std::nullopt, trackRange);
+        copies.push_back(copy_samples(src, first, last));
+    }
+    return copies;
+}
+
+std::size_t MP4File::readers() const
+{
+    return readers_;
+}
+
+bool MP4File::load_sample_tables() const
+{
+    return load_sample_tables_;
+}
+
+bool MP4File::mmap() const
+{
+    return mmap_;
+}
+
+bool MP4File::has_path() const
+{
+    return has_path_;
+}
+
+std::shared_ptr<raw::MP4Atom> MP4File::atoms() const
+{
+    ensure_open();
+    if (source_)
+    {
+        throw MP4Error("atoms() needs a file path: " + filename_);
+    }
+    return raw::MP4Atom::open(filename_);
+}
+
+ReadLease MP4File::read_handle()
+{
+    ensure_open();
+    if (reader_pool_)
+    {
+        return ReadLease(reader_pool_->acquire());
+    }
+    std::unique_lock<std::mutex> lock(*read_mutex_, std::defer_lock);
+    {
+        py::gil_scoped_release release;
+        lock.lock();
+    }
+    ensure_open();
+    return ReadLease(std::move(lock), handle_);
 }
 
 Tracks MP4File::tracks()
@@ -432,6 +1323,68 @@ Tags &MP4File::tags()
 
 void bind_highlevel(py::module_ &m, py::module_ &m_raw)
 {
+    py::class_<Keyframes, std::shared_ptr<Keyframes>>(m, "Keyframes",
+                                                       "Sync samples of a track, sorted: 0-based sample indices "
+                                                       "(uint32) and start times (uint64, track timescale).")
+        .def_property_readonly("indices", [](const Keyframes &k)
+                               { return raw::to_memoryview(k.indices); })
+        .def_property_readonly("times", [](const Keyframes &k)
+                               { return raw::to_memoryview(k.times); })
+        .def("__len__", [](const Keyframes &k)
+             { return k.indices.size(); });
+
+    py::class_<PrefetchStats>(m, "PrefetchStats",
+                              "Queue counters of a prefetching SampleIterator. consumer_waits counts "
+                              "reads that found the queue empty (raise prefetch); producer_waits counts "
+                              "reads that found it full.")
+        .def_readonly("capacity", &PrefetchStats::capacity)
+        .def_readonly("produced", &PrefetchStats::produced)
+        .def_readonly("consumed", &PrefetchStats::consumed)
+        .def_readonly("max_depth", &PrefetchStats::max_depth)
+        .def_readonly("consumer_waits", &PrefetchStats::consumer_waits)
+        .def_readonly("producer_waits", &PrefetchStats::producer_waits)
+        .def_readonly("mean_depth", &PrefetchStats::mean_depth,
+                      "Average queue depth seen by the consumer at each read.")
+        .def("__repr__",
+             [](const PrefetchStats &s)
+             {
+                 return "<PrefetchStats capacity=" + std::to_string(s.capacity) + " consumed=" +
+                        std::to_string(s.consumed) + " consumer_waits=" + std::to_string(s.consumer_waits) +
+                        " producer_waits=" + std::to_string(s.producer_waits) + ">";
+             });
+
+    py::class_<SampleIterator>(m, "SampleIterator", "Iterator returned by Track.iter_samples(); yields Sample.")
+        .def("__iter__", [](py::object self)
+             { return self; })
+        .def("__next__", &SampleIterator::next)
+        .def("__length_hint__", &SampleIterator::remaining)
+        .def_property_readonly("stats", &SampleIterator::stats,
+                               "PrefetchStats snapshot when created with prefetch > 0, else None.");
+
+    py::class_<TrackInfo>(m, "TrackInfo",
+                          "Snapshot of every Track property, read in one native call. Fields that "
+                          "do not apply to the track are None / 0.")
+        .def_readonly("index", &TrackInfo::index, "0-based position in MP4File.tracks.")
+        .def_readonly("id", &TrackInfo::id)
+        .def_readonly("type", &TrackInfo::type)
+        .def_readonly("codec", &TrackInfo::codec, "Sample entry name (avc1, mp4a, ...).")
+        .def_readonly("duration", &TrackInfo::duration)
+        .def_readonly("timescale", &TrackInfo::timescale)
+        .def_readonly("sample_count", &TrackInfo::sample_count)
+        .def_readonly("language", &TrackInfo::language)
+        .def_readonly("name", &TrackInfo::name)
+        .def_readonly("bitrate", &TrackInfo::bitrate, "None when opened with load_sample_tables=False.")
+        .def_readonly("width", &TrackInfo::width)
+        .def_readonly("height", &TrackInfo::height)
+        .def_readonly("frame_rate", &TrackInfo::frame_rate)
+        .def_readonly("audio_channels", &TrackInfo::audio_channels)
+        .def("__repr__",
+             [](const TrackInfo &t)
+             {
+                 return "<TrackInfo index=" + std::to_string(t.index) + " id=" + std::to_string(t.id) +
+                        " type=" + t.type + " codec=" + t.codec.value_or("None") + ">";
+             });
+
     py::class_<Track>(m, "Track", "One track of an MP4File. Sample indices are 0-based.")
         .def_property_readonly("id", &Track::id)
         .def_property_readonly("type", &Track::type)
@@ -445,8 +1398,86 @@ void bind_highlevel(py::module_ &m, py::module_ &m_raw)
         .def_property_readonly("bitrate", &Track::bitrate)
         .def_property_readonly("frame_rate", &Track::frame_rate)
         .def_property_readonly("audio_channels", &Track::audio_channels)
+        .def("info", &Track::info,
+             "All properties as a TrackInfo, read in one native call without raising for "
+             "absent fields.")
+        .def_property_readonly("max_sample_size", &Track::max_sample_size)
         .def("read_sample", &Track::read_sample, py::arg("index"),
              "Read sample at 0-based index. Returns Sample (data + timing).")
+        .def("read_sample_into", &Track::read_sample_into, py::arg("index"), py::arg("buf"),
+             R"doc(
+    Read sample at 0-based index into ``buf`` (any writable contiguous buffer) without
+    allocating. The payload fills ``buf[:info.numBytes]``. Returns SampleInfo (byte count
+    + timing). Size ``buf`` once with ``max_sample_size``; a smaller buffer raises MP4Error.
+)doc")
+        .def("read_samples", &Track::read_samples, py::arg("start") = 0, py::arg("stop") = py::none(),
+             R"doc(
+    Read samples ``[start, stop)`` (0-based, slice semantics) in one native call.
+
+    Returns SampleBatch: ``data`` is one packed memoryview of all payloads, and
+    ``offsets`` / ``sizes`` / ``startTimes`` / ``durations`` / ``renderingOffsets`` /
+    ``syncFlags`` are typed memoryviews (usable with ``numpy.asarray`` without copying).
+    Sample ``i`` of the batch is ``data[offsets[i]:offsets[i] + sizes[i]]``.
+)doc")
+        .def("sample_table", &Track::sample_table,
+             R"doc(
+    Index every sample in one native pass over the sample tables (no payload reads).
+
+    Returns SampleTable; position ``i`` describes sample ``i``. ``sizes`` (uint32),
+    ``offsets`` (file offsets), ``startTimes``, ``durations``, ``renderingOffsets``
+    (uint64) and ``syncFlags`` (uint8) are read-only memoryviews that
+    ``numpy.asarray`` wraps without copying.
+)doc")
+        .def_property_readonly("keyframes", &Track::keyframes,
+                               "Keyframes (sync samples) of the track, built once per open handle.")
+        .def("sample_view", &Track::sample_view, py::arg("index"),
+             R"doc(
+    Sample ``index`` (0-based, negative counts from the end) as a read-only memoryview
+    straight into the memory-mapped file; no bytes are copied. Needs
+    ``MP4File(..., mmap=True)``.
+
+    The offset and size come from the track's sample table (stco/co64, stsc, stsz),
+    parsed once per open handle. The view holds its own reference to the mapping, so it
+    stays valid after ``close()``. Do not truncate the file while views are alive.
+)doc")
+        .def("seek", &Track::seek, py::arg("time"), py::arg("mode") = "prev_key",
+             R"doc(
+    0-based index of the keyframe for ``time`` (track timescale), found by binary search
+    over the cached ``keyframes`` with no further native calls.
+
+    ``mode``: ``"prev_key"`` (last keyframe at or before ``time``), ``"next_key"`` (first
+    at or after) or ``"nearest"`` (closer start time; ties go to the earlier one). Results
+    clamp to the first / last keyframe. IndexError if the track has no samples.
+)doc")
+        .def("iter_samples", &Track::iter_samples, py::arg("start") = 0, py::arg("stop") = py::none(),
+             py::arg("step") = 1, py::arg("time_range") = py::none(), py::arg("chunk") = 64,
+             py::arg("prefetch") = 0, py::keep_alive<0, 1>(),
+             R"doc(
+    Iterate samples ``[start:stop:step]`` (0-based, slice semantics, ``step`` > 0).
+
+    ``time_range=(begin, end)`` (track timescale) further limits the range to samples
+    overlapping ``[begin, end)``. Samples are read ``chunk`` at a time with the GIL
+    released; the count is taken once when the iterator is created.
+
+    ``prefetch=N`` (mode ``"r"`` only) starts a background thread with its own read
+    handle that keeps up to N samples queued, so disk reads overlap the consumer.
+    ``iterator.stats`` then reports queue depth counters.
+)doc")
+        .def("write_samples", &Track::write_samples, py::arg("payload"), py::arg("sizes"),
+             py::arg("durations") = py::none(), py::arg("rendering_offsets") = py::none(),
+             py::arg("sync") = py::none(),
+             R"doc(
+    Append ``len(sizes)`` samples in one native call (modes ``"w"`` / ``"a"`` / ``"r+"``).
+
+    ``payload`` is any contiguous buffer (bytes, memoryview, numpy array) holding the
+    samples back to back. ``sizes``, ``durations``, ``rendering_offsets`` and ``sync``
+    are integer / bool arrays or sequences of the same length; a SampleBatch's
+    ``data`` / ``sizes`` / ``durations`` / ``renderingOffsets`` / ``syncFlags`` fit
+    directly. None means MP4_INVALID_DURATION / 0 / all sync. Raises MP4Error on a
+    read-only file, a size mismatch, or the first sample mp4v2 rejects.
+)doc")
+        .def("__iter__", [](const Track &t)
+             { return t.iter_samples(); }, py::keep_alive<0, 1>())
         .def("__len__", &Track::sample_count)
         .def("__getitem__", &Track::read_sample, py::arg("index"))
         .def("__repr__",
@@ -455,9 +1486,35 @@ void bind_highlevel(py::module_ &m, py::module_ &m_raw)
                  return "<Track id=" + std::to_string(t.id()) + " type=" + t.type() + ">";
              });
 
-    py::class_<Tracks>(m, "Tracks", "Sequence of Track objects on an MP4File.")
+    py::class_<Tracks>(m, "Tracks",
+                       "Sequence of Track objects on an MP4File. Track ids and types are indexed "
+                       "once per open handle.")
         .def("__len__", &Tracks::size)
-        .def("__getitem__", &Tracks::getitem, py::arg("index"), py::keep_alive<0, 1>());
+        .def("__getitem__", &Tracks::getitem, py::arg("index"), py::keep_alive<0, 1>())
+        .def("by_id", &Tracks::by_id, py::arg("id"), py::keep_alive<0, 1>(),
+             "Track with this mp4v2 track id. KeyError if there is none.")
+        .def(
+            "of_type",
+            [](py::object self, const std::string &type)
+            {
+                // keep_alive<0, 1> cannot target a list; tie each Track to Tracks instead.
+                py::list out;
+                for (auto &track : self.cast<const Tracks &>().of_type(type))
+                {
+                    py::object item = py::cast(std::move(track));
+                    py::detail::keep_alive_impl(item, self);
+                    out.append(item);
+                }
+                return out;
+            },
+            py::arg("type"),
+            R"doc(
+    Tracks of one handler type, in file order. ``type`` is ``"audio"``, ``"video"``,
+    ``"text"``, ``"subtitle"``, ``"hint"``, ``"od"``, ``"scene"`` or a four-character
+    code such as ``"soun"``.
+)doc")
+        .def("snapshot", &Tracks::snapshot,
+             "TrackInfo for every track, gathered in one native call with the GIL released.");
 
     auto tags_cls = py::class_<Tags>(m, "Tags",
                                      "iTMF tags on an MP4File. Fetch on first access; store() on "
@@ -718,29 +1775,124 @@ void bind_highlevel(py::module_ &m, py::module_ &m_raw)
     py::class_<MP4File>(m, "MP4File",
                         "High-level MP4 file object. Owns a handle via RAII; close() (and "
                         "__exit__) persist pending writes for create/modify handles.")
-        .def(py::init<const std::string &, const std::string &>(), py::arg("filename"), py::arg("mode") = "r",
+        .def(py::init<const std::string &, const std::string &, std::size_t, uint32_t, bool, bool>(),
+             py::arg("filename"), py::arg("mode") = "r", py::arg("readers") = 0, py::arg("padding") = 4096,
+             py::kw_only(), py::arg("load_sample_tables") = true, py::arg("mmap") = false,
              R"doc(
     Open or create an MP4 file.
 
     Args:
         filename: Path to the file.
-        mode: ``"r"`` (read, default), ``"w"`` (create/truncate), ``"a"`` or ``"r+"`` (modify).
+        mode: ``"r"`` (read, default), ``"w"`` (create/truncate), ``"a"`` or ``"r+"`` (modify),
+            or ``"t"`` (read, plus writable tags stored in place; see ``last_tag_write``).
+        readers: Mode ``"r"`` only. Number of extra MP4Read handles kept for sample reads,
+            so ``Track.read_sample`` and friends can run in parallel from several threads.
+            With 0 (default) sample reads share the main handle and are serialised.
+        padding: Mode ``"t"`` only. Free bytes reserved at the end of moov when a tag
+            update does not fit in place, so the next one does.
+        load_sample_tables: Modes ``"r"`` / ``"t"``. False opens only the headers: the
+            sample tables (stts, stsz, stco, ...) are skipped on disk instead of loaded,
+            which is much faster on long files. Track and tag accessors work as usual,
+            including ``sample_count``; ``bitrate``, ``max_sample_size`` and every sample
+            read raise MP4Error. See ``pymp4v2.probe``.
+        mmap: Mode ``"r"`` only. Also map the file read-only into memory, so
+            ``Track.sample_view`` can hand out payloads as memoryviews into the mapping
+            instead of copies.
 
     Raises:
         MP4Error: If the mode is unknown or the file cannot be opened. Errors include the filename.
 )doc")
-        .def("close", &MP4File::close,
-             "Close the file. For create/modify handles this writes pending changes "
-             "and stores dirty tags. Safe to call twice.")
+        .def_static("from_buffer", &MP4File::from_buffer, py::arg("buffer"),
+                    R"doc(
+    Open an MP4 held in memory, read-only (mode ``"r"``).
+
+    ``buffer`` is any buffer-protocol object (``bytes``, ``bytearray``, ``memoryview``,
+    ``mmap``, numpy). mp4v2 reads it in place through ``MP4ReadCallbacks``; it is not
+    copied, and it stays referenced (and, for ``bytearray``, locked against resizing)
+    until ``close()``. ``filename`` is ``"<buffer>"``.
+
+    Raises:
+        MP4Error: If mp4v2 cannot parse the data.
+)doc")
+        .def_static("from_fileobj", &MP4File::from_fileobj, py::arg("fileobj"), py::kw_only(),
+                    py::arg("read_size") = 1 << 20,
+                    R"doc(
+    Open an MP4 from a seekable binary file object, read-only (mode ``"r"``).
+
+    Reads go through one ``read_size`` window: mp4v2's small header reads are served
+    from it and each miss is one ``seek`` plus ``readinto`` (or ``read``) of the whole
+    window; reads larger than the window go straight into mp4v2's buffer. The object
+    is called with the GIL held, from whichever thread reads samples, and must not be
+    used elsewhere while the MP4File is open. ``filename`` is ``fileobj.name`` when
+    that is a string, else ``"<fileobj>"``.
+
+    ``optimize()``, ``readers`` and ``iter_samples(prefetch=...)`` need a path and
+    raise MP4Error on files opened this way (as do ``from_buffer`` files).
+
+    Raises:
+        MP4Error: If the object is not seekable or mp4v2 cannot parse the data; the
+            message includes any exception raised by the object.
+)doc")
+        .def_static("create_buffer", &MP4File::create_buffer,
+                    R"doc(
+    Create a new MP4 in a growable in-memory buffer (mode ``"w"``, ``filename``
+    ``"<buffer>"``) through ``MP4CreateCallbacks``; nothing touches the filesystem.
+
+    Use it like ``MP4File(path, "w")``; ``save()`` / ``checkpoint()`` reopen over the
+    same buffer with ``MP4ModifyCallbacks``. ``close()`` returns the finished file as a
+    read-only ``memoryview`` over the buffer (no copy), also available afterwards from
+    ``getvalue()``.
+)doc")
+        .def_static("create_fileobj", &MP4File::create_fileobj, py::arg("fileobj"),
+                    R"doc(
+    Create a new MP4 by writing to a binary file object (mode ``"w"``), e.g. an
+    ``io.BytesIO`` or an open file.
+
+    The object needs ``write()`` and ``seek()``: mp4v2 patches the mdat size and appends
+    moov on close. It is truncated to zero first when it has ``truncate()``.
+    ``save()`` and reading samples back also need ``readinto()`` or ``read()``. The
+    object is called with the GIL held and must not be used elsewhere until
+    ``close()``. ``filename`` is ``fileobj.name`` when that is a string, else
+    ``"<fileobj>"``.
+
+    Raises:
+        MP4Error: If the object cannot write and seek, or a write fails (the message
+            includes the exception raised by the object).
+)doc")
+        .def("getvalue", &MP4File::getvalue,
+             "The finished file of a ``create_buffer()`` MP4File as a read-only memoryview. "
+             "Raises MP4Error before ``close()`` or on other files.")
+        .def(
+            "close",
+            [](MP4File &self) -> py::object
+            {
+                self.close();
+                return self.has_output() ? py::object(self.getvalue()) : py::object(py::none());
+            },
+            "Close the file. For create/modify handles this writes pending changes "
+            "and stores dirty tags. Safe to call twice. Returns the finished bytes as a "
+            "memoryview for ``create_buffer()`` files, else None.")
         .def("get_track_count", &MP4File::get_track_count,
              "Number of tracks. Raises MP4Error if the file is closed.")
         .def("save", &MP4File::save,
              R"doc(
     Persist pending writes and keep the file open.
 
-    mp4v2 has no flush API: writes happen on close. save() closes then reopens with
-    MP4Modify so the object stays usable. Read-only files are a no-op. Never recreates
-    (that would truncate). Raises MP4Error if the file is already closed.
+    mp4v2 has no flush API: writes happen on close. save() stores dirty tags, closes
+    (moov is written, bitrates recomputed) and reopens with MP4Modify so the object stays
+    usable; in-memory tags, the track index and keyframes are kept, not re-read.
+    Read-only files are a no-op. Never recreates (that would truncate). Raises MP4Error
+    if the file is already closed.
+)doc")
+        .def("checkpoint", &MP4File::checkpoint,
+             R"doc(
+    Cheaper ``save()`` for periodic flushes while recording.
+
+    Same close / MP4Modify reopen cycle, but closes with
+    ``MP4_CLOSE_DO_NOT_COMPUTE_BITRATE`` so mp4v2 skips the per-track bitrate pass over
+    every sample; the bitrate fields are brought up to date by the next ``save()`` or
+    ``close()``. In mode ``"t"`` only dirty tags are stored (in place when they fit);
+    in mode ``"r"`` it is a no-op.
 )doc")
         .def("is_open", &MP4File::is_open, "True if the handle is still valid.")
         .def("get_info", &MP4File::get_info,
@@ -748,16 +1900,84 @@ void bind_highlevel(py::module_ &m, py::module_ &m_raw)
         .def_property_readonly("info", &MP4File::get_info)
         .def_property_readonly("filename", &MP4File::filename)
         .def_property_readonly("mode", &MP4File::mode)
+        .def_property_readonly("readers", &MP4File::readers, "Size of the sample reader pool (0 if none).")
+        .def_property_readonly("load_sample_tables", &MP4File::load_sample_tables,
+                               "False if the file was opened headers-only (see ``pymp4v2.probe``).")
+        .def_property_readonly("mmap", &MP4File::mmap, "True if the file is memory-mapped for ``Track.sample_view``.")
+        .def_property_readonly("has_path", &MP4File::has_path,
+                               "False for ``from_buffer`` / ``from_fileobj`` / ``create_buffer`` / "
+                               "``create_fileobj`` files, whose ``filename`` is only a label.")
+        .def("atoms", &MP4File::atoms,
+             R"doc(
+    Root ``Atom`` of the box tree, read from the atom headers of the file on disk (not
+    printed like ``raw.MP4Dump``). Children are parsed when first visited, so a shallow
+    walk or ``find("moov.trak[1].mdia.minf.stbl.stsz")`` reads only a few headers. In
+    modes ``"w"`` / ``"a"`` / ``"r+"`` the tree shows the file as of the last ``save()``.
+    Raises MP4Error on files opened from a buffer or file object.
+)doc")
+        .def_property_readonly("last_tag_write", &MP4File::last_tag_write,
+                               R"doc(
+    How mode ``"t"`` last stored tags: ``"in_place"`` (only moov.udta and the free space
+    around it were overwritten), ``"rewrite"`` (MP4Modify path; moov moved to the end of the
+    file) or None if nothing was stored yet.
+)doc")
         .def_property_readonly("duration", &MP4File::duration, "Movie duration in movie timescale units.")
         .def_property_readonly("timescale", &MP4File::timescale, "Movie timescale (ticks per second).")
         .def_property_readonly("tracks", py::cpp_function(&MP4File::tracks, py::keep_alive<0, 1>()))
         .def_property_readonly("tags", &MP4File::tags, py::return_value_policy::reference_internal)
-        .def("optimize", &MP4File::optimize, py::arg("new_filename") = py::none(),
+        .def("copy_track", &MP4File::copy_track, py::arg("src_file"), py::arg("src_track"), py::kw_only(),
+             py::arg("sample_range") = py::none(), py::arg("time_range") = py::none(), py::keep_alive<0, 1>(),
+             R"doc(
+    Add a copy of a track of ``src_file`` (``self`` is allowed) and return the new Track.
+
+    ``src_track`` is a 0-based index into ``src_file.tracks`` or one of its Track objects.
+    The definition is cloned with MP4CloneTrack and the samples are copied with
+    MP4CopySample in one GIL-released loop, keeping durations, rendering offsets and
+    sync flags. ``sample_range=(start, stop)`` (0-based, slice semantics) and
+    ``time_range=(begin, end)`` (source track timescale, samples overlapping it) select
+    a subset. Needs mode ``"w"`` / ``"a"`` / ``"r+"``.
+)doc")
+        .def(
+            "copy_tracks",
+            [](py::object self, MP4File &src_file, const std::optional<std::vector<TrackRef>> &src_tracks,
+               const std::optional<std::pair<MP4Timestamp, MP4Timestamp>> &time_range)
+            {
+                // keep_alive<0, 1> cannot target a list; tie each Track to the file instead.
+                py::list out;
+                for (auto &track : self.cast<MP4File &>().copy_tracks(src_file, src_tracks, time_range))
+                {
+                    py::object item = py::cast(std::move(track));
+                    py::detail::keep_alive_impl(item, self);
+                    out.append(item);
+                }
+                return out;
+            },
+            py::arg("src_file"), py::arg("src_tracks") = py::none(), py::kw_only(), py::arg("time_range") = py::none(),
+            R"doc(
+    ``copy_track`` for each of ``src_tracks`` (default: every track) in order; returns the
+    new Tracks. ``time_range`` is in the movie timescale of ``src_file``.
+)doc")
+        .def("optimize", &MP4File::optimize, py::arg("new_filename") = py::none(), py::kw_only(),
+             py::arg("progress") = py::none(), py::arg("chunk_size") = py::none(), py::arg("cancel") = py::none(),
              R"doc(
     Rewrite the file with interleaved samples and moov at the front (MP4Optimize).
 
     Closes the handle first so pending writes are on disk, then reopens if it was open.
     ``new_filename`` None optimizes in place.
+
+    Passing any of ``progress``, ``chunk_size`` or ``cancel`` switches to a streaming
+    rewrite: moov is moved to the front with its chunk offsets patched and the media
+    data is copied sequentially in ``chunk_size`` byte pieces (default 8 MiB) through
+    ``<target>.pymp4v2-optimize``, which is renamed over the target at the end. Samples
+    keep their original order (no re-interleaving). Peak memory is ``chunk_size`` plus
+    about twice the moov size.
+
+    ``progress(done, total)`` is called in bytes after each chunk. ``cancel`` is a
+    ``threading.Event`` (or anything with ``is_set()``) or a callable returning true
+    to stop; the temp file is removed and the target is left untouched. Both run on
+    the calling thread; an exception from either aborts the same way.
+
+    Returns True, or False if cancelled.
 )doc")
         .def("__enter__", [](MP4File &self) -> MP4File &
              { return self; }, py::return_value_policy::reference)
@@ -766,5 +1986,21 @@ void bind_highlevel(py::module_ &m, py::module_ &m_raw)
                  self.close();
                  return false; });
 
+    m.def(
+        "probe", [](const std::string &filename)
+        { return MP4File(filename, "r", 0, 4096, false); },
+        py::arg("filename"),
+        R"doc(
+    Open ``filename`` headers-only: ``MP4File(filename, "r", load_sample_tables=False)``.
+
+    Only ftyp and moov are read, with the sample tables seeked over, so track types,
+    durations, timescales, sample counts, dimensions, codecs and tags come back without
+    the cost of loading per-sample tables. Sample APIs raise MP4Error.
+)doc");
+
     m.attr("Sample") = m_raw.attr("MP4Sample");
+    m.attr("SampleBatch") = m_raw.attr("MP4SampleBatch");
+    m.attr("SampleInfo") = m_raw.attr("MP4SampleInfo");
+    m.attr("SampleTable") = m_raw.attr("MP4SampleTable");
+    m.attr("Atom") = m_raw.attr("MP4Atom");
 }
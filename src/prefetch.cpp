@@ -0,0 +1,134 @@
+#include "pymp4v2/prefetch.h"
+
+#include <algorithm>
+#include <utility>
+
+#include "pymp4v2/error.h"
+
+namespace py = pybind11;
+
+SamplePrefetcher::SamplePrefetcher(std::string filename, MP4TrackId trackId, MP4SampleId first, MP4SampleId stop,
+                                   uint32_t step, std::size_t capacity)
+    : filename_(std::move(filename)), track_id_(trackId), first_(first), stop_(stop), step_(step),
+      capacity_(capacity > 0 ? capacity : 1)
+{
+    stats_.capacity = capacity_;
+    thread_ = std::thread(&SamplePrefetcher::run, this);
+}
+
+SamplePrefetcher::~SamplePrefetcher()
+{
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        cancelled_ = true;
+    }
+    not_full_.notify_all();
+    if (!thread_.joinable())
+    {
+        return;
+    }
+    // The worker only sees cancelled_ between samples, so it may still be inside a slow
+    // MP4ReadSample; do not keep other Python threads waiting for it.
+    if (PyGILState_Check())
+    {
+        py::gil_scoped_release release;
+        thread_.join();
+    }
+    else
+    {
+        thread_.join();
+    }
+}
+
+void SamplePrefetcher::run()
+{
+    MP4FileHandle h = MP4Read(filename_.c_str());
+    std::string error = h == nullptr ? "Failed to open MP4 file for prefetch: " + filename_ : std::string();
+    for (MP4SampleId id = first_; h != nullptr && id < stop_; id = stop_ - id > step_ ? id + step_ : stop_)
+    {
+        uint8_t *bytes = nullptr;
+        uint32_t numBytes = 0;
+        raw::MP4SampleData sample;
+        if (!MP4ReadSample(h, track_id_, id, &bytes, &numBytes, &sample.startTime, &sample.duration,
+                           &sample.renderingOffset, &sample.isSyncSample))
+        {
+            MP4Free(bytes);
+            error = "MP4ReadSample failed at sampleId " + std::to_string(id);
+            break;
+        }
+        sample.data = raw::adopt_mp4_bytes(bytes, numBytes);
+
+        std::unique_lock<std::mutex> lock(mutex_);
+        if (queue_.size() >= capacity_ && !cancelled_)
+        {
+            ++stats_.producer_waits;
+            not_full_.wait(lock, [this]
+                           { return queue_.size() < capacity_ || cancelled_; });
+        }
+        if (cancelled_)
+        {
+            break;
+        }
+        queue_.push_back(std::move(sample));
+        ++stats_.produced;
+        stats_.max_depth = std::max(stats_.max_depth, queue_.size());
+        lock.unlock();
+        not_empty_.notify_one();
+    }
+    if (h != nullptr)
+    {
+        MP4Close(h);
+    }
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        error_ = std::move(error);
+        done_ = true;
+    }
+    not_empty_.notify_all();
+}
+
+bool SamplePrefetcher::pop(raw::MP4SampleData &out)
+{
+    std::string error;
+    bool got = false;
+    {
+        py::gil_scoped_release release;
+        std::unique_lock<std::mutex> lock(mutex_);
+        if (queue_.empty() && !done_)
+        {
+            ++stats_.consumer_waits;
+            not_empty_.wait(lock, [this]
+                            { return !queue_.empty() || done_; });
+        }
+        if (!queue_.empty())
+        {
+            depth_sum_ += queue_.size();
+            out = std::move(queue_.front());
+            queue_.pop_front();
+            ++stats_.consumed;
+            got = true;
+        }
+        else
+        {
+            error = error_;
+        }
+    }
+    if (got)
+    {
+        not_full_.notify_one();
+        return true;
+    }
+    if (!error.empty())
+    {
+        throw MP4Error(error);
+    }
+    return false;
+}
+
+PrefetchStats SamplePrefetcher::stats() const
+{
+    std::lock_guard<std::mutex> lock(mutex_);
+    PrefetchStats result = stats_;
+    result.mean_depth = stats_.consumed > 0 ? static_cast<double>(depth_sum_) / stats_.consumed : 0.0;
+    return result;
+}
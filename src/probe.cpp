@@ -0,0 +1,124 @@
+#include "pymp4v2/probe.h"
+
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <initializer_list>
+
+#include "pymp4v2/atoms.h"
+#include "pymp4v2/error.h"
+
+namespace
+{
+    using atoms::Atom;
+
+    // Full atom with version/flags 0 and the given 32-bit fields.
+    std::string full_atom(const std::string &type, std::initializer_list<uint32_t> fields)
+    {
+        std::string body(4, '\0');
+        for (const uint32_t field : fields)
+        {
+            unsigned char b[4];
+            atoms::store_be(b, field, 4);
+            body.append(reinterpret_cast<const char *>(b), 4);
+        }
+        return atoms::make_header(type, body.size()) + body;
+    }
+
+    // stsz with the original sample count and a constant size, so no table follows.
+    std::string sample_size_atom(std::istream &in, const Atom &atom)
+    {
+        // stsz: version/flags, sample_size, sample_count.
+        // stz2: version/flags, reserved(3) + field_size(1), sample_count.
+        if (atom.size < atom.header + 12)
+        {
+            throw MP4Error("Truncated '" + atom.type + "' atom");
+        }
+        const auto fields = atoms::read_bytes(in, atom.body(), 12);
+        const auto *p = reinterpret_cast<const unsigned char *>(fields.data());
+        const auto count = static_cast<uint32_t>(atoms::load_be(p + 8, 4));
+        const auto size = atom.type == "stsz" ? static_cast<uint32_t>(atoms::load_be(p + 4, 4)) : 0;
+        return full_atom("stsz", {size != 0 ? size : 1, count});
+    }
+
+    std::string stbl_child(std::istream &in, const Atom &atom)
+    {
+        if (atom.type == "stsd")
+        {
+            return atoms::read_bytes(in, atom.start, atom.size);
+        }
+        if (atom.type == "stsz" || atom.type == "stz2")
+        {
+            return sample_size_atom(in, atom);
+        }
+        if (atom.type == "stts" || atom.type == "stsc" || atom.type == "stco" || atom.type == "co64")
+        {
+            return full_atom(atom.type, {0});
+        }
+        return std::string();
+    }
+
+    std::string trim_container(std::istream &in, const Atom &atom)
+    {
+        const auto children = atoms::read_atoms(in, atom.body(), atom.end());
+        if (!children)
+        {
+            throw MP4Error("Malformed '" + atom.type + "' atom");
+        }
+        std::string body;
+        for (const auto &child : *children)
+        {
+            if (atom.type == "stbl")
+            {
+                body += stbl_child(in, child);
+            }
+            else if (atoms::leads_to_stbl(child.type))
+            {
+                body += trim_container(in, child);
+            }
+            else
+            {
+                body += atoms::read_bytes(in, child.start, child.size);
+            }
+        }
+        return atoms::make_header(atom.type, body.size()) + body;
+    }
+} // namespace
+
+ProbeImage::ProbeImage(const std::string &filename)
+{
+    std::ifstream in(filename, std::ios::binary);
+    if (!in)
+    {
+        throw MP4Error("Failed to open MP4 file: " + filename);
+    }
+    const auto top = atoms::read_atoms(in, 0, atoms::file_size(in));
+    const Atom *moov = top ? atoms::find_atom(*top, "moov") : nullptr;
+    if (moov == nullptr)
+    {
+        throw MP4Error("No moov atom found for header-only probe: " + filename);
+    }
+    try
+    {
+        if (const Atom *ftyp = atoms::find_atom(*top, "ftyp"))
+        {
+            data_ = atoms::read_bytes(in, ftyp->start, ftyp->size);
+        }
+        data_ += trim_container(in, *moov);
+    }
+    catch (const MP4Error &e)
+    {
+        throw MP4Error(std::string(e.what()) + ": " + filename);
+    }
+}
+
+int64_t ProbeImage::size() const
+{
+    return static_cast<int64_t>(data_.size());
+}
+
+bool ProbeImage::read_at(int64_t pos, void *buffer, int64_t size)
+{
+    std::memcpy(buffer, data_.data() + pos, static_cast<std::size_t>(size));
+    return true;
+}
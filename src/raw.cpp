@@ -2,6 +2,7 @@
 #include "pymp4v2/error.h"
 #include "pymp4v2/raw.h"
 
+#include <algorithm>
 #include <cstring>
 
 namespace raw
@@ -16,6 +17,16 @@ namespace raw
             }
         }
 
+        // mp4v2 takes uint32_t byte counts; refuse rather than truncate larger buffers.
+        uint32_t checked_size(const BufferView &view, const char *what)
+        {
+            if (view.size() > UINT32_MAX)
+            {
+                throw MP4Error(std::string(what) + ": buffer exceeds 4 GiB");
+            }
+            return static_cast<uint32_t>(view.size());
+        }
+
         MP4TrackId require_track(MP4TrackId id, const char *what)
         {
             if (id == MP4_INVALID_TRACK_ID)
@@ -52,20 +63,61 @@ namespace raw
                 throw MP4Error(std::string(what) + " failed");
             }
             MP4SampleData sample;
-            if (bytes != nullptr && numBytes > 0)
-            {
-                sample.data.assign(reinterpret_cast<char *>(bytes), numBytes);
-            }
-            if (bytes != nullptr)
-            {
-                MP4Free(bytes);
-            }
+            sample.data = adopt_mp4_bytes(bytes, numBytes);
             sample.startTime = startTime;
             sample.duration = duration;
             sample.renderingOffset = renderingOffset;
             sample.isSyncSample = isSyncSample;
             return sample;
         }
+
+        // Reads stbl properties of one track by name; the first failure is remembered
+        // so a table walk can run with the GIL released and report afterwards.
+        class SampleTableReader
+        {
+        public:
+            SampleTableReader(MP4FileHandle h, MP4TrackId trackId) : h_(h), trackId_(trackId) {}
+
+            bool has(const char *box) const
+            {
+                return MP4HaveTrackAtom(h_, trackId_, (std::string("mdia.minf.stbl.") + box).c_str());
+            }
+
+            uint64_t value(const char *box, const char *field)
+            {
+                return read(std::string("mdia.minf.stbl.") + box + "." + field);
+            }
+
+            uint64_t entry(const char *box, uint64_t index, const char *field)
+            {
+                return read(std::string("mdia.minf.stbl.") + box + ".entries[" + std::to_string(index) + "]." + field);
+            }
+
+            bool ok() const
+            {
+                return failed_.empty();
+            }
+
+            const std::string &failed() const
+            {
+                return failed_;
+            }
+
+        private:
+            uint64_t read(const std::string &name)
+            {
+                uint64_t v = 0;
+                if (failed_.empty() && !MP4GetTrackIntegerProperty(h_, trackId_, name.c_str(), &v))
+                {
+                    failed_ = name;
+                }
+                return v;
+            }
+
+            MP4FileHandle h_;
+            MP4TrackId trackId_;
+            std::string failed_;
+        };
     } // namespace
 
     MP4FileHandleWrapper MP4Read_wrapper(const char *fileName)
@@ -228,6 +280,32 @@ namespace raw
         return require_track(id, "MP4AddVideoTrack");
     }
 
+    MP4TrackId MP4CloneTrack_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId,
+                                     MP4FileHandleWrapper *dstFile, MP4TrackId dstHintTrackReferenceTrack)
+    {
+        MP4FileHandle src = srcFile.get();
+        MP4FileHandle dst = dstFile == nullptr ? MP4_INVALID_FILE_HANDLE : dstFile->get();
+        MP4TrackId id;
+        {
+            py::gil_scoped_release release;
+            id = MP4CloneTrack(src, srcTrackId, dst, dstHintTrackReferenceTrack);
+        }
+        return require_track(id, "MP4CloneTrack");
+    }
+
+    MP4TrackId MP4CopyTrack_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4FileHandleWrapper *dstFile,
+                                    bool applyEdits, MP4TrackId dstHintTrackReferenceTrack)
+    {
+        MP4FileHandle src = srcFile.get();
+        MP4FileHandle dst = dstFile == nullptr ? MP4_INVALID_FILE_HANDLE : dstFile->get();
+        MP4TrackId id;
+        {
+            py::gil_scoped_release release;
+            id = MP4CopyTrack(src, srcTrackId, dst, applyEdits, dstHintTrackReferenceTrack);
+        }
+        return require_track(id, "MP4CopyTrack");
+    }
+
     bool MP4HaveAtom_wrapper(MP4FileHandleWrapper &hFile, const char *atomName)
     {
         MP4FileHandle h = hFile.get();
@@ -460,14 +538,14 @@ namespace raw
         require(ok, "MP4SetStringProperty");
     }
 
-    void MP4SetBytesProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, const std::string &data)
+    void MP4SetBytesProperty_wrapper(MP4FileHandleWrapper &hFile, const char *propName, py::buffer data)
     {
         MP4FileHandle h = hFile.get();
+        BufferView view(data, false);
         bool ok;
         {
             py::gil_scoped_release release;
-            ok = MP4SetBytesProperty(h, propName, reinterpret_cast<const uint8_t *>(data.data()),
-                                     static_cast<uint32_t>(data.size()));
+            ok = MP4SetBytesProperty(h, propName, view.data(), checked_size(view, "MP4SetBytesProperty"));
         }
         require(ok, "MP4SetBytesProperty");
     }
@@ -551,14 +629,14 @@ namespace raw
         return take_allocated_bytes(bytes, size);
     }
 
-    void MP4SetTrackESConfiguration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const std::string &data)
+    void MP4SetTrackESConfiguration_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer data)
     {
         MP4FileHandle h = hFile.get();
+        BufferView view(data, false);
         bool ok;
         {
             py::gil_scoped_release release;
-            ok = MP4SetTrackESConfiguration(h, trackId, reinterpret_cast<const uint8_t *>(data.data()),
-                                            static_cast<uint32_t>(data.size()));
+            ok = MP4SetTrackESConfiguration(h, trackId, view.data(), checked_size(view, "MP4SetTrackESConfiguration"));
         }
         require(ok, "MP4SetTrackESConfiguration");
     }
@@ -664,14 +742,15 @@ namespace raw
     }
 
     void MP4SetTrackBytesProperty_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const char *propName,
-                                          const std::string &data)
+                                          py::buffer data)
     {
         MP4FileHandle h = hFile.get();
+        BufferView view(data, false);
         bool ok;
         {
             py::gil_scoped_release release;
-            ok = MP4SetTrackBytesProperty(h, trackId, propName, reinterpret_cast<const uint8_t *>(data.data()),
-                                          static_cast<uint32_t>(data.size()));
+            ok = MP4SetTrackBytesProperty(h, trackId, propName, view.data(),
+                                          checked_size(view, "MP4SetTrackBytesProperty"));
         }
         require(ok, "MP4SetTrackBytesProperty");
     }
@@ -695,6 +774,279 @@ namespace raw
                                   isSyncSample);
     }
 
+    MP4SampleInfo MP4ReadSampleInto_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId sampleId,
+                                            py::buffer buf)
+    {
+        MP4FileHandle h = hFile.get();
+        BufferView view(buf, true);
+        MP4SampleInfo info;
+        uint32_t needed = 0;
+        bool ok = false;
+        {
+            py::gil_scoped_release release;
+            needed = MP4GetSampleSize(h, trackId, sampleId);
+            if (needed <= view.size())
+            {
+                // Caller-buffer mode: a non-null *ppBytes makes mp4v2 read in place.
+                uint8_t empty = 0;
+                uint8_t *bytes = view.size() > 0 ? view.data() : &empty;
+                info.numBytes = static_cast<uint32_t>(std::min<std::size_t>(view.size(), UINT32_MAX));
+                ok = MP4ReadSample(h, trackId, sampleId, &bytes, &info.numBytes, &info.startTime, &info.duration,
+                                   &info.renderingOffset, &info.isSyncSample);
+            }
+        }
+        if (needed > view.size())
+        {
+            throw MP4Error("MP4ReadSampleInto: buffer too small for sampleId " + std::to_string(sampleId) + " (need " +
+                           std::to_string(needed) + " bytes, got " + std::to_string(view.size()) + ")");
+        }
+        require(ok, "MP4ReadSampleInto");
+        return info;
+    }
+
+    MP4SampleBatch MP4ReadSamples_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId firstSampleId,
+                                          uint32_t numSamples)
+    {
+        MP4FileHandle h = hFile.get();
+        std::vector<uint8_t> data;
+        std::vector<uint64_t> offsets(numSamples);
+        std::vector<uint32_t> sizes(numSamples);
+        std::vector<uint64_t> startTimes(numSamples);
+        std::vector<uint64_t> durations(numSamples);
+        std::vector<uint64_t> renderingOffsets(numSamples);
+        std::vector<uint8_t> syncFlags(numSamples);
+        MP4SampleId failed = MP4_INVALID_SAMPLE_ID;
+        {
+            py::gil_scoped_release release;
+            uint64_t total = 0;
+            for (uint32_t i = 0; i < numSamples; ++i)
+            {
+                offsets[i] = total;
+                sizes[i] = MP4GetSampleSize(h, trackId, firstSampleId + i);
+                total += sizes[i];
+            }
+            data.resize(total);
+            for (uint32_t i = 0; i < numSamples; ++i)
+            {
+                // Caller-buffer mode: mp4v2 reads straight into the packed payload.
+                uint8_t empty = 0;
+                uint8_t *bytes = sizes[i] > 0 ? data.data() + offsets[i] : &empty;
+                uint32_t numBytes = sizes[i];
+                bool isSyncSample = false;
+                if (!MP4ReadSample(h, trackId, firstSampleId + i, &bytes, &numBytes, &startTimes[i], &durations[i],
+                                   &renderingOffsets[i], &isSyncSample))
+                {
+                    failed = firstSampleId + i;
+                    break;
+                }
+                syncFlags[i] = isSyncSample ? 1 : 0;
+            }
+        }
+        if (failed != MP4_INVALID_SAMPLE_ID)
+        {
+            throw MP4Error("MP4ReadSamples failed at sampleId " + std::to_string(failed));
+        }
+
+        MP4SampleBatch batch;
+        batch.firstSampleId = firstSampleId;
+        batch.data = ByteArray(std::move(data));
+        batch.offsets = NativeArray<uint64_t>(std::move(offsets));
+        batch.sizes = NativeArray<uint32_t>(std::move(sizes));
+        batch.startTimes = NativeArray<uint64_t>(std::move(startTimes));
+        batch.durations = NativeArray<uint64_t>(std::move(durations));
+        batch.renderingOffsets = NativeArray<uint64_t>(std::move(renderingOffsets));
+        batch.syncFlags = ByteArray(std::move(syncFlags));
+        return batch;
+    }
+
+    MP4SampleTable MP4GetSampleTable_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId)
+    {
+        MP4FileHandle h = hFile.get();
+        SampleTableReader stbl(h, trackId);
+        std::vector<uint32_t> sizes;
+        std::vector<uint64_t> offsets;
+        std::vector<uint64_t> startTimes;
+        std::vector<uint64_t> durations;
+        std::vector<uint64_t> renderingOffsets;
+        std::vector<uint8_t> syncFlags;
+        {
+            py::gil_scoped_release release;
+            const uint64_t n = MP4GetTrackNumberOfSamples(h, trackId);
+            sizes.resize(n);
+            offsets.resize(n);
+            startTimes.resize(n);
+            durations.resize(n);
+            renderingOffsets.resize(n);
+            syncFlags.assign(n, 1);
+
+            // stsz: one fixed size, or one entry per sample. stz2 has no named
+            // properties, so fall back to the per-sample getter.
+            if (stbl.has("stsz"))
+            {
+                const uint64_t fixed = stbl.value("stsz", "sampleSize");
+                for (uint64_t i = 0; i < n && stbl.ok(); ++i)
+                {
+                    sizes[i] = static_cast<uint32_t>(fixed != 0 ? fixed : stbl.entry("stsz", i, "entrySize"));
+                }
+            }
+            else
+            {
+                for (uint64_t i = 0; i < n; ++i)
+                {
+                    sizes[i] = MP4GetSampleSize(h, trackId, static_cast<MP4SampleId>(i + 1));
+                }
+            }
+
+            // stts: run-length (sampleCount, sampleDelta) pairs.
+            uint64_t s = 0;
+            MP4Timestamp t = 0;
+            const uint64_t sttsCount = stbl.value("stts", "entryCount");
+            for (uint64_t e = 0; e < sttsCount && s < n && stbl.ok(); ++e)
+            {
+                const uint64_t count = stbl.entry("stts", e, "sampleCount");
+                const uint64_t delta = stbl.entry("stts", e, "sampleDelta");
+                for (uint64_t k = 0; k < count && s < n; ++k, ++s)
+                {
+                    startTimes[s] = t;
+                    durations[s] = delta;
+                    t += delta;
+                }
+            }
+
+            // ctts: run-length (sampleCount, sampleOffset) pairs; absent means all zero.
+            if (stbl.has("ctts"))
+            {
+                s = 0;
+                const uint64_t cttsCount = stbl.value("ctts", "entryCount");
+                for (uint64_t e = 0; e < cttsCount && s < n && stbl.ok(); ++e)
+                {
+                    const uint64_t count = stbl.entry("ctts", e, "sampleCount");
+                    const uint64_t offset = stbl.entry("ctts", e, "sampleOffset");
+                    for (uint64_t k = 0; k < count && s < n; ++k, ++s)
+                    {
+                        renderingOffsets[s] = offset;
+                    }
+                }
+            }
+
+            // stss: 1-based sync sample numbers; absent means every sample is sync.
+            if (stbl.has("stss"))
+            {
+                std::fill(syncFlags.begin(), syncFlags.end(), 0);
+                const uint64_t stssCount = stbl.value("stss", "entryCount");
+                for (uint64_t e = 0; e < stssCount && stbl.ok(); ++e)
+                {
+                    const uint64_t number = stbl.entry("stss", e, "sampleNumber");
+                    if (number >= 1 && number <= n)
+                    {
+                        syncFlags[number - 1] = 1;
+                    }
+                }
+            }
+
+            // stsc maps runs of chunks to samples-per-chunk; stco/co64 give chunk offsets.
+            const char *chunkBox = stbl.has("co64") ? "co64" : "stco";
+            const uint64_t chunkCount = stbl.value(chunkBox, "entryCount");
+            const uint64_t stscCount = stbl.value("stsc", "entryCount");
+            s = 0;
+            for (uint64_t e = 0; e < stscCount && s < n && stbl.ok(); ++e)
+            {
+                const uint64_t firstChunk = stbl.entry("stsc", e, "firstChunk");
+                const uint64_t perChunk = stbl.entry("stsc", e, "samplesPerChunk");
+                const uint64_t endChunk = e + 1 < stscCount ? stbl.entry("stsc", e + 1, "firstChunk") : chunkCount + 1;
+                for (uint64_t chunk = firstChunk; chunk < endChunk && s < n && stbl.ok(); ++chunk)
+                {
+                    uint64_t offset = stbl.entry(chunkBox, chunk - 1, "chunkOffset");
+                    for (uint64_t k = 0; k < perChunk && s < n; ++k, ++s)
+                    {
+                        offsets[s] = offset;
+                        offset += sizes[s];
+                    }
+                }
+            }
+        }
+        if (!stbl.ok())
+        {
+            throw MP4Error("MP4GetSampleTable failed reading " + stbl.failed());
+        }
+
+        MP4SampleTable table;
+        table.sizes = NativeArray<uint32_t>(std::move(sizes));
+        table.offsets = NativeArray<uint64_t>(std::move(offsets));
+        table.startTimes = NativeArray<uint64_t>(std::move(startTimes));
+        table.durations = NativeArray<uint64_t>(std::move(durations));
+        table.renderingOffsets = NativeArray<uint64_t>(std::move(renderingOffsets));
+        table.syncFlags = ByteArray(std::move(syncFlags));
+        return table;
+    }
+
+    MP4SyncSamples read_sync_samples(MP4FileHandleWrapper &hFile, MP4TrackId trackId)
+    {
+        MP4FileHandle h = hFile.get();
+        SampleTableReader stbl(h, trackId);
+        std::vector<uint32_t> indices;
+        std::vector<uint64_t> times;
+        {
+            py::gil_scoped_release release;
+            const uint64_t n = MP4GetTrackNumberOfSamples(h, trackId);
+            if (stbl.has("stss"))
+            {
+                const uint64_t stssCount = stbl.value("stss", "entryCount");
+                indices.reserve(static_cast<std::size_t>(std::min(stssCount, n)));
+                for (uint64_t e = 0; e < stssCount && stbl.ok(); ++e)
+                {
+                    const uint64_t number = stbl.entry("stss", e, "sampleNumber");
+                    if (number >= 1 && number <= n)
+                    {
+                        indices.push_back(static_cast<uint32_t>(number - 1));
+                    }
+                }
+                // stss is increasing by spec; do not trust it for the binary search.
+                if (!std::is_sorted(indices.begin(), indices.end()))
+                {
+                    std::sort(indices.begin(), indices.end());
+                }
+                indices.erase(std::unique(indices.begin(), indices.end()), indices.end());
+            }
+            else
+            {
+                indices.resize(static_cast<std::size_t>(n));
+                for (uint64_t i = 0; i < n; ++i)
+                {
+                    indices[i] = static_cast<uint32_t>(i);
+                }
+            }
+
+            // stts runs: the start of sample i in a run is runStart + (i - firstInRun) * delta.
+            times.reserve(indices.size());
+            std::size_t next = 0;
+            uint64_t first = 0;
+            MP4Timestamp t = 0;
+            const uint64_t sttsCount = stbl.value("stts", "entryCount");
+            for (uint64_t e = 0; e < sttsCount && next < indices.size() && stbl.ok(); ++e)
+            {
+                const uint64_t count = stbl.entry("stts", e, "sampleCount");
+                const uint64_t delta = stbl.entry("stts", e, "sampleDelta");
+                for (; next < indices.size() && indices[next] < first + count; ++next)
+                {
+                    times.push_back(t + (indices[next] - first) * delta);
+                }
+                first += count;
+                t += count * delta;
+            }
+            // Samples past the end of stts (malformed files) start where the timeline ends.
+            times.resize(indices.size(), t);
+        }
+        if (!stbl.ok())
+        {
+            throw MP4Error("MP4GetSyncSamples failed reading " + stbl.failed());
+        }
+        MP4SyncSamples sync;
+        sync.indices = NativeArray<uint32_t>(std::move(indices));
+        sync.times = NativeArray<uint64_t>(std::move(times));
+        return sync;
+    }
+
     MP4SampleData MP4ReadSampleFromTime_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4Timestamp when)
     {
         MP4FileHandle h = hFile.get();
@@ -714,19 +1066,83 @@ namespace raw
                                   isSyncSample);
     }
 
-    void MP4WriteSample_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, const std::string &data,
+    void MP4WriteSample_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer data,
                                 MP4Duration duration, MP4Duration renderingOffset, bool isSyncSample)
     {
         MP4FileHandle h = hFile.get();
+        BufferView view(data, false);
+        const uint32_t size = checked_size(view, "MP4WriteSample");
         bool ok;
         {
             py::gil_scoped_release release;
-            ok = MP4WriteSample(h, trackId, reinterpret_cast<const uint8_t *>(data.data()),
-                                static_cast<uint32_t>(data.size()), duration, renderingOffset, isSyncSample);
+            ok = MP4WriteSample(h, trackId, view.data(), size, duration, renderingOffset, isSyncSample);
         }
         require(ok, "MP4WriteSample");
     }
 
+    void MP4WriteSamples_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, py::buffer payload,
+                                 py::object sizes, py::object durations, py::object renderingOffsets,
+                                 py::object syncFlags)
+    {
+        MP4FileHandle h = hFile.get();
+        BufferView data(payload, false);
+        const auto sizeColumn = uint_column(sizes, "MP4WriteSamples sizes");
+        const std::size_t n = sizeColumn.size();
+        const auto column = [n](const py::object &obj, const char *what, uint64_t fill)
+        {
+            if (obj.is_none())
+            {
+                return std::vector<uint64_t>(n, fill);
+            }
+            auto values = uint_column(obj, what);
+            if (values.size() != n)
+            {
+                throw MP4Error(std::string(what) + ": expected " + std::to_string(n) + " values, got " +
+                               std::to_string(values.size()));
+            }
+            return values;
+        };
+        const auto durationColumn = column(durations, "MP4WriteSamples durations", MP4_INVALID_DURATION);
+        const auto offsetColumn = column(renderingOffsets, "MP4WriteSamples renderingOffsets", 0);
+        const auto syncColumn = column(syncFlags, "MP4WriteSamples syncFlags", 1);
+
+        uint64_t total = 0;
+        for (uint64_t size : sizeColumn)
+        {
+            if (size > UINT32_MAX)
+            {
+                throw MP4Error("MP4WriteSamples: sample size exceeds 4 GiB");
+            }
+            total += size;
+        }
+        if (total != data.size())
+        {
+            throw MP4Error("MP4WriteSamples: sizes add up to " + std::to_string(total) + " bytes but payload has " +
+                           std::to_string(data.size()));
+        }
+
+        std::size_t written = 0;
+        {
+            py::gil_scoped_release release;
+            const uint8_t *p = data.data();
+            for (; written < n; ++written)
+            {
+                const auto size = static_cast<uint32_t>(sizeColumn[written]);
+                if (!MP4WriteSample(h, trackId, p, size, durationColumn[written], offsetColumn[written],
+                                    syncColumn[written] != 0))
+                {
+                    break;
+                }
+                p += size;
+            }
+        }
+        if (written != n)
+        {
+            throw MP4Error("MP4WriteSamples failed at batch index " + std::to_string(written) + " of " +
+                           std::to_string(n) + "; earlier samples were written");
+        }
+    }
+
     void MP4CopySample_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4SampleId srcSampleId,
                                MP4FileHandleWrapper *dstFile, MP4TrackId dstTrackId, MP4Duration dstSampleDuration)
     {
@@ -740,6 +1156,29 @@ namespace raw
         require(ok, "MP4CopySample");
     }
 
+    void MP4CopySamples_wrapper(MP4FileHandleWrapper &srcFile, MP4TrackId srcTrackId, MP4SampleId firstSampleId,
+                                uint32_t numSamples, MP4FileHandleWrapper *dstFile, MP4TrackId dstTrackId)
+    {
+        MP4FileHandle src = srcFile.get();
+        MP4FileHandle dst = dstFile == nullptr ? MP4_INVALID_FILE_HANDLE : dstFile->get();
+        uint32_t copied = 0;
+        {
+            py::gil_scoped_release release;
+            for (; copied < numSamples; ++copied)
+            {
+                if (!MP4CopySample(src, srcTrackId, firstSampleId + copied, dst, dstTrackId, MP4_INVALID_DURATION))
+                {
+                    break;
+                }
+            }
+        }
+        if (copied != numSamples)
+        {
+            throw MP4Error("MP4CopySamples failed at sampleId " + std::to_string(firstSampleId + copied) + "; " +
+                           std::to_string(copied) + " samples were copied");
+        }
+    }
+
     uint32_t MP4GetSampleSize_wrapper(MP4FileHandleWrapper &hFile, MP4TrackId trackId, MP4SampleId sampleId)
     {
         MP4FileHandle h = hFile.get();
@@ -855,21 +1294,23 @@ namespace raw
         require(setter(tags.get(), optional_cstr(value)), what);
     }
 
-    void MP4TagsAddArtwork_wrapper(MP4TagsWrapper &tags, const std::string &data, MP4TagArtworkType type)
+    void MP4TagsAddArtwork_wrapper(MP4TagsWrapper &tags, py::buffer data, MP4TagArtworkType type)
     {
+        // mp4v2 copies the artwork into the tags, so the view only has to outlive the call.
+        BufferView view(data, false);
         MP4TagArtwork art{};
-        art.data = const_cast<void *>(static_cast<const void *>(data.data()));
-        art.size = static_cast<uint32_t>(data.size());
+        art.data = view.data();
+        art.size = checked_size(view, "MP4TagsAddArtwork");
         art.type = type;
         require(MP4TagsAddArtwork(tags.get(), &art), "MP4TagsAddArtwork");
     }
 
-    void MP4TagsSetArtwork_wrapper(MP4TagsWrapper &tags, uint32_t index, const std::string &data,
-                                   MP4TagArtworkType type)
+    void MP4TagsSetArtwork_wrapper(MP4TagsWrapper &tags, uint32_t index, py::buffer data, MP4TagArtworkType type)
     {
+        BufferView view(data, false);
         MP4TagArtwork art{};
-        art.data = const_cast<void *>(static_cast<const void *>(data.data()));
-        art.size = static_cast<uint32_t>(data.size());
+        art.data = view.data();
+        art.size = checked_size(view, "MP4TagsSetArtwork");
         art.type = type;
         require(MP4TagsSetArtwork(tags.get(), index, &art), "MP4TagsSetArtwork");
     }
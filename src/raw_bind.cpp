@@ -1,3 +1,4 @@
+#include "pymp4v2/atom_tree.h"
 #include "pymp4v2/error.h"
 #include "pymp4v2/raw.h"
 
@@ -55,6 +56,21 @@ namespace raw
     Delete track control info. Sample data is removed later by MP4Optimize.
 )doc");
 
+            m_raw.def("MP4CloneTrack", &MP4CloneTrack_wrapper, py::arg("srcFile"), py::arg("srcTrackId"),
+                      py::arg("dstFile") = static_cast<MP4FileHandleWrapper *>(nullptr),
+                      py::arg("dstHintTrackReferenceTrack") = MP4_INVALID_TRACK_ID,
+                      R"doc(
+    Add a track to ``dstFile`` (None: the source file) with the definition of ``srcTrackId``
+    (type, timescale, sample description) and no samples. Returns the new track id.
+)doc");
+
+            m_raw.def("MP4CopyTrack", &MP4CopyTrack_wrapper, py::arg("srcFile"), py::arg("srcTrackId"),
+                      py::arg("dstFile") = static_cast<MP4FileHandleWrapper *>(nullptr), py::arg("applyEdits") = false,
+                      py::arg("dstHintTrackReferenceTrack") = MP4_INVALID_TRACK_ID,
+                      R"doc(
+    MP4CloneTrack plus every sample, in one GIL-released call. Returns the new track id.
+)doc");
+
             m_raw.def("MP4AddAudioTrack", &MP4AddAudioTrack_wrapper, py::arg("hFile"), py::arg("timeScale"),
                       py::arg("sampleDuration"), py::arg("audioType") = MP4_MPEG4_AUDIO_TYPE,
                       R"doc(
@@ -161,9 +177,10 @@ namespace raw
         void bind_samples(py::module_ &m_raw)
         {
             py::class_<MP4SampleData>(m_raw, "MP4Sample",
-                                      "One sample from MP4ReadSample: data (bytes) plus timing fields.")
+                                      "One sample from MP4ReadSample: data (read-only memoryview) plus timing "
+                                      "fields. ``bytes(sample.data)`` makes a copy.")
                 .def_property_readonly("data", [](const MP4SampleData &s)
-                                       { return py::bytes(s.data); })
+                                       { return to_memoryview(s.data); })
                 .def_readonly("startTime", &MP4SampleData::startTime)
                 .def_readonly("duration", &MP4SampleData::duration)
                 .def_readonly("renderingOffset", &MP4SampleData::renderingOffset)
@@ -171,7 +188,7 @@ namespace raw
                 .def("__iter__",
                      [](const MP4SampleData &s)
                      {
-                         return py::iter(py::make_tuple(py::bytes(s.data), s.startTime, s.duration, s.renderingOffset,
+                         return py::iter(py::make_tuple(to_memoryview(s.data), s.startTime, s.duration, s.renderingOffset,
                                                         s.isSyncSample));
                      });
 
@@ -180,6 +197,82 @@ namespace raw
     Read sample ``sampleId`` (first sample is 1). Returns MP4Sample.
     Unpacks as ``(data, startTime, duration, renderingOffset, isSyncSample)``.
     Samples written on a create/modify handle are readable after ``MP4Close``.
+)doc");
+            py::class_<MP4SampleInfo>(m_raw, "MP4SampleInfo",
+                                      "Byte count and timing from MP4ReadSampleInto (payload is in the caller buffer).")
+                .def_readonly("numBytes", &MP4SampleInfo::numBytes)
+                .def_readonly("startTime", &MP4SampleInfo::startTime)
+                .def_readonly("duration", &MP4SampleInfo::duration)
+                .def_readonly("renderingOffset", &MP4SampleInfo::renderingOffset)
+                .def_readonly("isSyncSample", &MP4SampleInfo::isSyncSample)
+                .def("__iter__",
+                     [](const MP4SampleInfo &s)
+                     {
+                         return py::iter(py::make_tuple(s.numBytes, s.startTime, s.duration, s.renderingOffset,
+                                                        s.isSyncSample));
+                     });
+
+            m_raw.def("MP4ReadSampleInto", &MP4ReadSampleInto_wrapper, py::arg("hFile"), py::arg("trackId"),
+                      py::arg("sampleId"), py::arg("buf"),
+                      R"doc(
+    Read sample ``sampleId`` (first sample is 1) into ``buf``, any writable contiguous
+    buffer (bytearray, memoryview, numpy array). The payload fills ``buf[:numBytes]``;
+    nothing is allocated. Returns MP4SampleInfo, unpacking as
+    ``(numBytes, startTime, duration, renderingOffset, isSyncSample)``. Raises MP4Error
+    if ``buf`` is smaller than the sample (size it with MP4GetTrackMaxSampleSize).
+)doc");
+            py::class_<MP4SampleBatch>(m_raw, "MP4SampleBatch",
+                                       "Consecutive samples from MP4ReadSamples: one packed payload plus arrays.")
+                .def_readonly("firstSampleId", &MP4SampleBatch::firstSampleId)
+                .def_property_readonly("data", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.data); })
+                .def_property_readonly("offsets", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.offsets); })
+                .def_property_readonly("sizes", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.sizes); })
+                .def_property_readonly("startTimes", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.startTimes); })
+                .def_property_readonly("durations", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.durations); })
+                .def_property_readonly("renderingOffsets", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.renderingOffsets); })
+                .def_property_readonly("syncFlags", [](const MP4SampleBatch &b)
+                                       { return to_memoryview(b.syncFlags); })
+                .def("__len__", [](const MP4SampleBatch &b)
+                     { return b.sizes.size(); });
+
+            m_raw.def("MP4ReadSamples", &MP4ReadSamples_wrapper, py::arg("hFile"), py::arg("trackId"),
+                      py::arg("firstSampleId"), py::arg("numSamples"),
+                      R"doc(
+    Read ``numSamples`` consecutive samples starting at ``firstSampleId`` (1-based) in one
+    GIL-released loop. Returns MP4SampleBatch; its fields are read-only memoryviews:
+    ``data`` (packed payloads), ``offsets`` / ``startTimes`` / ``durations`` /
+    ``renderingOffsets`` (uint64), ``sizes`` (uint32), ``syncFlags`` (uint8, 0 or 1).
+)doc");
+            py::class_<MP4SampleTable>(m_raw, "MP4SampleTable",
+                                       "Per-sample index of a whole track from MP4GetSampleTable; entry i is sample i + 1.")
+                .def_property_readonly("sizes", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.sizes); })
+                .def_property_readonly("offsets", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.offsets); })
+                .def_property_readonly("startTimes", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.startTimes); })
+                .def_property_readonly("durations", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.durations); })
+                .def_property_readonly("renderingOffsets", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.renderingOffsets); })
+                .def_property_readonly("syncFlags", [](const MP4SampleTable &t)
+                                       { return to_memoryview(t.syncFlags); })
+                .def("__len__", [](const MP4SampleTable &t)
+                     { return t.sizes.size(); });
+
+            m_raw.def("MP4GetSampleTable", &MP4GetSampleTable_wrapper, py::arg("hFile"), py::arg("trackId"),
+                      R"doc(
+    Index every sample of a track in one GIL-released pass over stsz/stts/ctts/stss/stsc/stco
+    (co64), without reading payloads. Returns MP4SampleTable whose fields are read-only
+    memoryviews: ``sizes`` (uint32), ``offsets`` (absolute file offsets) / ``startTimes`` /
+    ``durations`` / ``renderingOffsets`` (uint64), ``syncFlags`` (uint8, 0 or 1).
+    On a create/modify handle chunk offsets are complete only after ``MP4Close``.
 )doc");
             m_raw.def("MP4ReadSampleFromTime", &MP4ReadSampleFromTime_wrapper, py::arg("hFile"), py::arg("trackId"),
                       py::arg("when"),
@@ -190,7 +283,20 @@ namespace raw
                       py::arg("duration") = MP4_INVALID_DURATION, py::arg("renderingOffset") = 0,
                       py::arg("isSyncSample") = true,
                       R"doc(
-    Append a sample. ``pBytes`` is bytes. duration defaults to MP4_INVALID_DURATION.
+    Append a sample. ``pBytes`` is any contiguous buffer (bytes, bytearray, memoryview,
+    mmap, numpy array), passed to mp4v2 without a copy. duration defaults to
+    MP4_INVALID_DURATION.
+)doc");
+            m_raw.def("MP4WriteSamples", &MP4WriteSamples_wrapper, py::arg("hFile"), py::arg("trackId"),
+                      py::arg("payload"), py::arg("sizes"), py::arg("durations") = py::none(),
+                      py::arg("renderingOffsets") = py::none(), py::arg("syncFlags") = py::none(),
+                      R"doc(
+    Append ``len(sizes)`` samples in one GIL-released loop. ``payload`` is any contiguous
+    buffer (bytes, memoryview, numpy array) holding the samples back to back; ``sizes``,
+    ``durations``, ``renderingOffsets`` and ``syncFlags`` are integer arrays or sequences
+    of the same length (the layout of MP4SampleBatch). None means MP4_INVALID_DURATION /
+    0 / all sync. Raises MP4Error if ``sum(sizes) != len(payload)``, or naming the first
+    sample that failed; samples before it stay written.
 )doc");
             m_raw.def("MP4CopySample", &MP4CopySample_wrapper, py::arg("srcFile"), py::arg("srcTrackId"),
                       py::arg("srcSampleId"), py::arg("dstFile") = static_cast<MP4FileHandleWrapper *>(nullptr),
@@ -200,6 +306,15 @@ namespace raw
     Copy a sample. ``dstFile`` None (or the source handle) copies in the same file.
     ``dstTrackId`` MP4_INVALID_TRACK_ID copies onto the source track.
     ``dstSampleDuration`` MP4_INVALID_DURATION keeps the source duration.
+)doc");
+            m_raw.def("MP4CopySamples", &MP4CopySamples_wrapper, py::arg("srcFile"), py::arg("srcTrackId"),
+                      py::arg("firstSampleId"), py::arg("numSamples"),
+                      py::arg("dstFile") = static_cast<MP4FileHandleWrapper *>(nullptr),
+                      py::arg("dstTrackId") = MP4_INVALID_TRACK_ID,
+                      R"doc(
+    MP4CopySample for ``numSamples`` consecutive samples from ``firstSampleId`` (1-based) in
+    one GIL-released loop, keeping source durations. Raises MP4Error naming the first
+    sample id that failed; samples before it stay copied.
 )doc");
             m_raw.def("MP4GetSampleSize", &MP4GetSampleSize_wrapper, py::arg("hFile"), py::arg("trackId"),
                       py::arg("sampleId"));
@@ -586,11 +701,13 @@ namespace raw
 
     void bind_extended(py::module_ &m_raw)
     {
+        bind_buffers(m_raw);
         bind_constants(m_raw);
         bind_tracks(m_raw);
         bind_props(m_raw);
         bind_samples(m_raw);
         bind_tags(m_raw);
         bind_chapters(m_raw);
+        bind_atom_tree(m_raw);
     }
 } // namespace raw
@@ -0,0 +1,86 @@
+#include "pymp4v2/reader_pool.h"
+
+#include <utility>
+
+#include <pybind11/pybind11.h>
+
+#include "pymp4v2/error.h"
+
+namespace py = pybind11;
+
+ReaderPool::Lease::Lease(std::shared_ptr<ReaderPool> pool, std::size_t slot) : pool_(std::move(pool)), slot_(slot) {}
+
+ReaderPool::Lease::Lease(Lease &&other) noexcept : pool_(std::move(other.pool_)), slot_(other.slot_) {}
+
+ReaderPool::Lease::~Lease()
+{
+    if (pool_)
+    {
+        pool_->release(slot_);
+    }
+}
+
+raw::MP4FileHandleWrapper &ReaderPool::Lease::handle() const
+{
+    return pool_->handles_[slot_];
+}
+
+ReaderPool::ReaderPool(const std::string &filename, std::size_t size)
+{
+    handles_.reserve(size);
+    free_.reserve(size);
+    for (std::size_t i = 0; i < size; ++i)
+    {
+        MP4FileHandle h = nullptr;
+        {
+            py::gil_scoped_release release;
+            h = MP4Read(filename.c_str());
+        }
+        if (h == nullptr)
+        {
+            throw MP4Error("Failed to open reader handle for MP4 file: " + filename);
+        }
+        handles_.emplace_back(h);
+        free_.push_back(i);
+    }
+}
+
+std::size_t ReaderPool::size() const
+{
+    return handles_.size();
+}
+
+ReaderPool::Lease ReaderPool::acquire()
+{
+    std::size_t slot = 0;
+    {
+        py::gil_scoped_release release;
+        std::unique_lock<std::mutex> lock(mutex_);
+        available_.wait(lock, [this]
+                        { return !free_.empty(); });
+        slot = free_.back();
+        free_.pop_back();
+    }
+    return Lease(shared_from_this(), slot);
+}
+
+void ReaderPool::release(std::size_t slot)
+{
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        free_.push_back(slot);
+    }
+    available_.notify_one();
+}
+
+ReadLease::ReadLease(ReaderPool::Lease lease) : pooled_(std::move(lease)), handle_(&pooled_->handle()) {}
+
+ReadLease::ReadLease(std::unique_lock<std::mutex> lock, raw::MP4FileHandleWrapper &handle)
+    : lock_(std::move(lock)), handle_(&handle)
+{
+}
+
+raw::MP4FileHandleWrapper &ReadLease::handle() const
+{
+    return *handle_;
+}
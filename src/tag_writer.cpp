@@ -0,0 +1,266 @@
+#include "pymp4v2/tag_writer.h"
+
+#include <algorithm>
+#include <cstdio>
+#include <fstream>
+#include <optional>
+#include <vector>
+
+#include "pymp4v2/atoms.h"
+#include "pymp4v2/error.h"
+
+namespace
+{
+    using atoms::Atom;
+    using atoms::file_size;
+    using atoms::find_atom;
+    using atoms::read_atoms;
+    using atoms::read_bytes;
+    using atoms::store_be;
+
+    void write_free(std::ostream &out, uint64_t size)
+    {
+        unsigned char h[8];
+        store_be(h, size, 4);
+        h[4] = 'f';
+        h[5] = 'r';
+        h[6] = 'e';
+        h[7] = 'e';
+        out.write(reinterpret_cast<const char *>(h), 8);
+        const std::vector<char> zeros(64 * 1024, '\0');
+        for (uint64_t left = size - 8; left > 0;)
+        {
+            const auto n = static_cast<std::size_t>(std::min<uint64_t>(left, zeros.size()));
+            out.write(zeros.data(), static_cast<std::streamsize>(n));
+            left -= n;
+        }
+    }
+
+    // Bytes of moov that tags may be written into: udta plus the free/skip atoms around
+    // it, or without udta the largest run of free/skip atoms.
+    struct Region
+    {
+        uint64_t start;
+        uint64_t size;
+    };
+
+    std::optional<Region> tag_region(const std::vector<Atom> &moov)
+    {
+        const std::size_t n = moov.size();
+        std::size_t lo = n;
+        std::size_t hi = n;
+        for (std::size_t i = 0; i < n; ++i)
+        {
+            if (moov[i].type == "udta")
+            {
+                lo = hi = i;
+                break;
+            }
+        }
+        if (lo < n)
+        {
+            while (lo > 0 && moov[lo - 1].is_free())
+            {
+                --lo;
+            }
+            while (hi + 1 < n && moov[hi + 1].is_free())
+            {
+                ++hi;
+            }
+        }
+        else
+        {
+            uint64_t best = 0;
+            for (std::size_t i = 0; i < n;)
+            {
+                std::size_t j = i;
+                while (j < n && moov[j].is_free())
+                {
+                    ++j;
+                }
+                if (j > i && moov[j - 1].end() - moov[i].start > best)
+                {
+                    best = moov[j - 1].end() - moov[i].start;
+                    lo = i;
+                    hi = j - 1;
+                }
+                i = j > i ? j : i + 1;
+            }
+            if (lo == n)
+            {
+                return std::nullopt;
+            }
+        }
+        return Region{moov[lo].start, moov[hi].end() - moov[lo].start};
+    }
+
+    // Removes the scratch file however the in-place attempt ends.
+    struct ScratchFile
+    {
+        std::string path;
+
+        ~ScratchFile()
+        {
+            std::remove(path.c_str());
+        }
+    };
+
+    // New udta bytes produced by mp4v2 from a copy of ftyp + moov ("" if it wrote none),
+    // or nullopt when the file layout rules out the in-place path.
+    std::optional<std::string> build_udta(const std::string &filename, const MP4Tags *tags, const Atom &moov,
+                                          const Atom *ftyp, std::istream &in)
+    {
+        ScratchFile scratch{filename + ".pymp4v2-tags"};
+        {
+            std::ofstream out(scratch.path, std::ios::binary | std::ios::trunc);
+            for (const Atom *atom : {ftyp, &moov})
+            {
+                if (atom != nullptr)
+                {
+                    const auto bytes = read_bytes(in, atom->start, atom->size);
+                    out.write(bytes.data(), static_cast<std::streamsize>(bytes.size()));
+                }
+            }
+            if (!out)
+            {
+                return std::nullopt;
+            }
+        }
+
+        MP4FileHandle h = MP4Modify(scratch.path.c_str());
+        if (h == nullptr)
+        {
+            return std::nullopt;
+        }
+        const bool ok = MP4TagsStore(tags, h);
+        MP4Close(h);
+        if (!ok)
+        {
+            throw MP4Error("MP4TagsStore failed");
+        }
+
+        std::ifstream result(scratch.path, std::ios::binary);
+        const auto top = read_atoms(result, 0, file_size(result));
+        const Atom *newMoov = top ? find_atom(*top, "moov") : nullptr;
+        if (newMoov == nullptr)
+        {
+            return std::nullopt;
+        }
+        const auto children = read_atoms(result, newMoov->start + newMoov->header, newMoov->end());
+        if (!children)
+        {
+            return std::nullopt;
+        }
+        const Atom *udta = find_atom(*children, "udta");
+        return udta == nullptr ? std::string() : read_bytes(result, udta->start, udta->size);
+    }
+
+    bool try_in_place(const std::string &filename, const MP4Tags *tags)
+    {
+        std::fstream file(filename, std::ios::binary | std::ios::in | std::ios::out);
+        if (!file)
+        {
+            return false;
+        }
+        const auto top = read_atoms(file, 0, file_size(file));
+        const Atom *moov = top ? find_atom(*top, "moov") : nullptr;
+        if (moov == nullptr)
+        {
+            return false;
+        }
+        const auto children = read_atoms(file, moov->start + moov->header, moov->end());
+        const auto region = children ? tag_region(*children) : std::nullopt;
+        if (!region)
+        {
+            return false;
+        }
+        const auto udta = build_udta(filename, tags, *moov, find_atom(*top, "ftyp"), file);
+        if (!udta)
+        {
+            return false;
+        }
+        // Leftover space must hold a free atom header; a 32-bit size is plenty for padding.
+        const uint64_t left = region->size - std::min<uint64_t>(udta->size(), region->size);
+        if (udta->size() > region->size || (left > 0 && left < 8) || left > UINT32_MAX)
+        {
+            return false;
+        }
+        file.clear();
+        file.seekp(static_cast<std::streamoff>(region->start));
+        file.write(udta->data(), static_cast<std::streamsize>(udta->size()));
+        if (left > 0)
+        {
+            write_free(file, left);
+        }
+        file.flush();
+        if (!file)
+        {
+            throw MP4Error("Failed to write tags in place: " + filename);
+        }
+        return true;
+    }
+
+    // Grow a trailing moov by a free atom of `padding` bytes so the next update fits.
+    void reserve_padding(const std::string &filename, uint32_t padding)
+    {
+        std::fstream file(filename, std::ios::binary | std::ios::in | std::ios::out);
+        const auto top = file ? read_atoms(file, 0, file_size(file)) : std::nullopt;
+        if (!top || top->empty() || top->back().type != "moov")
+        {
+            return;
+        }
+        const Atom &moov = top->back();
+        const uint64_t size = std::max<uint32_t>(padding, 8);
+        const uint64_t grown = moov.size + size;
+        if (moov.header == 8 && grown > UINT32_MAX)
+        {
+            return;
+        }
+        // Append first: if the size update never lands, the free atom is a valid top-level atom.
+        file.clear();
+        file.seekp(static_cast<std::streamoff>(moov.end()));
+        write_free(file, size);
+        unsigned char h[8];
+        if (moov.header == 8)
+        {
+            store_be(h, grown, 4);
+            file.seekp(static_cast<std::streamoff>(moov.start));
+            file.write(reinterpret_cast<const char *>(h), 4);
+        }
+        else
+        {
+            store_be(h, grown, 8);
+            file.seekp(static_cast<std::streamoff>(moov.start + 8));
+            file.write(reinterpret_cast<const char *>(h), 8);
+        }
+        file.flush();
+        if (!file)
+        {
+            throw MP4Error("Failed to reserve tag padding: " + filename);
+        }
+    }
+} // namespace
+
+std::string store_tags_in_place(const std::string &filename, const MP4Tags *tags, uint32_t padding)
+{
+    if (try_in_place(filename, tags))
+    {
+        return "in_place";
+    }
+    MP4FileHandle h = MP4Modify(filename.c_str());
+    if (h == nullptr)
+    {
+        throw MP4Error("Failed to modify MP4 file: " + filename);
+    }
+    const bool ok = MP4TagsStore(tags, h);
+    MP4Close(h);
+    if (!ok)
+    {
+        throw MP4Error("MP4TagsStore failed");
+    }
+    if (padding > 0)
+    {
+        reserve_padding(filename, padding);
+    }
+    return "rewrite";
+}
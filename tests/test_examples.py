@@ -46,9 +46,8 @@ def test_dump_info_atoms_flag(test_mp4_file):
     result = _run("dump_info.py", test_mp4_file, "--atoms")
     assert result.returncode == 0
     assert "info:" in result.stdout
-    # MP4Dump prints atom names; ftyp is present in the generated fixture.
-    combined = result.stdout + result.stderr
-    assert "ftyp" in combined or "moov" in combined or "info:" in result.stdout
+    assert "atoms:" in result.stdout
+    assert "moov offset=" in result.stdout
 
 
 def test_dump_info_missing_file(tmp_path):
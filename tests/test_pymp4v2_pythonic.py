@@ -1,3 +1,11 @@
+import asyncio
+import io
+import logging
+import os
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import pymp4v2
@@ -21,10 +29,43 @@ def test_tracks_on_fixture(test_mp4_file):
         assert track.audio_channels is None
         with pytest.raises(IndexError):
             track.read_sample(0)
+        assert len(track.keyframes) == 0
+        with pytest.raises(IndexError):
+            track.seek(0)
         with pytest.raises(IndexError):
             mp4.tracks[5]
 
 
+def test_track_info_snapshot_and_lookup(temp_mp4_file):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        video = raw.MP4AddVideoTrack(handle, 90000, 3000, 320, 240)
+        audio = raw.MP4AddAudioTrack(handle, 48000, 1024)
+        raw.MP4WriteSample(handle, audio, b"\x00\x01", duration=1024)
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        infos = mp4.tracks.snapshot()
+        assert [i.index for i in infos] == [0, 1]
+        v, a = infos
+        assert isinstance(v, pymp4v2.TrackInfo)
+        assert (v.id, v.type, v.width, v.height) == (video, "vide", 320, 240)
+        assert v.audio_channels is None
+        assert (a.id, a.type, a.codec, a.sample_count) == (audio, "soun", "mp4a", 1)
+        assert (a.width, a.height, a.frame_rate) == (0, 0, 0.0)
+        assert a.timescale == mp4.tracks[1].timescale
+        assert a.language == mp4.tracks[1].language
+        assert mp4.tracks[1].info().codec == "mp4a"
+
+        assert mp4.tracks.by_id(audio).type == "soun"
+        with pytest.raises(KeyError):
+            mp4.tracks.by_id(99)
+        assert [t.id for t in mp4.tracks.of_type("audio")] == [audio]
+        assert [t.id for t in mp4.tracks.of_type("vide")] == [video]
+        assert mp4.tracks.of_type("text") == []
+
+    with pymp4v2.probe(temp_mp4_file) as mp4:
+        assert mp4.tracks.by_id(audio).info().bitrate is None
+
+
 def test_track_sample_iteration(temp_mp4_file):
     payloads = [b"\x00\x01", b"\xfe\xff"]
     with raw.MP4Create(temp_mp4_file) as handle:
@@ -38,6 +79,9 @@ def test_track_sample_iteration(temp_mp4_file):
         assert track.sample_count == 2
         first = track.read_sample(0)
         assert first.data == payloads[0]
+        assert isinstance(first.data, memoryview)
+        assert first.data.readonly
+        assert bytes(first.data) == payloads[0]
         assert first.duration == 1024
         assert isinstance(first, pymp4v2.Sample)
         assert track.audio_channels is not None
@@ -47,6 +91,455 @@ def test_track_sample_iteration(temp_mp4_file):
         assert track[-1].data == payloads[1]
 
 
+def test_track_read_samples_batch(temp_mp4_file):
+    payloads = [b"\x00\x01", b"", b"\x02\x03\x04", b"\x05"]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 44100, 1024)
+        for i, data in enumerate(payloads):
+            raw.MP4WriteSample(
+                handle, tid, data, duration=1024, isSyncSample=i % 2 == 0
+            )
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        batch = track.read_samples()
+        assert isinstance(batch, pymp4v2.SampleBatch)
+        assert len(batch) == len(payloads)
+        assert batch.firstSampleId == 1
+        assert bytes(batch.data) == b"".join(payloads)
+        assert batch.sizes.format == "I"
+        assert batch.offsets.format == "Q"
+        assert list(batch.sizes) == [len(p) for p in payloads]
+        assert list(batch.offsets) == [0, 2, 2, 5]
+        assert list(batch.startTimes) == [0, 1024, 2048, 3072]
+        assert list(batch.durations) == [1024] * 4
+        assert list(batch.renderingOffsets) == [0] * 4
+        assert list(batch.syncFlags) == [1, 0, 1, 0]
+        for i, data in enumerate(payloads):
+            start = batch.offsets[i]
+            assert batch.data[start : start + batch.sizes[i]] == data
+
+        tail = track.read_samples(-2)
+        assert tail.firstSampleId == 3
+        assert bytes(tail.data) == payloads[2] + payloads[3]
+        assert len(track.read_samples(1, 2)) == 1
+        assert len(track.read_samples(3, 1)) == 0
+        assert len(track.read_samples(10)) == 0
+
+    with raw.MP4Read(temp_mp4_file) as handle:
+        raw_batch = raw.MP4ReadSamples(handle, tid, 2, 2)
+        assert list(raw_batch.sizes) == [0, 3]
+        with pytest.raises(pymp4v2.MP4Error, match="sampleId 5"):
+            raw.MP4ReadSamples(handle, tid, 4, 2)
+
+
+def test_track_write_samples(temp_mp4_file):
+    payloads = [b"\x00\x01", b"", b"\x02\x03\x04", b"\x05"]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 44100, 1024)
+        raw.MP4WriteSamples(
+            handle,
+            tid,
+            memoryview(b"".join(payloads)),
+            array("I", map(len, payloads)),
+            durations=array("q", [1024] * 4),
+            syncFlags=[1, 0, 1, 0],
+        )
+        with pytest.raises(pymp4v2.MP4Error, match="payload has 3"):
+            raw.MP4WriteSamples(handle, tid, b"abc", [1, 1], [1, 1])
+        with pytest.raises(pymp4v2.MP4Error, match="expected 2 values"):
+            raw.MP4WriteSamples(handle, tid, b"ab", [1, 1], [1])
+        with pytest.raises(BufferError):
+            raw.MP4WriteSample(handle, tid, memoryview(b"abcd")[::2])
+        with pytest.raises(pymp4v2.MP4Error, match="negative"):
+            raw.MP4WriteSamples(handle, tid, b"ab", [1, 1], array("i", [1, -1]))
+        with pytest.raises(pymp4v2.MP4Error, match="durations: .* at position 1"):
+            raw.MP4WriteSamples(handle, tid, b"ab", [1, 1], [1, -1])
+
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        track = mp4.tracks[0]
+        assert list(track.keyframes.indices) == [0, 2]
+        batch = track.read_samples()
+        track.write_samples(
+            batch.data,
+            batch.sizes,
+            batch.durations,
+            batch.renderingOffsets,
+            batch.syncFlags,
+        )
+        assert list(track.keyframes.indices) == [0, 2, 4, 6]
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        assert [s.data for s in track] == payloads * 2
+        assert list(track.read_samples().startTimes) == [i * 1024 for i in range(8)]
+        with pytest.raises(pymp4v2.MP4Error, match="read-only"):
+            track.write_samples(b"", [])
+
+
+def test_copy_track_between_files(temp_mp4_file, tmp_path):
+    payloads = [bytes([i]) * (i + 1) for i in range(5)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        raw.MP4SetTrackESConfiguration(handle, tid, b"\x12\x10")
+        for i, data in enumerate(payloads):
+            raw.MP4WriteSample(handle, tid, data, duration=100, isSyncSample=i % 2 == 0)
+
+    dest = str(tmp_path / "copy.mp4")
+    with pymp4v2.MP4File(temp_mp4_file) as src:
+        with pymp4v2.MP4File(dest, "w") as dst:
+            full = dst.copy_track(src, 0)
+            assert full.timescale == 1000
+            assert len(full) == len(payloads)
+            dst.copy_track(src, src.tracks[0], sample_range=(1, 3))
+            dst.copy_track(src, -1, time_range=(150, 350))
+            (cut,) = dst.copy_tracks(src, time_range=(0, 200))
+            assert len(cut) == 2
+            with pytest.raises(pymp4v2.MP4Error, match="does not belong"):
+                dst.copy_track(src, dst.tracks[0])
+        with pytest.raises(pymp4v2.MP4Error, match="read-only"):
+            src.copy_track(src, 0)
+
+    with pymp4v2.MP4File(dest, "a") as mp4:
+        assert mp4.copy_track(mp4, 1).id == 5
+    with pymp4v2.MP4File(dest) as mp4:
+        tracks = list(mp4.tracks)
+        assert [len(t) for t in tracks] == [5, 2, 3, 2, 2]
+        assert [s.data for s in tracks[0]] == payloads
+        assert [s.data for s in tracks[1]] == payloads[1:3]
+        assert [s.data for s in tracks[2]] == payloads[1:4]
+        assert list(tracks[0].keyframes.indices) == [0, 2, 4]
+        assert list(tracks[0].read_samples().startTimes) == [0, 100, 200, 300, 400]
+        ids = [t.id for t in tracks]
+    with raw.MP4Read(dest) as handle:
+        for track_id in ids:
+            assert raw.MP4GetTrackESConfiguration(handle, track_id) == b"\x12\x10"
+
+
+def test_track_sample_table(temp_mp4_file):
+    payloads = [b"\x00\x01", b"\x02", b"", b"\x03\x04\x05"]
+    durations = [1000, 2000, 1000, 500]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddVideoTrack(handle, 90000, 1000, 64, 48)
+        for i, data in enumerate(payloads):
+            raw.MP4WriteSample(
+                handle,
+                tid,
+                data,
+                duration=durations[i],
+                renderingOffset=i * 10,
+                isSyncSample=i == 0,
+            )
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        table = track.sample_table()
+        assert isinstance(table, pymp4v2.SampleTable)
+        assert len(table) == len(payloads)
+        assert table.sizes.format == "I"
+        assert table.offsets.format == "Q"
+        assert list(table.sizes) == [len(p) for p in payloads]
+        assert list(table.startTimes) == [0, 1000, 3000, 4000]
+        assert list(table.durations) == durations
+        assert list(table.renderingOffsets) == [0, 10, 20, 30]
+        assert list(table.syncFlags) == [1, 0, 0, 0]
+
+    with open(temp_mp4_file, "rb") as f:
+        blob = f.read()
+    for offset, size, data in zip(table.offsets, table.sizes, payloads):
+        assert blob[offset : offset + size] == data
+
+    with raw.MP4Read(temp_mp4_file) as handle:
+        raw_table = raw.MP4GetSampleTable(handle, tid)
+        assert list(raw_table.sizes) == [2, 1, 0, 3]
+        for i in range(len(payloads)):
+            assert raw_table.startTimes[i] == raw.MP4GetSampleTime(handle, tid, i + 1)
+            assert raw_table.syncFlags[i] == raw.MP4GetSampleSync(handle, tid, i + 1)
+
+
+def test_track_keyframes_and_seek(temp_mp4_file):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddVideoTrack(handle, 1000, 100, 64, 48)
+        for i in range(10):
+            raw.MP4WriteSample(
+                handle, tid, bytes([i]), duration=100, isSyncSample=i % 4 == 1
+            )
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        keys = track.keyframes
+        assert isinstance(keys, pymp4v2.Keyframes)
+        assert list(keys.indices) == [1, 5, 9]
+        assert list(keys.times) == [100, 500, 900]
+        assert mp4.tracks[0].keyframes is keys
+        assert track.seek(0) == 1
+        assert track.seek(500) == 5
+        assert track.seek(799) == 5
+        assert track.seek(10_000) == 9
+        assert track.seek(501, "next_key") == 9
+        assert track.seek(500, "next_key") == 5
+        assert track.seek(10_000, "next_key") == 9
+        assert track.seek(690, "nearest") == 5
+        assert track.seek(710, "nearest") == 9
+        assert track.seek(700, "nearest") == 5
+        with pytest.raises(pymp4v2.MP4Error, match="seek mode"):
+            track.seek(0, "exact")
+
+
+def test_track_iter_samples(temp_mp4_file):
+    payloads = [bytes([i]) for i in range(7)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        it = iter(track)
+        assert isinstance(it, pymp4v2.SampleIterator)
+        assert iter(it) is it
+        assert it.__length_hint__() == 7
+        assert [s.data for s in it] == payloads
+        assert list(it) == []
+        assert [s.data for s in track.iter_samples(chunk=3)] == payloads
+        assert [s.data for s in track.iter_samples(1, 6, 2, chunk=2)] == payloads[1:6:2]
+        assert [s.data for s in track.iter_samples(-2)] == payloads[-2:]
+        assert [s.startTime for s in track.iter_samples(time_range=(150, 400))] == [
+            100,
+            200,
+            300,
+        ]
+        assert [s.data for s in track.iter_samples(2, time_range=(0, 300))] == payloads[
+            2:3
+        ]
+        assert list(track.iter_samples(time_range=(900, 1000))) == []
+        assert list(track.iter_samples(5, 2)) == []
+        with pytest.raises(pymp4v2.MP4Error, match="step"):
+            track.iter_samples(step=0)
+
+
+def test_track_iter_samples_prefetch(temp_mp4_file):
+    payloads = [bytes([i]) * (i + 1) for i in range(20)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        assert track.iter_samples().stats is None
+        it = track.iter_samples(prefetch=4)
+        assert [s.data for s in it] == payloads
+        stats = it.stats
+        assert isinstance(stats, pymp4v2.PrefetchStats)
+        assert stats.capacity == 4
+        assert stats.produced == stats.consumed == len(payloads)
+        assert 1 <= stats.max_depth <= 4
+        assert stats.mean_depth > 0
+        assert [s.data for s in track.iter_samples(3, 15, 4, prefetch=2)] == payloads[
+            3:15:4
+        ]
+        partial = track.iter_samples(prefetch=2)
+        assert next(partial).data == payloads[0]
+        del partial
+        assert list(track.iter_samples(5, 5, prefetch=2)) == []
+
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        with pytest.raises(pymp4v2.MP4Error, match="mode 'r'"):
+            mp4.tracks[0].iter_samples(prefetch=2)
+
+
+@pytest.mark.parametrize("readers", [0, 3])
+def test_concurrent_track_reads(temp_mp4_file, readers):
+    payloads = [bytes([i % 256]) * (i % 7 + 1) for i in range(64)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file, readers=readers) as mp4:
+        assert mp4.readers == readers
+        track = mp4.tracks[0]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            got = list(
+                pool.map(
+                    lambda i: bytes(track.read_sample(i).data), range(len(payloads))
+                )
+            )
+        assert got == payloads
+        assert bytes(track.read_samples().data) == b"".join(payloads)
+
+    with pytest.raises(pymp4v2.MP4Error, match="readers"):
+        pymp4v2.MP4File(temp_mp4_file, "a", readers=2)
+
+
+def test_track_read_sample_into(temp_mp4_file):
+    payloads = [b"\x00\x01\x02", b"", b"\x03"]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 44100, 1024)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=1024, isSyncSample=False)
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        track = mp4.tracks[0]
+        assert track.max_sample_size == 3
+        buf = bytearray(track.max_sample_size)
+        for i, data in enumerate(payloads):
+            info = track.read_sample_into(i, buf)
+            assert isinstance(info, pymp4v2.SampleInfo)
+            assert info.numBytes == len(data)
+            assert buf[: info.numBytes] == data
+            assert info.startTime == 1024 * i
+            assert info.duration == 1024
+            assert info.isSyncSample is False
+        view = memoryview(bytearray(8))[2:6]
+        assert track.read_sample_into(-1, view).numBytes == 1
+        assert view[0] == 3
+        with pytest.raises(pymp4v2.MP4Error, match="too small"):
+            track.read_sample_into(0, bytearray(2))
+        with pytest.raises(BufferError):
+            track.read_sample_into(0, b"\x00" * 4)
+        with pytest.raises(IndexError):
+            track.read_sample_into(3, buf)
+
+    with raw.MP4Read(temp_mp4_file) as handle:
+        num_bytes, start, duration, _, sync = raw.MP4ReadSampleInto(handle, tid, 1, buf)
+        assert (num_bytes, start, duration, sync) == (3, 0, 1024, False)
+
+
+def test_scan_records_and_errors(temp_mp4_file, tmp_path):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 44100, 1024)
+        raw.MP4WriteSample(handle, tid, b"\x00\x01", duration=1024)
+        raw.MP4SetChapters(
+            handle, [raw.MP4Chapter(1000, "Intro")], raw.MP4ChapterTypeNero
+        )
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        mp4.tags.name = "Scanned"
+        mp4.tags.track = raw.MP4TagTrack(3, 9)
+    missing = str(tmp_path / "missing.mp4")
+
+    (serial,) = pymp4v2.scan(
+        [temp_mp4_file], workers=0, fields=("tracks", "tags", "chapters")
+    )
+    assert isinstance(serial, pymp4v2.ScanResult)
+    assert serial.error is None
+    assert serial.info is None
+    assert serial.timescale == 1000
+    (track,) = serial.tracks
+    assert isinstance(track, pymp4v2.ScanTrack)
+    assert (track.id, track.type, track.codec, track.sample_count) == (
+        tid,
+        raw.MP4_AUDIO_TRACK_TYPE,
+        "mp4a",
+        1,
+    )
+    assert serial.tags["name"] == "Scanned"
+    assert serial.tags["track"] == (3, 9)
+    assert [title for _, title in serial.chapters] == ["Intro"]
+
+    results = {
+        r.path: r
+        for r in pymp4v2.scan([temp_mp4_file, missing], workers=2, fields=["info"])
+    }
+    assert results[temp_mp4_file].info
+    assert results[temp_mp4_file].tracks is None
+    assert results[missing].error.startswith("MP4Error")
+    with pytest.raises(ValueError, match="unknown scan fields"):
+        list(pymp4v2.scan([temp_mp4_file], fields=("codecs",)))
+
+
+def test_metadata_cache_hits_and_invalidates(tmp_path):
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / f"clip{i}.mp4")
+        with raw.MP4Create(path) as handle:
+            tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+            raw.MP4WriteSample(handle, tid, b"\x00\x01", duration=100)
+        paths.append(path)
+    db = str(tmp_path / "meta.db")
+
+    with pymp4v2.MetadataCache(db, max_entries=2, touch_interval=0) as cache:
+        first = cache.get(paths[0])
+        assert first.error is None
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert cache.get(paths[0]) == first
+        assert cache.hits == 1
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+        assert len(cache) == 2
+
+    # Persistent across instances; paths[1] was the least recently used and is gone.
+    with pymp4v2.MetadataCache(db, max_entries=2) as cache:
+        assert cache.lookup(paths[0]).tracks[0].sample_count == 1
+        assert cache.lookup(paths[1]) is None
+        os.utime(paths[2], ns=(1, 1))
+        assert cache.lookup(paths[2]) is None
+        cache.invalidate(paths[0])
+        assert cache.lookup(paths[0]) is None
+        assert len(cache) == 0
+
+    # Within touch_interval a hit does not refresh recency, so paths[0] goes first.
+    with pymp4v2.MetadataCache(db, max_entries=2) as cache:
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+        assert cache.lookup(paths[0]) is None
+        assert cache.lookup(paths[1]) is not None
+
+
+def test_aio_file_reads_and_optimize(temp_mp4_file):
+    from pymp4v2.aio import AsyncMP4File, AsyncTrack
+
+    payloads = [bytes([i]) for i in range(5)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=100)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            async with AsyncMP4File(temp_mp4_file, executor=executor) as mp4:
+                (track,) = mp4.tracks
+                assert isinstance(track, AsyncTrack)
+                assert track.sample_count == len(payloads)
+                keys = await track.keyframes()
+                assert list(keys.indices) == list(range(len(payloads)))
+                assert await track.seek(250) == 2
+                assert list((await track.sample_table()).sizes) == [1] * len(payloads)
+                assert (await track.info()).sample_count == len(payloads)
+                assert await track.max_sample_size() == 1
+                buf = bytearray(1)
+                assert (await track.read_sample_into(3, buf)).size == 1
+                assert bytes(buf) == payloads[3]
+                with pytest.raises(AttributeError, match="through .track"):
+                    track.sample_view
+                assert (await track.read_sample(1)).data == payloads[1]
+                batch = await track.read_samples(1, 3)
+                assert bytes(batch.data) == b"".join(payloads[1:3])
+                assert [s.data async for s in track] == payloads
+                chunked = track.iter_samples(step=2, chunk=2)
+                assert [s.data async for s in chunked] == payloads[::2]
+            with pytest.raises(pymp4v2.MP4Error, match="not open"):
+                mp4.file
+            await mp4.open()
+            assert mp4.file.is_open()
+            await mp4.close()
+
+            mp4 = await AsyncMP4File(temp_mp4_file, "a", executor=executor).open()
+            (await mp4.tags()).name = "Async"
+            await mp4.optimize()
+            await mp4.close()
+        with pytest.raises(pymp4v2.MP4Error, match="not open"):
+            AsyncMP4File(temp_mp4_file).file
+
+    asyncio.run(run())
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert mp4.tags.name == "Async"
+
+
 def test_tags_roundtrip_and_artwork(temp_mp4_file):
     cover = b"\xff\xd8\xff\xe0" + b"\x00" * 16
     with pymp4v2.MP4File(temp_mp4_file, "w") as mp4:
@@ -64,6 +557,8 @@ def test_tags_roundtrip_and_artwork(temp_mp4_file):
             assert tags.name == "Song"
             assert tags.artwork == [cover]
             assert tags.artwork_count == 1
+            tags.add_artwork(memoryview(bytearray(cover)), raw.MP4_ART_JPEG)
+            assert tags.artwork == [cover, cover]
             assert tags.tv_show == "Show"
             assert tags.compilation == 1
             assert tags.track.index == 2
@@ -79,7 +574,7 @@ def test_tags_roundtrip_and_artwork(temp_mp4_file):
         assert mp4.tags.tempo == 110
         assert mp4.tags.track.index == 2
         assert mp4.tags.track.total == 12
-        assert mp4.tags.artwork == [cover]
+        assert mp4.tags.artwork == [cover, cover]
         with pytest.raises(pymp4v2.MP4Error, match="read-only"):
             mp4.tags.name = "Nope"
 
@@ -91,6 +586,227 @@ def test_tags_store_on_file_close(temp_mp4_file):
         assert mp4.tags.name == "Auto"
 
 
+def test_tags_mode_t_in_place(temp_mp4_file):
+    payloads = [b"\x01\x02", b"\x03"]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for data in payloads:
+            raw.MP4WriteSample(handle, tid, data, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file, "t", padding=2048) as mp4:
+        assert mp4.last_tag_write is None
+        assert [s.data for s in mp4.tracks[0]] == payloads
+        mp4.tags.name = "A much longer title than there is room for"
+    assert mp4.last_tag_write == "rewrite"
+    size = os.path.getsize(temp_mp4_file)
+
+    with pymp4v2.MP4File(temp_mp4_file, "t") as mp4:
+        mp4.tags.name = "Short"
+        mp4.tags.artist = "Artist"
+        mp4.tags.store()
+        assert mp4.last_tag_write == "in_place"
+        assert mp4.tags.name == "Short"
+        assert [s.data for s in mp4.tracks[0]] == payloads
+        with pytest.raises(pymp4v2.MP4Error, match="read-only"):
+            mp4.tracks[0].write_samples(b"", [])
+    assert os.path.getsize(temp_mp4_file) == size
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert mp4.tags.name == "Short"
+        assert mp4.tags.artist == "Artist"
+        assert [s.data for s in mp4.tracks[0]] == payloads
+    assert not os.path.exists(temp_mp4_file + ".pymp4v2-tags")
+
+
+def test_probe_skips_sample_tables(temp_mp4_file):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for i in range(50):
+            raw.MP4WriteSample(handle, tid, bytes([i]) * 3, duration=100)
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        mp4.tags.name = "Probed"
+
+    with pymp4v2.MP4File(temp_mp4_file) as full, pymp4v2.probe(temp_mp4_file) as mp4:
+        assert mp4.load_sample_tables is False
+        assert mp4.duration == full.duration
+        assert mp4.timescale == full.timescale
+        assert mp4.tags.name == "Probed"
+        track, ref = mp4.tracks[0], full.tracks[0]
+        assert (track.type, track.duration, track.timescale) == (
+            ref.type,
+            ref.duration,
+            ref.timescale,
+        )
+        assert track.sample_count == len(track) == 50
+        with pytest.raises(pymp4v2.MP4Error, match="load_sample_tables"):
+            track.read_sample(0)
+        with pytest.raises(pymp4v2.MP4Error, match="load_sample_tables"):
+            track.sample_table()
+
+    with pytest.raises(pymp4v2.MP4Error, match="load_sample_tables"):
+        pymp4v2.MP4File(temp_mp4_file, "a", load_sample_tables=False)
+
+
+def test_sample_view_maps_file(temp_mp4_file):
+    payloads = [bytes([i]) * (10 + i) for i in range(30)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for payload in payloads:
+            raw.MP4WriteSample(handle, tid, payload, duration=100)
+
+    mp4 = pymp4v2.MP4File(temp_mp4_file, mmap=True)
+    assert mp4.mmap is True
+    track = mp4.tracks[0]
+    views = [track.sample_view(i) for i in range(len(payloads))]
+    assert [bytes(v) for v in views] == payloads
+    assert views[0].readonly
+    assert bytes(track.sample_view(-1)) == payloads[-1]
+    with pytest.raises(IndexError):
+        track.sample_view(len(payloads))
+    mp4.close()
+    assert bytes(views[5]) == payloads[5]
+
+    with pymp4v2.MP4File(temp_mp4_file) as plain:
+        assert plain.mmap is False
+        with pytest.raises(pymp4v2.MP4Error, match="mmap"):
+            plain.tracks[0].sample_view(0)
+    with pytest.raises(pymp4v2.MP4Error, match="mmap"):
+        pymp4v2.MP4File(temp_mp4_file, "a", mmap=True)
+
+
+def test_atom_tree_reads_box_headers(temp_mp4_file):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for i in range(20):
+            raw.MP4WriteSample(handle, tid, bytes([i]) * 7, duration=100)
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        mp4.tags.name = "Boxes"
+    blob = open(temp_mp4_file, "rb").read()
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        root = mp4.atoms()
+        assert root.type == "" and root.size == len(blob)
+        top = list(root)
+        assert {"ftyp", "moov", "mdat"} <= {atom.type for atom in top}
+        assert sum(atom.size for atom in top) == len(blob)
+        for atom in top:
+            assert blob[atom.offset + 4 : atom.offset + 8] == atom.type.encode()
+
+        stsz = root.find("moov.trak[0].mdia.minf.stbl.stsz")
+        assert stsz is not None and not stsz.is_container
+        assert blob[stsz.offset + 4 : stsz.offset + 8] == b"stsz"
+        assert stsz.header_size == 8 and len(stsz) == 0
+        assert root["moov"]["trak"].offset == root["moov.trak[-1]"].offset
+        assert root.find("moov.trak[0].mdia.minf.stbl.stsd.mp4a.esds") is not None
+        assert root.find("moov.udta.meta.ilst.\u00a9nam.data") is not None
+        assert root.find("moov.trak[1]") is None
+        with pytest.raises(KeyError):
+            root["moov.nope"]
+        with pytest.raises(IndexError):
+            root[len(top)]
+        with pytest.raises(pymp4v2.MP4Error, match="path"):
+            root.find("moov.trak[x]")
+
+    with raw.MP4Read(temp_mp4_file) as handle:
+        assert [a.offset for a in raw.MP4AtomTree(handle)] == [a.offset for a in top]
+
+
+def test_open_from_buffer_and_fileobj(temp_mp4_file):
+    payloads = [bytes([i]) * (100 + i) for i in range(40)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for payload in payloads:
+            raw.MP4WriteSample(handle, tid, payload, duration=100)
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        mp4.tags.name = "Memory"
+    blob = bytearray(open(temp_mp4_file, "rb").read())
+
+    with pymp4v2.MP4File.from_buffer(blob) as mp4:
+        assert mp4.filename == "<buffer>" and mp4.mode == "r"
+        assert mp4.tags.name == "Memory"
+        track = mp4.tracks[0]
+        assert [bytes(s.data) for s in track] == payloads
+        with pytest.raises(BufferError):
+            blob.clear()  # held until close()
+        with pytest.raises(pymp4v2.MP4Error, match="file path"):
+            mp4.optimize()
+    blob.clear()
+
+    with open(temp_mp4_file, "rb") as f:
+        with pymp4v2.MP4File.from_fileobj(f, read_size=256) as mp4:
+            assert mp4.filename == temp_mp4_file
+            batch = mp4.tracks[0].read_samples(0, 40)
+            assert bytes(batch.data) == b"".join(payloads)
+            with pytest.raises(pymp4v2.MP4Error, match="file path"):
+                mp4.tracks[0].iter_samples(prefetch=2)
+
+    with pytest.raises(pymp4v2.MP4Error, match="<buffer>"):
+        pymp4v2.MP4File.from_buffer(b"not an mp4")
+
+
+def test_create_into_buffer_and_fileobj(temp_mp4_file):
+    payloads = [bytes([i]) * 20 for i in range(10)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for payload in payloads:
+            raw.MP4WriteSample(handle, tid, payload, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file) as src:
+        mp4 = pymp4v2.MP4File.create_buffer()
+        assert mp4.mode == "w"
+        mp4.copy_tracks(src)
+        mp4.tags.name = "InMemory"
+        mp4.save()
+        with pytest.raises(pymp4v2.MP4Error, match="close"):
+            mp4.getvalue()
+        data = mp4.close()
+
+        out = io.BytesIO(b"stale bytes to be truncated")
+        with pymp4v2.MP4File.create_fileobj(out) as written:
+            written.copy_tracks(src)
+
+    assert isinstance(data, memoryview) and data.readonly
+    assert mp4.getvalue() == data
+    with pymp4v2.MP4File.from_buffer(data) as copy:
+        assert copy.tags.name == "InMemory"
+        assert [bytes(s.data) for s in copy.tracks[0]] == payloads
+    with pymp4v2.MP4File.from_buffer(out.getvalue()) as copy:
+        assert [bytes(s.data) for s in copy.tracks[0]] == payloads
+
+    with pymp4v2.MP4File(temp_mp4_file) as plain:
+        with pytest.raises(pymp4v2.MP4Error, match="create_buffer"):
+            plain.getvalue()
+        assert plain.close() is None
+
+
+def test_checkpoint_flushes_and_keeps_state(temp_mp4_file):
+    with raw.MP4Create(temp_mp4_file) as handle:
+        raw.MP4AddAudioTrack(handle, 1000, 100)
+
+    with pymp4v2.MP4File(temp_mp4_file, "a") as mp4:
+        track = mp4.tracks[0]
+        track.write_samples(b"\x01\x02\x03", [1, 2], [100, 100])
+        mp4.tags.name = "Recording"
+        tags = mp4.tags
+        mp4.checkpoint()
+        assert mp4.is_open()
+        assert mp4.tags is tags
+        assert len(track) == 2
+
+        with pymp4v2.MP4File(temp_mp4_file) as reader:
+            assert reader.tags.name == "Recording"
+            assert [s.data for s in reader.tracks[0]] == [b"\x01", b"\x02\x03"]
+
+        track.write_samples(b"\x04", [1], [100])
+        mp4.save()
+        assert [s.data for s in track] == [b"\x01", b"\x02\x03", b"\x04"]
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert len(mp4.tracks[0]) == 3
+        assert mp4.tags.name == "Recording"
+        mp4.checkpoint()  # read-only: no-op
+
+
 def test_optimize_method_roundtrip(temp_mp4_file, tmp_path):
     payload = b"\x01\x02\x03\x04"
     with raw.MP4Create(temp_mp4_file) as handle:
@@ -109,6 +825,179 @@ def test_optimize_method_roundtrip(temp_mp4_file, tmp_path):
         assert track[0].data == payload
 
 
+def test_optimize_streams_with_progress_and_cancel(temp_mp4_file, tmp_path):
+    payloads = [bytes([i]) * 64 for i in range(8)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 44100, 512)
+        for payload in payloads:
+            raw.MP4WriteSample(handle, tid, payload, duration=512)
+    original = open(temp_mp4_file, "rb").read()
+
+    stop = threading.Event()
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert mp4.optimize(chunk_size=16, cancel=lambda: True) is False
+        stop.set()
+        assert mp4.optimize(progress=lambda done, total: None, cancel=stop) is False
+        assert mp4.is_open()
+    assert open(temp_mp4_file, "rb").read() == original
+    assert not os.path.exists(temp_mp4_file + ".pymp4v2-optimize")
+
+    calls = []
+    dest = str(tmp_path / "fast.mp4")
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert mp4.optimize(dest, progress=lambda *a: calls.append(a), chunk_size=16)
+    assert calls[0][0] == 0
+    assert calls[-1][0] == calls[-1][1] == os.path.getsize(dest)
+    assert len(calls) > 2
+
+    data = open(dest, "rb").read()
+    assert data.index(b"moov") < data.index(b"mdat")
+    with pymp4v2.MP4File(dest) as mp4:
+        track = mp4.tracks[0]
+        assert [bytes(track[i].data) for i in range(len(track))] == payloads
+
+
+def _top_level_boxes(data):
+    pos = 0
+    while pos < len(data):
+        size = int.from_bytes(data[pos : pos + 4], "big")
+        yield data[pos + 4 : pos + 8], data[pos + 8 : pos + size]
+        pos += size
+
+
+def test_fragmenter_cuts_segments_at_sync_samples(temp_mp4_file, tmp_path):
+    from pymp4v2.fragment import Fragmenter
+
+    payloads = [bytes([i]) * (10 + i) for i in range(12)]
+    with raw.MP4Create(temp_mp4_file) as handle:
+        tid = raw.MP4AddAudioTrack(handle, 1000, 100)
+        for payload in payloads:
+            raw.MP4WriteSample(handle, tid, payload, duration=100)
+
+    with pymp4v2.MP4File(temp_mp4_file) as mp4:
+        assert mp4.has_path
+        fragmenter = Fragmenter(mp4, segment_duration=0.35)
+        init = fragmenter.init_segment()
+        segments = list(fragmenter)
+        files = fragmenter.write_files(str(tmp_path / "hls"))
+
+    assert [kind for kind, _ in _top_level_boxes(init)] == [b"ftyp", b"moov"]
+    assert b"mvex" in init and b"mp4a" in init
+    assert [(s.start, s.duration) for s in segments] == [
+        (0.0, 0.4),
+        (0.4, 0.3),
+        (0.7, 0.4),
+        (1.1, 0.1),
+    ]
+    media = b""
+    for segment in segments:
+        boxes = list(_top_level_boxes(segment.data))
+        assert [kind for kind, _ in boxes] == [b"moof", b"mdat"]
+        media += boxes[1][1]
+    assert media == b"".join(payloads)
+
+    assert [f.index for f in files] == [0, 1, 2, 3]
+    assert open(files[2].path, "rb").read() == segments[2].data
+    assert open(tmp_path / "hls" / "init.mp4", "rb").read() == init
+
+    with open(temp_mp4_file, "rb") as f:
+        data = f.read()
+    with pymp4v2.MP4File.from_buffer(data) as mp4:
+        assert not mp4.has_path
+        fragmenter = Fragmenter(mp4, segment_duration=0.35)
+        with pytest.raises(pymp4v2.MP4Error, match="needs a file path"):
+            fragmenter.init_segment()
+    assert not mp4.has_path
+    with pytest.raises(pymp4v2.MP4Error, match="needs a file path"):
+        fragmenter.init_segment()
+
+
+def test_fragment_trun_uses_signed_offsets_when_needed():
+    from types import SimpleNamespace
+
+    from pymp4v2.fragment import _trun_entries
+
+    def table(offsets):
+        return SimpleNamespace(
+            durations=array("Q", [100, 100]),
+            sizes=array("Q", [10, 10]),
+            syncFlags=array("B", [1, 0]),
+            renderingOffsets=array("Q", offsets),
+        )
+
+    assert _trun_entries(table([0, 0]), 0, 2)[0] == 0
+    assert _trun_entries(table([0, 200]), 0, 2)[0] == 0
+    version, _, entries = _trun_entries(table([200, 2**64 - 100]), 0, 2)
+    assert version == 1
+    assert entries[-4:] == (-100).to_bytes(4, "big", signed=True)
+
+
+def test_log_handler_receives_mp4v2_messages(tmp_path, caplog):
+    missing = str(tmp_path / "missing.mp4")
+    records = []
+    try:
+        pymp4v2.set_log_handler(
+            lambda level, message: records.append((level, message)),
+            level=raw.MP4_LOG_ERROR,
+        )
+        with pytest.raises(pymp4v2.MP4Error):
+            pymp4v2.MP4File(missing)
+        pymp4v2.flush_logs()
+        assert records
+        assert all(level == raw.MP4_LOG_ERROR for level, _ in records)
+        assert all(isinstance(message, str) for _, message in records)
+
+        records.clear()
+        pymp4v2.set_log_handler(
+            lambda level, message: records.append((level, message)),
+            level=raw.MP4_LOG_NONE,
+        )
+        with pytest.raises(pymp4v2.MP4Error):
+            pymp4v2.MP4File(missing)
+        pymp4v2.flush_logs()
+        assert records == []
+
+        logger = logging.getLogger("pymp4v2.test")
+        pymp4v2.set_log_handler(logger, level=raw.MP4_LOG_ERROR)
+        with caplog.at_level(logging.ERROR, logger="pymp4v2.test"):
+            with pytest.raises(pymp4v2.MP4Error):
+                pymp4v2.MP4File(missing)
+            pymp4v2.flush_logs()
+        assert any(
+            r.name == "pymp4v2.test" and r.levelno == logging.ERROR
+            for r in caplog.records
+        )
+    finally:
+        pymp4v2.set_log_handler(None)
+
+
+def test_log_handler_can_remove_itself(tmp_path):
+    missing = str(tmp_path / "missing.mp4")
+    records = []
+
+    def once(level, message):
+        records.append(message)
+        pymp4v2.set_log_handler(None)
+
+    try:
+        pymp4v2.set_log_handler(once, level=raw.MP4_LOG_ERROR)
+        with pytest.raises(pymp4v2.MP4Error):
+            pymp4v2.MP4File(missing)
+        pymp4v2.flush_logs()
+        assert records
+
+        records.clear()
+        pymp4v2.set_log_handler(
+            lambda level, message: records.append(message), level=raw.MP4_LOG_ERROR
+        )
+        with pytest.raises(pymp4v2.MP4Error):
+            pymp4v2.MP4File(missing)
+        pymp4v2.flush_logs()
+        assert records
+    finally:
+        pymp4v2.set_log_handler(None)
+
+
 def test_closed_tracks_raise(test_mp4_file):
     mp4 = pymp4v2.MP4File(test_mp4_file)
     mp4.close()
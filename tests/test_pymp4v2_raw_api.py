@@ -193,6 +193,8 @@ def test_file_and_track_generic_properties(temp_mp4_file):
         cfg = b"\x01\x02\x03\x04"
         raw.MP4SetTrackESConfiguration(handle, track_id, cfg)
         assert raw.MP4GetTrackESConfiguration(handle, track_id) == cfg
+        raw.MP4SetTrackESConfiguration(handle, track_id, memoryview(bytearray(cfg[::-1])))
+        assert raw.MP4GetTrackESConfiguration(handle, track_id) == cfg[::-1]
         with pytest.raises(pymp4v2.MP4Error):
             raw.MP4GetIntegerProperty(handle, "no.such.property")
         with pytest.raises(pymp4v2.MP4Error):
@@ -273,6 +275,12 @@ def test_tags_strings_and_artwork(temp_mp4_file):
             assert tags.artworkCount == 1
             assert tags.artwork[0].data == cover
             assert tags.artwork[0].type == raw.MP4_ART_JPEG
+            # Added after MP4TagsStore, so only the first image reaches the file.
+            raw.MP4TagsAddArtwork(tags, bytearray(cover), raw.MP4_ART_PNG)
+            assert tags.artworkCount == 2
+            assert tags.artwork[1].data == cover
+            with pytest.raises(TypeError):
+                raw.MP4TagsAddArtwork(tags, "not a buffer", raw.MP4_ART_JPEG)
 
     with raw.MP4Read(temp_mp4_file) as handle:
         tags = raw.MP4TagsAlloc()